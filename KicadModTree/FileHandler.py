@@ -15,6 +15,16 @@
 
 import sys
 import io
+import os
+
+from KicadModTree.util.kicad_util import textWriter
+
+
+# environment variable which sets the timestamp mode of all file handlers, see FileHandler.setTimestampMode
+TIMESTAMP_MODE_ENV = 'KICADMODTREE_TIMESTAMP'
+
+# standard variable of reproducible builds, used as fixed timestamp if no timestamp mode is set
+SOURCE_DATE_EPOCH_ENV = 'SOURCE_DATE_EPOCH'
 
 
 class FileHandler(object):
@@ -32,34 +42,148 @@ class FileHandler(object):
     >>> file_handler.writeFile('example_footprint.kicad_mod')
     """
 
+    TIMESTAMP_CURRENT_TIME = 'now'
+    TIMESTAMP_CONTENT_HASH = 'hash'
+
+    # set by setTimestampMode, None means the mode is taken from the environment
+    _timestamp_mode = None
+
     def __init__(self, kicad_mod):
         self.kicad_mod = kicad_mod
 
+    @staticmethod
+    def setTimestampMode(mode):
+        r"""Set how the modification timestamp of all written footprints is chosen
+
+        By default the current time is used, which means every regeneration changes every file.
+        For diff-stable output either a fixed timestamp or a timestamp derived from the content
+        of the footprint can be used. A ``timestamp`` argument passed to serialize or writeFile
+        always has precedence.
+
+        Without calling this method the mode is read from the environment variable
+        ``KICADMODTREE_TIMESTAMP`` (``now``, ``hash`` or a unix timestamp). If it is not set,
+        ``SOURCE_DATE_EPOCH`` is used as fixed timestamp when available.
+
+        :param mode:
+            * ``FileHandler.TIMESTAMP_CURRENT_TIME``: use the current time
+            * ``FileHandler.TIMESTAMP_CONTENT_HASH``: derive the timestamp from the footprint content
+            * ``int``: use this fixed unix timestamp
+            * ``None``: read the mode from the environment again
+        :type mode: ``str``, ``int`` or ``None``
+
+        :Example:
+
+        >>> from KicadModTree import *
+        >>> KicadFileHandler.setTimestampMode(KicadFileHandler.TIMESTAMP_CONTENT_HASH)
+        """
+
+        if mode is not None:
+            FileHandler._parseTimestampMode(mode)
+        FileHandler._timestamp_mode = mode
+
+    @staticmethod
+    def getTimestampMode():
+        r"""Get the currently active timestamp mode
+
+        :return: ``FileHandler.TIMESTAMP_CURRENT_TIME``, ``FileHandler.TIMESTAMP_CONTENT_HASH`` or a fixed timestamp
+        """
+
+        if FileHandler._timestamp_mode is not None:
+            return FileHandler._parseTimestampMode(FileHandler._timestamp_mode)
+
+        if os.environ.get(TIMESTAMP_MODE_ENV):
+            return FileHandler._parseTimestampMode(os.environ[TIMESTAMP_MODE_ENV])
+
+        if os.environ.get(SOURCE_DATE_EPOCH_ENV):
+            return FileHandler._parseTimestampMode(os.environ[SOURCE_DATE_EPOCH_ENV])
+
+        return FileHandler.TIMESTAMP_CURRENT_TIME
+
+    @staticmethod
+    def _parseTimestampMode(mode):
+        if mode in (FileHandler.TIMESTAMP_CURRENT_TIME, FileHandler.TIMESTAMP_CONTENT_HASH):
+            return mode
+
+        try:
+            timestamp = int(mode)
+        except (TypeError, ValueError):
+            raise ValueError("invalid timestamp mode '{}', expected '{}', '{}' or a unix timestamp".format(
+                mode, FileHandler.TIMESTAMP_CURRENT_TIME, FileHandler.TIMESTAMP_CONTENT_HASH))
+
+        if timestamp < 0:
+            raise ValueError("invalid timestamp mode '{}', the timestamp has to be positive".format(mode))
+
+        return timestamp
+
     def writeFile(self, filename, **kwargs):
         r"""Write the output of FileHandler.serialize to a file
 
+        If the file already exists with exactly the same content, it is not written again.
+        Together with a deterministic timestamp (see setTimestampMode) this keeps the modification
+        time of unchanged footprints.
+
         :param filename:
             path of the output file
         :type filename: ``str``
 
+        :return: ``True`` if the file was written, ``False`` if it was already up to date
+
         :Example:
 
         >>> from KicadModTree import *
         >>> kicad_mod = Footprint("example_footprint")
         >>> file_handler = KicadFileHandler(kicad_mod)  # KicadFileHandler is a implementation of FileHandler
         >>> file_handler.writeFile('example_footprint.kicad_mod')
+        True
         """
 
-        with io.open(filename, "w", newline='\n') as f:
-            output = self.serialize(**kwargs)
+        if not os.path.isfile(filename):
+            # nothing to compare with, so the output can be streamed directly into the file
+            with io.open(filename, "w", newline='\n') as f:
+                self.serializeToStream(f, **kwargs)
+            return True
+
+        output = self.serialize(**kwargs)
 
-            # convert to unicode if running python2
-            if sys.version_info[0] == 2 and type(output) != unicode:
-                output = unicode(output, "utf-8")
+        # convert to unicode if running python2
+        if sys.version_info[0] == 2 and type(output) != unicode:
+            output = unicode(output, "utf-8")
 
+        if os.path.isfile(filename):
+            with io.open(filename, "r", newline='') as f:
+                try:
+                    unchanged = f.read() == output
+                except UnicodeDecodeError:
+                    unchanged = False
+            if unchanged:
+                return False
+
+        with io.open(filename, "w", newline='\n') as f:
             f.write(output)
 
-            f.close()
+        return True
+
+    def serializeToStream(self, stream, **kwargs):
+        r"""Write the output of FileHandler.serialize into a stream
+
+        Child classes can override this method to write the output piece by piece,
+        instead of building the whole representation in memory first.
+
+        :param stream:
+            file like object the footprint is written into
+        :type stream: ``io.TextIOBase``
+
+        :Example:
+
+        >>> import io
+        >>> from KicadModTree import *
+        >>> kicad_mod = Footprint("example_footprint")
+        >>> file_handler = KicadFileHandler(kicad_mod)  # KicadFileHandler is a implementation of FileHandler
+        >>> stream = io.StringIO()
+        >>> file_handler.serializeToStream(stream)
+        """
+
+        textWriter(stream)(self.serialize(**kwargs))
 
     def serialize(self, **kwargs):
         r"""Get a valid string representation of the footprint in the specified format
@@ -13,13 +13,20 @@
 #
 # (C) 2016-2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
 
+from functools import partial
+from itertools import chain
+
 from KicadModTree.FileHandler import FileHandler
+from KicadModTree.KicadModParser import KicadModParser
 from KicadModTree.util.kicad_util import *
 from KicadModTree.nodes.base.Pad import Pad  # TODO: why .KicadModTree is not enough?
 from KicadModTree.nodes.base.Arc import Arc
 from KicadModTree.nodes.base.Circle import Circle
 from KicadModTree.nodes.base.Line import Line
 from KicadModTree.nodes.base.Polygon import Polygon
+from KicadModTree.nodes.base.Model import Model
+from KicadModTree.nodes.base.Text import Text
+from KicadModTree.nodes.specialized.PadPanel import PadPanel
 
 
 DEFAULT_LAYER_WIDTH = {'F.SilkS': 0.12,
@@ -33,6 +40,9 @@ DEFAULT_WIDTH_POLYGON_PAD = 0
 
 DEFAULT_WIDTH = 0.15
 
+# the reference and value texts are written before all other nodes
+_HEADER_TEXT_ORDER = {'reference': (0, 0), 'value': (0, 1)}
+
 
 def _get_layer_width(layer, width=None):
     if width is not None:
@@ -41,6 +51,13 @@ def _get_layer_width(layer, width=None):
         return DEFAULT_LAYER_WIDTH.get(layer, DEFAULT_WIDTH)
 
 
+def _groupOrder(group):
+    '''
+    sort key of a group of nodes, 3D models are written at the end
+    '''
+    return (2 if group == 'Model' else 1, group)
+
+
 class KicadFileHandler(FileHandler):
     r"""Implementation of the FileHandler for .kicad_mod files
 
@@ -56,8 +73,106 @@ class KicadFileHandler(FileHandler):
     >>> file_handler.writeFile('example_footprint.kicad_mod')
     """
 
+    # node type -> (sort key of its group, serializer), see registerNodeSerializer
+    _node_serializers = {}
+
+    # node type -> (sort key of its group, serializer) for the primitives of custom pads
+    _primitive_serializers = {}
+
     def __init__(self, kicad_mod):
         FileHandler.__init__(self, kicad_mod)
+        self._dispatch_tables = {}
+
+    @classmethod
+    def registerNodeSerializer(cls, node_type, serializer, group=None):
+        r"""Register how the nodes of a type are written into the .kicad_mod file
+
+        Only nodes of registered types are written, subclasses of a registered type have to be registered
+        on their own. The nodes are written in groups which are sorted by their name, 3D models are always
+        written at the end. Inside of a group the nodes keep the order of the tree.
+
+        :param node_type:
+            class of the node
+        :type node_type: ``type``
+        :param serializer:
+            name of a method of the file handler, or a function ``serializer(file_handler, node)``.
+            Both return the s-expression of the node as list, or an iterable (like a generator) of
+            s-expressions if the node is written as multiple elements.
+        :type serializer: ``str``, ``callable``
+        :param group:
+            name of the group the nodes are written in (default: name of the class)
+        :type group: ``str``
+
+        :Example:
+
+        >>> from KicadModTree import *
+        >>> def serializeFilledZone(file_handler, node):  # FilledZone is a node type of your own
+        ...     return ['fp_poly', file_handler._serialize_PolygonPoints(node), ['layer', node.layer], ['width', 0]]
+        >>> KicadFileHandler.registerNodeSerializer(FilledZone, serializeFilledZone, group='Polygon')
+        """
+
+        cls._node_serializers[node_type] = (_groupOrder(group or node_type.__name__), serializer)
+
+    def _getDispatchTable(self, serializers):
+        '''
+        bind the registered serializers to this file handler
+        '''
+        table = self._dispatch_tables.get(id(serializers))
+        if table is None:
+            table = {}
+            for node_type, (order, serializer) in serializers.items():
+                if isinstance(serializer, str):
+                    table[node_type] = (order, getattr(self, serializer))
+                else:
+                    table[node_type] = (order, partial(serializer, self))
+            self._dispatch_tables[id(serializers)] = table
+        return table
+
+    def _groupNodes(self, nodes, serializers):
+        '''
+        sort the nodes into the groups they are written in
+
+        :return: list of groups in output order, every group is a list of (serializer, node)
+        '''
+        table = self._getDispatchTable(serializers)
+
+        groups = {}
+        for node in nodes:
+            node_type = node.__class__
+            entry = table.get(node_type)
+            if entry is None:
+                continue
+
+            order, serializer = entry
+            if node_type is Text:
+                order = _HEADER_TEXT_ORDER.get(node.type, order)
+
+            group = groups.get(order)
+            if group is None:
+                group = groups[order] = []
+            group.append((serializer, node))
+
+        return [groups[order] for order in sorted(groups)]
+
+    @staticmethod
+    def readFile(filename):
+        r"""Read an existing .kicad_mod file into a node tree
+
+        See KicadModParser for details about the supported elements.
+
+        :param filename:
+            path of the footprint
+        :type filename: ``str``
+
+        :return: ``KicadModTree.Footprint``
+
+        :Example:
+
+        >>> from KicadModTree import *
+        >>> kicad_mod = KicadFileHandler.readFile('example_footprint.kicad_mod')
+        """
+
+        return KicadModParser().parseFile(filename)
 
     def serialize(self, **kwargs):
         r"""Get a valid string representation of the footprint in the .kicad_mod format
@@ -70,9 +185,50 @@ class KicadFileHandler(FileHandler):
         >>> print(file_handler.serialize())
         """
 
+        timestamp = self._getTimestamp(**kwargs)
+        if timestamp != self.TIMESTAMP_CONTENT_HASH:
+            return str(SexprSerializer(self._serializeFootprint(timestamp)))
+
+        # serialize with a placeholder timestamp and derive the real one from the output
+        output = str(SexprSerializer(self._serializeFootprint(0)))
+        header, newline, body = output.partition('\n')
+        header = header[:-len('(tedit 0)')] + '(tedit {})'.format(formatTimestamp(contentTimestamp(output)))
+        return header + newline + body
+
+    def serializeToStream(self, stream, **kwargs):
+        r"""Write the footprint in the .kicad_mod format into a stream
+
+        The tokens are streamed directly into the given file like object, so the
+        whole footprint is never held in memory as a single string.
+
+        :Example:
+
+        >>> import io
+        >>> from KicadModTree import *
+        >>> kicad_mod = Footprint("example_footprint")
+        >>> file_handler = KicadFileHandler(kicad_mod)
+        >>> stream = io.StringIO()
+        >>> file_handler.serializeToStream(stream)
+        """
+
+        timestamp = self._getTimestamp(**kwargs)
+        if timestamp == self.TIMESTAMP_CONTENT_HASH:
+            # the timestamp is only known after the whole footprint was serialized
+            textWriter(stream)(self.serialize(**kwargs))
+        else:
+            SexprSerializer(self._serializeFootprint(timestamp)).write(stream)
+
+    def _getTimestamp(self, **kwargs):
+        if kwargs.get('timestamp') is not None:
+            return kwargs['timestamp']
+
+        mode = self.getTimestampMode()
+        return None if mode == self.TIMESTAMP_CURRENT_TIME else mode
+
+    def _serializeFootprint(self, timestamp=None):
         sexpr = ['module', self.kicad_mod.name,
                  ['layer', 'F.Cu'],
-                 ['tedit', formatTimestamp(kwargs.get('timestamp'))],
+                 ['tedit', formatTimestamp(timestamp)],
                  SexprSerializer.NEW_LINE
                 ]  # NOQA
 
@@ -102,52 +258,24 @@ class KicadFileHandler(FileHandler):
 
         sexpr.extend(self._serializeTree())
 
-        return str(SexprSerializer(sexpr))
+        return sexpr
 
     def _serializeTree(self):
-        nodes = self.kicad_mod.serialize()
-
-        grouped_nodes = {}
-
-        for single_node in nodes:
-            node_type = single_node.__class__.__name__
-
-            current_nodes = grouped_nodes.get(node_type, [])
-            current_nodes.append(single_node)
-
-            grouped_nodes[node_type] = current_nodes
+        # registrations could have changed since the last serialization
+        self._dispatch_tables = {}
 
         sexpr = []
-
-        # serialize initial text nodes
-        if 'Text' in grouped_nodes:
-            reference_nodes = list(filter(lambda node: node.type == 'reference', grouped_nodes['Text']))
-            for node in reference_nodes:
-                sexpr.append(self._serialize_Text(node))
-                sexpr.append(SexprSerializer.NEW_LINE)
-                grouped_nodes['Text'].remove(node)
-
-            value_nodes = list(filter(lambda node: node.type == 'value', grouped_nodes['Text']))
-            for node in value_nodes:
-                sexpr.append(self._serialize_Text(node))
-                sexpr.append(SexprSerializer.NEW_LINE)
-                grouped_nodes['Text'].remove(node)
-
-        for key, value in sorted(grouped_nodes.items()):
-            # check if key is a base node, except Model
-            if key not in {'Arc', 'Circle', 'Line', 'Pad', 'Polygon', 'Text'}:
-                continue
-
-            # render base nodes
-            for node in value:
-                sexpr.append(self._callSerialize(node))
-                sexpr.append(SexprSerializer.NEW_LINE)
-
-        # serialize 3D Models at the end
-        if grouped_nodes.get('Model'):
-            for node in grouped_nodes.get('Model'):
-                sexpr.append(self._serialize_Model(node))
-                sexpr.append(SexprSerializer.NEW_LINE)
+        for group in self._groupNodes(self.kicad_mod.walk(), self._node_serializers):
+            for serializer, node in group:
+                node_sexpr = serializer(node)
+                if isinstance(node_sexpr, list):
+                    sexpr.append(node_sexpr)
+                    sexpr.append(SexprSerializer.NEW_LINE)
+                    continue
+
+                for element in node_sexpr:
+                    sexpr.append(element)
+                    sexpr.append(SexprSerializer.NEW_LINE)
 
         return sexpr
 
@@ -155,13 +283,11 @@ class KicadFileHandler(FileHandler):
         '''
         call the corresponding method to serialize the node
         '''
-        method_type = node.__class__.__name__
-        method_name = "_serialize_{0}".format(method_type)
-        if hasattr(self, method_name):
-            return getattr(self, method_name)(node)
-        else:
-            exception_string = "{name} (node) not found, cannot serialized the node of type {type}"
-            raise NotImplementedError(exception_string.format(name=method_name, type=method_type))
+        entry = self._getDispatchTable(self._node_serializers).get(node.__class__)
+        if entry is None:
+            exception_string = "no serializer registered, cannot serialized the node of type {type}"
+            raise NotImplementedError(exception_string.format(type=node.__class__.__name__))
+        return entry[1](node)
 
     def _serialize_ArcPoints(self, node):
         # in KiCAD, some file attributes of Arc are named not in the way of their real meaning
@@ -266,47 +392,33 @@ class KicadFileHandler(FileHandler):
         return sexpr
 
     def _serialize_CustomPadPrimitives(self, pad):
-        all_primitives = []
-        for p in pad.primitives:
-            all_primitives.extend(p.serialize())
-
-        grouped_nodes = {}
-
-        for single_node in all_primitives:
-            node_type = single_node.__class__.__name__
-
-            current_nodes = grouped_nodes.get(node_type, [])
-            current_nodes.append(single_node)
-
-            grouped_nodes[node_type] = current_nodes
-
         sexpr_primitives = []
 
-        for key, value in sorted(grouped_nodes.items()):
-            # check if key is a base node, except Model
-            if key not in {'Arc', 'Circle', 'Line', 'Pad', 'Polygon', 'Text'}:
-                continue
-
-            # render base nodes
-            for p in value:
-                if isinstance(p, Polygon):
-                    sp = ['gr_poly',
-                          self._serialize_PolygonPoints(p, newline_after_pts=True)
-                         ]  # NOQA
-                elif isinstance(p, Line):
-                    sp = ['gr_line'] + self._serialize_LinePoints(p)
-                elif isinstance(p, Circle):
-                    sp = ['gr_circle'] + self._serialize_CirclePoints(p)
-                elif isinstance(p, Arc):
-                    sp = ['gr_arc'] + self._serialize_ArcPoints(p)
-                else:
-                    raise TypeError('Unsuported type of primitive for custom pad.')
+        primitives = chain.from_iterable(p.walk() for p in pad.primitives)
+        for group in self._groupNodes(primitives, self._primitive_serializers):
+            for serializer, p in group:
+                sp = serializer(p)
                 sp.append(['width', DEFAULT_WIDTH_POLYGON_PAD if p.width is None else p.width])
                 sexpr_primitives.append(sp)
                 sexpr_primitives.append(SexprSerializer.NEW_LINE)
 
         return sexpr_primitives
 
+    def _serialize_ArcPrimitive(self, node):
+        return ['gr_arc'] + self._serialize_ArcPoints(node)
+
+    def _serialize_CirclePrimitive(self, node):
+        return ['gr_circle'] + self._serialize_CirclePoints(node)
+
+    def _serialize_LinePrimitive(self, node):
+        return ['gr_line'] + self._serialize_LinePoints(node)
+
+    def _serialize_PolygonPrimitive(self, node):
+        return ['gr_poly', self._serialize_PolygonPoints(node, newline_after_pts=True)]
+
+    def _serialize_UnsupportedPrimitive(self, node):
+        raise TypeError('Unsuported type of primitive for custom pad.')
+
     def _serialize_Pad(self, node):
         sexpr = ['pad', node.number, node.type, node.shape]
 
@@ -350,18 +462,37 @@ class KicadFileHandler(FileHandler):
 
         return sexpr
 
+    def _serialize_PadPanel(self, node):
+        template = self._serialize_Pad(node.pad_template)
+        head = template[:4]
+        tail = template[5:]  # everything after (at ...) is equal for all pads
+
+        transformation = node._getTransformation()
+        if transformation is None:
+            a, b, c, d, e, f, real_rotation = 1, 0, 0, 0, 1, 0, 0
+        else:
+            a, b, c, d, e, f, real_rotation = transformation
+
+        rotation = node.pad_template.rotation + real_rotation
+        rotated = not rotation % 360 == 0
+
+        for number, x, y in node.getPadPositions():
+            if transformation is not None:
+                x, y = a*x + b*y + c, d*x + e*y + f
+            head[1] = number
+            yield head + [['at', x, y, rotation] if rotated else ['at', x, y]] + tail
+
     def _serialize_PolygonPoints(self, node, newline_after_pts=False):
         node_points = ['pts']
         if newline_after_pts:
             node_points.append(SexprSerializer.NEW_LINE)
         points_appended = 0
-        for n in node.nodes:
+        for n_pos in node.getRealPositions(node.nodes):
             if points_appended >= 4:
                 points_appended = 0
                 node_points.append(SexprSerializer.NEW_LINE)
             points_appended += 1
 
-            n_pos = node.getRealPosition(n)
             node_points.append(['xy', n_pos.x, n_pos.y])
 
         return node_points
@@ -376,3 +507,15 @@ class KicadFileHandler(FileHandler):
                 ]  # NOQA
 
         return sexpr
+
+
+for _node_type in (Arc, Circle, Line, Model, Pad, Polygon, Text):
+    KicadFileHandler.registerNodeSerializer(_node_type, '_serialize_{}'.format(_node_type.__name__))
+KicadFileHandler.registerNodeSerializer(PadPanel, '_serialize_PadPanel', group='Pad')
+
+for _node_type in (Arc, Circle, Line, Polygon):
+    KicadFileHandler._primitive_serializers[_node_type] = \
+        (_groupOrder(_node_type.__name__), '_serialize_{}Primitive'.format(_node_type.__name__))
+for _node_type in (Pad, Text):
+    KicadFileHandler._primitive_serializers[_node_type] = \
+        (_groupOrder(_node_type.__name__), '_serialize_UnsupportedPrimitive')
@@ -0,0 +1,274 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2016-2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+import io
+import math
+import sys
+
+from KicadModTree.util.kicad_util import parseLispString, parseTimestamp
+from KicadModTree.nodes.Footprint import Footprint
+from KicadModTree.nodes.base.Arc import Arc
+from KicadModTree.nodes.base.Circle import Circle
+from KicadModTree.nodes.base.Line import Line
+from KicadModTree.nodes.base.Model import Model
+from KicadModTree.nodes.base.Pad import Pad
+from KicadModTree.nodes.base.Polygon import Polygon
+from KicadModTree.nodes.base.Text import Text
+
+
+def _floats(values):
+    return [float(v) for v in values]
+
+
+def _attributes(sexpr):
+    '''
+    split the items of a sexpr into a dict of sub lists (key is the first token) and a list of plain flags
+    '''
+    attributes = {}
+    flags = []
+    for item in sexpr:
+        if isinstance(item, list):
+            attributes[item[0]] = item[1:]
+        else:
+            flags.append(item)
+    return attributes, flags
+
+
+def _points(pts):
+    return [_floats(xy[1:]) for xy in pts if isinstance(xy, list) and xy[0] == 'xy']
+
+
+class KicadModParser(object):
+    r"""Parser for .kicad_mod files, which creates a node tree out of an existing footprint
+
+    This is the counterpart of the KicadFileHandler. All nodes written by KicadModTree are supported
+    (Text, Line, Circle, Arc, Polygon, Pad including custom pads, and Model). Other elements are
+    skipped and listed in ``unknown_elements``.
+
+    :param strict:
+        raise a ``ValueError`` for elements which are not supported instead of skipping them
+    :type strict: ``bool``
+
+    :Example:
+
+    >>> from KicadModTree import *
+    >>> parser = KicadModParser()
+    >>> kicad_mod = parser.parseFile('example_footprint.kicad_mod')
+    >>> KicadFileHandler(kicad_mod).writeFile('copy.kicad_mod', timestamp=parser.timestamp)
+    """
+
+    def __init__(self, strict=False):
+        self.strict = strict
+        self.timestamp = None
+        self.unknown_elements = []
+
+    def parseFile(self, filename):
+        r"""Parse a .kicad_mod file
+
+        :param filename:
+            path of the footprint
+        :type filename: ``str``
+
+        :return: ``KicadModTree.Footprint``
+        """
+
+        with io.open(filename, 'r', encoding='utf-8') as f:
+            return self.parse(f.read())
+
+    def parse(self, string):
+        r"""Parse the content of a .kicad_mod file
+
+        :param string:
+            footprint in the .kicad_mod format
+        :type string: ``str``
+
+        :return: ``KicadModTree.Footprint``
+        """
+
+        if sys.version_info[0] == 2 and isinstance(string, unicode):  # NOQA
+            # the nodes hold native (utf-8 encoded) strings on python 2, like the ones of the generators
+            string = string.encode('utf-8')
+
+        sexpr = parseLispString(string)
+        if not isinstance(sexpr, list) or len(sexpr) < 2 or sexpr[0] != 'module':
+            raise ValueError("not a KiCad footprint, expected '(module <name> ...)'")
+
+        self.timestamp = None
+        self.unknown_elements = []
+
+        kicad_mod = Footprint(sexpr[1])
+        for element in sexpr[2:]:
+            method = getattr(self, "_parse_{0}".format(element[0]), None) if isinstance(element, list) else None
+            if method is None:
+                self._unknownElement(element)
+                continue
+
+            node = method(kicad_mod, element)
+            if node is not None:
+                kicad_mod.append(node)
+
+        return kicad_mod
+
+    def _unknownElement(self, element, parent='module'):
+        name = element[0] if isinstance(element, list) else element
+        if self.strict:
+            raise ValueError("{name} is not supported inside of {parent}".format(name=name, parent=parent))
+        self.unknown_elements.append(name)
+
+    def _parse_layer(self, kicad_mod, sexpr):
+        if sexpr[1] != 'F.Cu':
+            self._unknownElement(sexpr)
+
+    def _parse_tedit(self, kicad_mod, sexpr):
+        self.timestamp = parseTimestamp(sexpr[1])
+
+    def _parse_descr(self, kicad_mod, sexpr):
+        kicad_mod.setDescription(sexpr[1])
+
+    def _parse_tags(self, kicad_mod, sexpr):
+        kicad_mod.setTags(sexpr[1])
+
+    def _parse_attr(self, kicad_mod, sexpr):
+        kicad_mod.setAttribute(sexpr[1])
+
+    def _parse_solder_mask_margin(self, kicad_mod, sexpr):
+        kicad_mod.setMaskMargin(float(sexpr[1]))
+
+    def _parse_solder_paste_margin(self, kicad_mod, sexpr):
+        kicad_mod.setPasteMargin(float(sexpr[1]))
+
+    def _parse_solder_paste_ratio(self, kicad_mod, sexpr):
+        kicad_mod.setPasteMarginRatio(float(sexpr[1]))
+
+    def _parse_fp_text(self, kicad_mod, sexpr):
+        attributes, flags = _attributes(sexpr[3:])
+
+        at = _floats(attributes['at'])
+        kwargs = {'type': sexpr[1], 'text': sexpr[2], 'at': at[:2], 'rotation': at[2] if len(at) > 2 else 0,
+                  'layer': attributes['layer'][0], 'hide': 'hide' in flags}
+
+        effects, _ = _attributes(attributes.get('effects', []))
+        font, _ = _attributes(effects.get('font', []))
+        if 'size' in font:
+            kwargs['size'] = _floats(font['size'])
+        if 'thickness' in font:
+            kwargs['thickness'] = float(font['thickness'][0])
+        kwargs['mirror'] = 'mirror' in effects.get('justify', [])
+
+        return Text(**kwargs)
+
+    def _parse_fp_line(self, kicad_mod, sexpr):
+        attributes, _ = _attributes(sexpr[1:])
+        return Line(start=_floats(attributes['start']), end=_floats(attributes['end']),
+                    layer=attributes['layer'][0], width=float(attributes['width'][0]))
+
+    def _parse_fp_circle(self, kicad_mod, sexpr):
+        attributes, _ = _attributes(sexpr[1:])
+        return Circle(**self._circleParameters(attributes, layer=attributes['layer'][0]))
+
+    def _parse_fp_arc(self, kicad_mod, sexpr):
+        attributes, _ = _attributes(sexpr[1:])
+        return Arc(**self._arcParameters(attributes, layer=attributes['layer'][0]))
+
+    def _parse_fp_poly(self, kicad_mod, sexpr):
+        attributes, _ = _attributes(sexpr[1:])
+        return Polygon(nodes=_points(attributes['pts']), layer=attributes['layer'][0],
+                       width=float(attributes['width'][0]))
+
+    def _parse_model(self, kicad_mod, sexpr):
+        attributes, _ = _attributes(sexpr[2:])
+
+        kwargs = {'filename': sexpr[1]}
+        for key, name in (('at', 'at'), ('offset', 'at'), ('scale', 'scale'), ('rotate', 'rotate')):
+            if key in attributes:
+                kwargs[name] = _floats(attributes[key][0][1:])
+
+        return Model(**kwargs)
+
+    def _parse_pad(self, kicad_mod, sexpr):
+        attributes, flags = _attributes(sexpr[4:])
+
+        at = _floats(attributes['at'])
+        kwargs = {'number': sexpr[1], 'type': sexpr[2], 'shape': sexpr[3],
+                  'at': at[:2], 'rotation': at[2] if len(at) > 2 else 0,
+                  'size': _floats(attributes['size']), 'layers': attributes['layers']}
+
+        if 'drill' in attributes:
+            drill, _ = _attributes(attributes['drill'])
+            drill_size = _floats(v for v in attributes['drill'] if not isinstance(v, list) and v != 'oval')
+            if drill_size:
+                kwargs['drill'] = drill_size if len(drill_size) > 1 else drill_size[0]
+            if 'offset' in drill:
+                kwargs['offset'] = _floats(drill['offset'])
+
+        if 'roundrect_rratio' in attributes:
+            kwargs['radius_ratio'] = float(attributes['roundrect_rratio'][0])
+
+        for key in ('solder_mask_margin', 'solder_paste_margin', 'solder_paste_margin_ratio'):
+            if key in attributes:
+                kwargs[key] = float(attributes[key][0])
+
+        if 'options' in attributes:
+            options, _ = _attributes(attributes['options'])
+            if 'clearance' in options:
+                kwargs['shape_in_zone'] = options['clearance'][0]
+            if 'anchor' in options:
+                kwargs['anchor_shape'] = options['anchor'][0]
+
+        if kwargs['shape'] == Pad.SHAPE_CUSTOM:
+            kwargs['primitives'] = [p for p in (self._parsePrimitive(p) for p in attributes.get('primitives', []))
+                                    if p is not None]
+
+        supported = {'at', 'size', 'drill', 'layers', 'roundrect_rratio', 'options', 'primitives',
+                     'solder_mask_margin', 'solder_paste_margin', 'solder_paste_margin_ratio'}
+        for key in attributes:
+            if key not in supported:
+                self._unknownElement([key], parent='pad')
+        for flag in flags:
+            self._unknownElement(flag, parent='pad')
+
+        return Pad(**kwargs)
+
+    def _parsePrimitive(self, sexpr):
+        attributes, _ = _attributes(sexpr[1:])
+        width = float(attributes['width'][0]) if 'width' in attributes else None
+
+        if sexpr[0] == 'gr_poly':
+            return Polygon(nodes=_points(attributes['pts']), width=width)
+        elif sexpr[0] == 'gr_line':
+            return Line(start=_floats(attributes['start']), end=_floats(attributes['end']), width=width)
+        elif sexpr[0] == 'gr_circle':
+            return Circle(**self._circleParameters(attributes, width=width))
+        elif sexpr[0] == 'gr_arc':
+            return Arc(**self._arcParameters(attributes, width=width))
+
+        self._unknownElement(sexpr, parent='primitives')
+        return None
+
+    def _circleParameters(self, attributes, **kwargs):
+        center = _floats(attributes['center'])
+        end = _floats(attributes['end'])
+        kwargs.update(center=center, radius=math.hypot(end[0] - center[0], end[1] - center[1]))
+        if 'width' in attributes:
+            kwargs['width'] = float(attributes['width'][0])
+        return kwargs
+
+    def _arcParameters(self, attributes, **kwargs):
+        # in KiCAD, some file attributes of Arc are named not in the way of their real meaning
+        kwargs.update(center=_floats(attributes['start']), start=_floats(attributes['end']),
+                      angle=float(attributes['angle'][0]))
+        if 'width' in attributes:
+            kwargs['width'] = float(attributes['width'][0])
+        return kwargs
@@ -16,12 +16,34 @@
 import sys
 import argparse
 import csv
+import json
+import multiprocessing
+import time
+import traceback
+from collections import OrderedDict
 
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+
+def _importYaml():
+    # pyyaml is only imported when a yaml file is used, it is the slowest part of "import KicadModTree"
+    try:
+        import yaml
+    except ImportError:
+        print("pyyaml not available!")
+        sys.exit(1)
+    return yaml
+
+
+def _loadOrderedYaml(yaml, stream):
+    # the footprints are generated in the order of the file, plain dicts are not ordered before python 3.6
+    class OrderedLoader(yaml.SafeLoader):
+        pass
+
+    def constructMapping(loader, node):
+        loader.flatten_mapping(node)
+        return OrderedDict(loader.construct_pairs(node))
+
+    OrderedLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, constructMapping)
+    return yaml.load(stream, Loader=OrderedLoader)
 
 
 class ParserException(Exception):
@@ -30,7 +52,7 @@ class ParserException(Exception):
 
 
 class ModArgparser(object):
-    r"""A general data loading class, which allows us to specify parts using .yml or .csv files.
+    r"""A general data loading class, which allows us to specify parts using .yml, .json or .csv files.
 
     Using this class allows us to seperate between the implementation of a footprint generator, and the data which
     represents a single footprint. To do so, we need to define which parameters are expected in those data-files.
@@ -39,7 +61,8 @@ class ModArgparser(object):
     default values and do a simple check if a parameter can be considered as required or optional.
 
     :param footprint_function:
-        A function which is called for every footprint we want to generate
+        A function which is called for every footprint we want to generate. It can return a dict with
+        information about the generated footprint, which is added to its result (see :func:`run_batch`)
     :type footprint_function: ``function reference``
 
     :Example:
@@ -91,11 +114,19 @@ class ModArgparser(object):
 
         self._params[name] = kwargs
 
-    def run(self):
+    def run(self, argv=None):
         r"""Execute the ModArgparser and run all tasks defined via the commandline arguments of this script
 
-        This method parses the commandline arguments to determine which actions to take. Beside of parsing .yml and .csv
-        files, it also allows us to output example files.
+        This method parses the commandline arguments to determine which actions to take. Beside of parsing .yml, .json
+        and .csv files, it also allows us to output example files.
+
+        The footprints can be generated by multiple worker processes (``--jobs``). The script exits with code 1 if
+        a footprint could not be generated, ``--fail-fast`` stops at the first failure. ``--summary`` writes the
+        result of every footprint into a json file (see :func:`run_batch`).
+
+        :param argv:
+            commandline arguments (default: ``sys.argv[1:]``)
+        :type argv: ``list``
 
         >>> from KicadModTree import *
         >>> def footprint_gen(args):
@@ -107,14 +138,20 @@ class ModArgparser(object):
         """
 
         parser = argparse.ArgumentParser(description='Parse footprint defintion file(s) and create matching footprints')
-        parser.add_argument('files', metavar='file', type=str, nargs='*', help='.yml or .csv files which contains data')
+        parser.add_argument('files', metavar='file', type=str, nargs='*',
+                            help='.yml, .json or .csv files which contains data')
         parser.add_argument('-v', '--verbose', help='show some additional information', action='store_true')  # TODO
         parser.add_argument('--print_yml', help='print example .yml file', action='store_true')
         parser.add_argument('--print_csv', help='print example .csv file', action='store_true')
+        parser.add_argument('-j', '--jobs', type=int, default=1,
+                            help='number of worker processes, 0 uses all cpu cores (default: 1)')
+        parser.add_argument('--fail-fast', help='stop at the first footprint which can not be generated',
+                            action='store_true')
+        parser.add_argument('--summary', type=str, help='write the result of every footprint as json into this file')
 
         # TODO: allow writing into sub dir
 
-        args = parser.parse_args()
+        args = parser.parse_args(argv)
 
         if args.print_yml:
             self._print_example_yml()
@@ -128,41 +165,145 @@ class ModArgparser(object):
             parser.print_help()
             return
 
-        for filepath in args.files:
+        results = self.run_batch(args.files, jobs=args.jobs, fail_fast=args.fail_fast)
+
+        if args.summary:
+            with open(args.summary, 'w') as summary_stream:
+                json.dump(results, summary_stream, indent=2)
+
+        failed = [r for r in results if r['status'] == 'failed']
+        skipped = [r for r in results if r['status'] == 'skipped']
+        if failed or skipped:
+            print("{} of {} footprints failed{}".format(
+                len(failed), len(results), ", {} skipped".format(len(skipped)) if skipped else ""))
+            for result in failed:
+                print("  {name} ({file}): {error}".format(**result))
+            sys.exit(1)
+
+    def run_batch(self, files, jobs=1, fail_fast=False):
+        r"""Generate all footprints defined in .yml, .json and .csv files
+
+        The parameters of all footprints are checked before the first footprint is generated.
+
+        :param files:
+            .yml, .json or .csv files which contain the footprint definitions. A .json file contains either an object
+            like a .yml file (footprint name -> parameters), or a list of objects which have a ``name`` each
+        :type files: ``list``
+        :param jobs:
+            number of worker processes, 0 uses all cpu cores. Workers are forked from the running script,
+            on systems without fork all footprints are generated by the running process.
+        :type jobs: ``int``
+        :param fail_fast:
+            stop at the first footprint which can not be generated, the remaining ones are reported as skipped
+        :type fail_fast: ``bool``
+
+        :return: one dict per footprint, in the order of the files, with the keys
+                 ``name``, ``file``, ``seconds``, ``status`` (``ok``, ``failed`` or ``skipped``), ``error``
+                 and ``info`` (the dict returned by the footprint function, or None)
+        """
+
+        tasks = []
+        for filepath in files:
             print("use file: {0}".format(filepath))
             if filepath.endswith('.yml') or filepath.endswith('.yaml'):
-                self._parse_and_execute_yml(filepath)
+                tasks.extend(self._parse_yml(filepath))
+            elif filepath.endswith('.json'):
+                tasks.extend(self._parse_json(filepath))
             elif filepath.endswith('.csv'):
-                self._parse_and_execute_csv(filepath)
+                tasks.extend(self._parse_csv(filepath))
             else:
                 print("unexpected filetype: {0}".format(filepath))
+                tasks.append(_Task(filepath, None, error="unexpected filetype"))
+
+        # a broken definition is reported before any footprint is generated
+        for task in tasks:
+            if task.error is None:
+                try:
+                    task.args = self._parse_arguments(task.kwargs)
+                except ParserException as e:
+                    print("ERROR: {} ({}): {}".format(task.name, task.filepath, e))
+                    task.error = str(e)
+
+        results = [None] * len(tasks)
+
+        context = _forkContext()
+        jobs = min(jobs or multiprocessing.cpu_count(), len(tasks))
+        if jobs > 1 and context is not None:
+            global _batch
+            _batch = (self, tasks)  # inherited by the forked workers, nothing has to be pickled
+            pool = context.Pool(jobs)
+            try:
+                for index, result in pool.imap_unordered(_executeTask, range(len(tasks))):
+                    results[index] = result
+                    if fail_fast and result['status'] == 'failed':
+                        break
+            finally:
+                pool.terminate()
+                pool.join()
+                _batch = None
+        else:
+            for index, task in enumerate(tasks):
+                results[index] = self._execute_task(task)
+                if fail_fast and results[index]['status'] == 'failed':
+                    break
 
-    def _parse_and_execute_yml(self, filepath):
-        if not YAML_AVAILABLE:
-            print("pyyaml not available!")
-            sys.exit(1)
+        for index, task in enumerate(tasks):
+            if results[index] is None:
+                results[index] = task.result('skipped')
+
+        return results
+
+    def _parse_yml(self, filepath):
+        yaml = _importYaml()
 
         with open(filepath, 'r') as stream:
             try:
-                parsed = yaml.safe_load(stream)  # parse file
+                parsed = _loadOrderedYaml(yaml, stream)  # parse file
+            except yaml.YAMLError as exc:
+                print(exc)
+                return [_Task(filepath, None, error=str(exc))]
 
-                if parsed is None:
-                    print("empty file!")
-                    return
+        if parsed is None:
+            print("empty file!")
+            return []
 
-                for footprint in parsed:
-                    kwargs = parsed.get(footprint)
+        return self._parse_mapping(filepath, parsed)
 
-                    # name is a reserved key
-                    if 'name' in kwargs:
-                        print("ERROR: name is already used for root name!")
-                        continue
-                    kwargs['name'] = footprint
+    def _parse_mapping(self, filepath, parsed):
+        tasks = []
+        for footprint in parsed:
+            kwargs = parsed.get(footprint)
 
-                    self._execute_script(**kwargs)  # now we can execute the script
+            # name is a reserved key
+            if 'name' in kwargs:
+                print("ERROR: name is already used for root name!")
+                tasks.append(_Task(filepath, footprint, error="name is already used for root name"))
+                continue
+            kwargs['name'] = footprint
 
-            except yaml.YAMLError as exc:
+            tasks.append(_Task(filepath, footprint, kwargs))
+
+        return tasks
+
+    def _parse_json(self, filepath):
+        with open(filepath, 'r') as stream:
+            try:
+                parsed = json.load(stream, object_pairs_hook=OrderedDict)
+            except ValueError as exc:
                 print(exc)
+                return [_Task(filepath, None, error=str(exc))]
+
+        if isinstance(parsed, dict):
+            return self._parse_mapping(filepath, parsed)
+
+        tasks = []
+        for kwargs in parsed:
+            if not isinstance(kwargs, dict):
+                tasks.append(_Task(filepath, None, error="footprint definition is not an object"))
+                continue
+            tasks.append(_Task(filepath, kwargs.get('name'), kwargs))
+
+        return tasks
 
     def _create_example_data_required(self, **kwargs):
         params = {}
@@ -199,28 +340,29 @@ class ModArgparser(object):
             return "??"
 
     def _print_example_yml(self):
-        if not YAML_AVAILABLE:
-            print("pyyaml not available!")
-            sys.exit(1)
+        yaml = _importYaml()
 
         data = {'footprint_required': self._create_example_data_required(),
                 'footprint_full': self._create_example_data_full()}
         print(yaml.dump(data, default_flow_style=False))
 
-    def _parse_and_execute_csv(self, filepath):
+    def _parse_csv(self, filepath):
         with open(filepath, 'r') as stream:
             # dialect = csv.Sniffer().sniff(stream.read(1024))  # check which type of formating the csv file likel has
             # stream.seek(0)
 
             reader = csv.DictReader(stream, dialect=csv.excel)  # parse file
 
+            tasks = []
             for row in reader:
                 # we wan't to remove spaces before and after the fields
                 kwargs = {}
                 for k, v in row.items():
                     kwargs[k.strip()] = v.strip()
 
-                self._execute_script(**kwargs)  # now we can execute the script
+                tasks.append(_Task(filepath, kwargs.get('name'), kwargs))
+
+        return tasks
 
     def _print_example_csv(self):
         writer = csv.DictWriter(sys.stdout, fieldnames=self._params.keys())
@@ -229,9 +371,25 @@ class ModArgparser(object):
         writer.writerow(self._create_example_data_required(include_name=True))
         writer.writerow(self._create_example_data_full(include_name=True))
 
-    def _execute_script(self, **kwargs):
+    def _execute_task(self, task):
+        if task.error is not None:
+            return task.result('failed', task.error)
+
+        start_time = time.time()
+        try:
+            print("  - generate {name}.kicad_mod".format(name=task.kwargs.get('name', '<anon>')))
+            info = self._footprint_function(task.args)  # now we can execute the script
+        except Exception as e:
+            traceback.print_exc()
+            return task.result('failed', "{}: {}".format(type(e).__name__, e), time.time() - start_time)
+        finally:
+            sys.stdout.flush()
+
+        return task.result('ok', seconds=time.time() - start_time, info=info)
+
+    def _parse_arguments(self, kwargs):
         parsed_args = {}
-        error = False
+        errors = []
 
         for k, v in self._params.items():
             try:
@@ -252,12 +410,43 @@ class ModArgparser(object):
                     else:
                         parsed_args[k] = type(v.get('default'))
             except (ValueError, ParserException) as e:
-                error = True
-                print("ERROR: {}".format(e))
+                errors.append(str(e))
 
-        print("  - generate {name}.kicad_mod".format(name=kwargs.get('name', '<anon>')))
+        if errors:
+            raise ParserException("; ".join(errors))
+
+        return parsed_args
+
+
+class _Task(object):
+    # a single footprint of a definition file
+
+    def __init__(self, filepath, name, kwargs=None, error=None):
+        self.filepath = filepath
+        self.name = name
+        self.kwargs = kwargs
+        self.args = None  # parsed parameters
+        self.error = error
+
+    def result(self, status, error=None, seconds=0.0, info=None):
+        return {'name': self.name, 'file': self.filepath, 'seconds': seconds, 'status': status, 'error': error,
+                'info': info}
+
+
+# (ModArgparser, tasks) of the running batch, set before the worker processes are forked
+_batch = None
+
+
+def _executeTask(index):
+    parser, tasks = _batch
+    return index, parser._execute_task(tasks[index])
 
-        if error:
-            return
 
-        self._footprint_function(parsed_args)
+def _forkContext():
+    try:
+        return multiprocessing.get_context('fork')
+    except AttributeError:
+        # python 2 always forks on posix systems
+        return multiprocessing if sys.platform != 'win32' else None
+    except ValueError:
+        return None
@@ -34,27 +34,28 @@ class Vector2D(object):
     >>> Vector2D({'x': 0, 'y':0})
     >>> Vector2D(Vector2D(0, 0))
     """
+
+    # vectors are created in huge numbers, so they do not carry a __dict__
+    __slots__ = ('x', 'y')
+
     def __init__(self, coordinates=None, y=None):
-        # parse constructor
-        if coordinates is None:
-            coordinates = {}
-        elif type(coordinates) in [int, float]:
-            if y is not None:
-                coordinates = [coordinates, y]
-            else:
+        # fast path for the most common format: Vector2D(0, 0)
+        coordinates_type = type(coordinates)
+        if coordinates_type is float or coordinates_type is int:
+            if y is None:
                 raise TypeError('you have to give x and y coordinate')
-        elif isinstance(coordinates, Vector2D):
-            # convert Vector2D as well as Vector3D to dict
-            coordinates = coordinates.to_dict()
+            self.x = float(coordinates)
+            self.y = float(y)
+            return
 
-        # parse vectors with format: Vector2D({'x':0, 'y':0})
-        if type(coordinates) is dict:
-            self.x = float(coordinates.get('x', 0.))
-            self.y = float(coordinates.get('y', 0.))
+        # parse vectors with format: Vector2D(Vector2D(0, 0)), works for Vector3D as well
+        if isinstance(coordinates, Vector2D):
+            self.x = float(coordinates.x)
+            self.y = float(coordinates.y)
             return
 
         # parse vectors with format: Vector2D([0, 0]) or Vector2D((0, 0))
-        if type(coordinates) in [list, tuple]:
+        if coordinates_type is list or coordinates_type is tuple:
             if len(coordinates) == 2:
                 self.x = float(coordinates[0])
                 self.y = float(coordinates[1])
@@ -62,8 +63,27 @@ class Vector2D(object):
             else:
                 raise TypeError('invalid list size (2 elements expected)')
 
+        if coordinates is None:
+            self.x = 0.
+            self.y = 0.
+            return
+
+        # parse vectors with format: Vector2D({'x':0, 'y':0})
+        if coordinates_type is dict:
+            self.x = float(coordinates.get('x', 0.))
+            self.y = float(coordinates.get('y', 0.))
+            return
+
         raise TypeError('invalid parameters given')
 
+    @classmethod
+    def _fromFloats(cls, x, y):
+        # create a vector from two floats without parsing them again
+        vector = object.__new__(cls)
+        vector.x = x
+        vector.y = y
+        return vector
+
     def round_to(self, base):
         r"""Round to a specific base (like it's required for a grid)
 
@@ -76,7 +96,7 @@ class Vector2D(object):
         if base == 0 or base is None:
             return self.__copy__()
 
-        return Vector2D([round(v / base) * base for v in self])
+        return Vector2D(round(self.x / base) * base, round(self.y / base) * base)
 
     def distance_to(self, value):
         r"""Distance between this and another point
@@ -84,18 +104,8 @@ class Vector2D(object):
         :param value: the other point
         :return: distance between self and other point
         """
-        other = Vector2D.__arithmetic_parse(value)
-        d = other - self
-        return hypot(d.x, d.y)
-
-    @staticmethod
-    def __arithmetic_parse(value):
-        if isinstance(value, Vector2D):
-            return value
-        elif type(value) in [int, float]:
-            return Vector2D([value, value])
-        else:
-            return Vector2D(value)
+        x, y = _parse2D(value)
+        return hypot(x - self.x, y - self.y)
 
     def __eq__(self, other):
         if not isinstance(self, other.__class__):
@@ -106,45 +116,49 @@ class Vector2D(object):
         return not self.__eq__(other)
 
     def __add__(self, value):
-        other = Vector2D.__arithmetic_parse(value)
+        if isinstance(value, Vector2D):
+            return _Vector2D(self.x + value.x, self.y + value.y)
 
-        return Vector2D({'x': self.x + other.x,
-                         'y': self.y + other.y})
+        x, y = _parse2D(value)
+        return _Vector2D(self.x + x, self.y + y)
 
     def __iadd__(self, value):
-        other = Vector2D.__arithmetic_parse(value)
-        self.x += other.x
-        self.y += other.y
+        x, y = _parse2D(value)
+        self.x += x
+        self.y += y
 
         return self
 
     def __neg__(self):
-        return Vector2D({'x': -self.x, 'y': -self.y})
+        return _Vector2D(-self.x, -self.y)
 
     def __sub__(self, value):
-        other = Vector2D.__arithmetic_parse(value)
+        if isinstance(value, Vector2D):
+            return _Vector2D(self.x - value.x, self.y - value.y)
 
-        return Vector2D({'x': self.x - other.x,
-                         'y': self.y - other.y})
+        x, y = _parse2D(value)
+        return _Vector2D(self.x - x, self.y - y)
 
     def __isub__(self, value):
-        other = Vector2D.__arithmetic_parse(value)
-        self.x -= other.x
-        self.y -= other.y
+        x, y = _parse2D(value)
+        self.x -= x
+        self.y -= y
 
         return self
 
     def __mul__(self, value):
-        other = Vector2D.__arithmetic_parse(value)
+        if isinstance(value, Vector2D):
+            return _Vector2D(self.x * value.x, self.y * value.y)
 
-        return Vector2D({'x': self.x * other.x,
-                         'y': self.y * other.y})
+        x, y = _parse2D(value)
+        return _Vector2D(self.x * x, self.y * y)
 
     def __div__(self, value):
-        other = Vector2D.__arithmetic_parse(value)
+        if isinstance(value, Vector2D):
+            return _Vector2D(self.x / value.x, self.y / value.y)
 
-        return Vector2D({'x': self.x / other.x,
-                         'y': self.y / other.y})
+        x, y = _parse2D(value)
+        return _Vector2D(self.x / x, self.y / y)
 
     def __truediv__(self, obj):
         return self.__div__(obj)
@@ -161,10 +175,10 @@ class Vector2D(object):
                                  y=formatFloat(self.y))
 
     def __repr__(self):
-        return "Vector2D (x={x}, y={y})".format(**self.to_dict())
+        return "Vector2D (x={x}, y={y})".format(x=self.x, y=self.y)
 
     def __str__(self):
-        return "(x={x}, y={y})".format(**self.to_dict())
+        return "(x={x}, y={y})".format(x=self.x, y=self.y)
 
     def __getitem__(self, key):
         if key == 0 or key == 'x':
@@ -204,14 +218,18 @@ class Vector2D(object):
                 rotation angle is given in degrees. default:True
         """
 
-        op = Vector2D(origin)
+        ox, oy = _parsePoint2D(origin)
 
         if use_degrees:
             angle = radians(angle)
 
-        temp = op.x + cos(angle) * (self.x - op.x) - sin(angle) * (self.y - op.y)
-        self.y = op.y + sin(angle) * (self.x - op.x) + cos(angle) * (self.y - op.y)
-        self.x = temp
+        cos_angle = cos(angle)
+        sin_angle = sin(angle)
+        dx = self.x - ox
+        dy = self.y - oy
+
+        self.x = ox + cos_angle * dx - sin_angle * dy
+        self.y = oy + sin_angle * dx + cos_angle * dy
 
         return self
 
@@ -225,12 +243,13 @@ class Vector2D(object):
                 angle in degrees. default:True
         """
 
-        op = Vector2D(origin)
+        ox, oy = _parsePoint2D(origin)
 
-        diff = self - op
-        radius = hypot(diff.x, diff.y)
+        dx = self.x - ox
+        dy = self.y - oy
+        radius = hypot(dx, dy)
 
-        angle = atan2(diff.y, diff.x)
+        angle = atan2(dy, dx)
         if use_degrees:
             angle = degrees(angle)
 
@@ -254,10 +273,9 @@ class Vector2D(object):
         if use_degrees:
             angle = radians(angle)
 
-        x = radius * cos(angle)
-        y = radius * sin(angle)
+        ox, oy = _parsePoint2D(origin)
 
-        return Vector2D({'x': x, 'y': y})+Vector2D(origin)
+        return _Vector2D(float(radius * cos(angle)) + ox, float(radius * sin(angle)) + oy)
 
     def to_homogeneous(self):
         r""" Get homogeneous representation
@@ -291,33 +309,30 @@ class Vector3D(Vector2D):
     >>> Vector3D(Vector3D(0, 0, 0))
     """
 
+    __slots__ = ('z',)
+
     def __init__(self, coordinates=None, y=None, z=None):
         # we don't need a super constructor here
 
-        # parse constructor
-        if coordinates is None:
-            coordinates = {}
-        elif type(coordinates) in [int, float]:
-            if y is not None:
-                if z is not None:
-                    coordinates = [coordinates, y, z]
-                else:
-                    coordinates = [coordinates, y]
-            else:
+        # fast path for the most common format: Vector3D(0, 0, 0)
+        coordinates_type = type(coordinates)
+        if coordinates_type is float or coordinates_type is int:
+            if y is None:
                 raise TypeError('you have to give at least x and y coordinate')
-        elif isinstance(coordinates, Vector2D):
-            # convert Vector2D as well as Vector3D to dict
-            coordinates = coordinates.to_dict()
+            self.x = float(coordinates)
+            self.y = float(y)
+            self.z = 0. if z is None else float(z)
+            return
 
-        # parse vectors with format: Vector2D({'x':0, 'y':0})
-        if type(coordinates) is dict:
-            self.x = float(coordinates.get('x', 0.))
-            self.y = float(coordinates.get('y', 0.))
-            self.z = float(coordinates.get('z', 0.))
+        # parse vectors with format: Vector3D(Vector2D(0, 0)) or Vector3D(Vector3D(0, 0, 0))
+        if isinstance(coordinates, Vector2D):
+            self.x = float(coordinates.x)
+            self.y = float(coordinates.y)
+            self.z = float(coordinates.z) if isinstance(coordinates, Vector3D) else 0.
             return
 
         # parse vectors with format: Vector3D([0, 0]), Vector3D([0, 0, 0]) or Vector3D((0, 0)), Vector3D((0, 0, 0))
-        if type(coordinates) in [list, tuple]:
+        if coordinates_type is list or coordinates_type is tuple:
             if len(coordinates) >= 2:
                 self.x = float(coordinates[0])
                 self.y = float(coordinates[1])
@@ -331,9 +346,31 @@ class Vector3D(Vector2D):
 
             if len(coordinates) > 3:
                 raise TypeError('invalid list size (to big)')
+            return
 
-        else:
-            raise TypeError('dict or list type required')
+        if coordinates is None:
+            self.x = 0.
+            self.y = 0.
+            self.z = 0.
+            return
+
+        # parse vectors with format: Vector3D({'x':0, 'y':0, 'z':0})
+        if coordinates_type is dict:
+            self.x = float(coordinates.get('x', 0.))
+            self.y = float(coordinates.get('y', 0.))
+            self.z = float(coordinates.get('z', 0.))
+            return
+
+        raise TypeError('dict or list type required')
+
+    @classmethod
+    def _fromFloats(cls, x, y, z=0.):
+        # create a vector from three floats without parsing them again
+        vector = object.__new__(cls)
+        vector.x = x
+        vector.y = y
+        vector.z = z
+        return vector
 
     def round_to(self, base):
         r"""Round to a specific base (like it's required for a grid)
@@ -347,29 +384,19 @@ class Vector3D(Vector2D):
         if base == 0 or base is None:
             return self.__copy__()
 
-        return Vector3D([round(v / base) * base for v in self])
+        return Vector3D(round(self.x / base) * base, round(self.y / base) * base, round(self.z / base) * base)
 
     def cross_product(self, other):
-        other = Vector3D.__arithmetic_parse(other)
+        x, y, z = _parse3D(other)
 
-        return Vector3D({
-                    'x': self.y*other.z - self.z*other.y,
-                    'y': self.z*other.x - self.x*other.z,
-                    'z': self.x*other.y - self.y*other.x})
+        return _Vector3D(self.y*z - self.z*y,
+                         self.z*x - self.x*z,
+                         self.x*y - self.y*x)
 
     def dot_product(self, other):
-        other = Vector3D.__arithmetic_parse(other)
-
-        return self.x*other.x + self.y*other.y + self.z*other.z
+        x, y, z = _parse3D(other)
 
-    @staticmethod
-    def __arithmetic_parse(value):
-        if isinstance(value, Vector3D):
-            return value
-        elif type(value) in [int, float]:
-            return Vector3D([value, value, value])
-        else:
-            return Vector3D(value)
+        return self.x*x + self.y*y + self.z*z
 
     def __eq__(self, other):
         if not isinstance(self, other.__class__):
@@ -380,53 +407,51 @@ class Vector3D(Vector2D):
         return not self.__eq__(other)
 
     def __add__(self, value):
-        other = Vector3D.__arithmetic_parse(value)
+        if isinstance(value, Vector3D):
+            return _Vector3D(self.x + value.x, self.y + value.y, self.z + value.z)
 
-        return Vector3D({'x': self.x + other.x,
-                         'y': self.y + other.y,
-                         'z': self.z + other.z})
+        x, y, z = _parse3D(value)
+        return _Vector3D(self.x + x, self.y + y, self.z + z)
 
     def __iadd__(self, value):
-        other = Vector2D.__arithmetic_parse(value)
-        self.x += other.x
-        self.y += other.y
-        self.z += other.z
+        x, y, z = _parse3D(value)
+        self.x += x
+        self.y += y
+        self.z += z
 
         return self
 
     def __neg__(self):
-        return Vector2D({'x': -self.x,
-                         'y': -self.y,
-                         'z': -self.z})
+        return _Vector3D(-self.x, -self.y, -self.z)
 
     def __sub__(self, value):
-        other = Vector3D.__arithmetic_parse(value)
+        if isinstance(value, Vector3D):
+            return _Vector3D(self.x - value.x, self.y - value.y, self.z - value.z)
 
-        return Vector3D({'x': self.x - other.x,
-                         'y': self.y - other.y,
-                         'z': self.z - other.z})
+        x, y, z = _parse3D(value)
+        return _Vector3D(self.x - x, self.y - y, self.z - z)
 
     def __isub__(self, value):
-        other = Vector2D.__arithmetic_parse(value)
-        self.x -= other.x
-        self.y -= other.y
-        self.z -= other.z
+        x, y, z = _parse3D(value)
+        self.x -= x
+        self.y -= y
+        self.z -= z
 
         return self
 
     def __mul__(self, value):
-        other = Vector3D.__arithmetic_parse(value)
+        if isinstance(value, Vector3D):
+            return _Vector3D(self.x * value.x, self.y * value.y, self.z * value.z)
 
-        return Vector3D({'x': self.x * other.x,
-                         'y': self.y * other.y,
-                         'z': self.z * other.z})
+        x, y, z = _parse3D(value)
+        return _Vector3D(self.x * x, self.y * y, self.z * z)
 
     def __div__(self, value):
-        other = Vector3D.__arithmetic_parse(value)
+        if isinstance(value, Vector3D):
+            return _Vector3D(self.x / value.x, self.y / value.y, self.z / value.z)
 
-        return Vector3D({'x': self.x / other.x,
-                         'y': self.y / other.y,
-                         'z': self.z / other.z})
+        x, y, z = _parse3D(value)
+        return _Vector3D(self.x / x, self.y / y, self.z / z)
 
     def __truediv__(self, obj):
         return self.__div__(obj)
@@ -444,10 +469,10 @@ class Vector3D(Vector2D):
                                  z=formatFloat(self.z))
 
     def __repr__(self):
-        return "Vector3D (x={x}, y={y}, z={z})".format(**self.to_dict())
+        return "Vector3D (x={x}, y={y}, z={z})".format(x=self.x, y=self.y, z=self.z)
 
     def __str__(self):
-        return "(x={x}, y={y}, z={z})".format(**self.to_dict())
+        return "(x={x}, y={y}, z={z})".format(x=self.x, y=self.y, z=self.z)
 
     def __getitem__(self, key):
         if key == 0 or key == 'x':
@@ -479,3 +504,44 @@ class Vector3D(Vector2D):
 
     def __copy__(self):
         return Vector3D(self.x, self.y, self.z)
+
+
+_Vector2D = Vector2D._fromFloats
+_Vector3D = Vector3D._fromFloats
+
+
+def _parsePoint2D(value):
+    # coordinates of a point given in any format accepted by Vector2D
+    if isinstance(value, Vector2D):
+        return value.x, value.y
+
+    value_type = type(value)
+    if (value_type is tuple or value_type is list) and len(value) == 2:
+        return float(value[0]), float(value[1])
+
+    vector = Vector2D(value)
+    return vector.x, vector.y
+
+
+def _parse2D(value):
+    # operand of an arithmetic operation, numbers are applied to both coordinates
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        value = float(value)
+        return value, value
+
+    return _parsePoint2D(value)
+
+
+def _parse3D(value):
+    # operand of an arithmetic operation, numbers are applied to all coordinates
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        value = float(value)
+        return value, value, value
+
+    if isinstance(value, Vector3D):
+        return value.x, value.y, value.z
+
+    vector = Vector3D(value)
+    return vector.x, vector.y, vector.z
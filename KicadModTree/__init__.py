@@ -13,14 +13,29 @@
 #
 # (C) 2016 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
 
-from KicadModTree.Vector import *
-from KicadModTree.Point import *  # backwards compatibility
+# The public API is imported when it is used for the first time, so "import KicadModTree" or
+# "from KicadModTree import Footprint, Pad" only load the modules which are really needed.
+# "from KicadModTree import *" still exports all names.
 
-# all different types of nodes
-from KicadModTree.nodes import *
+from KicadModTree.util.lazy_import import lazyImport
 
-# File Handlers
-from KicadModTree.KicadFileHandler import KicadFileHandler
+from KicadModTree import nodes
 
-# Argparser
-from KicadModTree.ModArgparser import ModArgparser
+_API = {}
+_API.update((name, ('.nodes', name)) for name in nodes.__all__)
+_API.update((name, ('.Vector', name)) for name in (
+    'Vector2D', 'Vector3D', 'atan2', 'cos', 'degrees', 'division', 'formatFloat', 'hypot', 'radians', 'round',
+    'sin', 'sqrt', 'warnings'
+))
+_API.update((name, ('.Point', name)) for name in ('Point', 'Point2D', 'Point3D'))  # backwards compatibility
+
+_API['KicadFileHandler'] = ('.KicadFileHandler', 'KicadFileHandler')
+_API['KicadModParser'] = ('.KicadModParser', 'KicadModParser')
+
+_API['ModArgparser'] = ('.ModArgparser', 'ModArgparser')
+
+# submodules which were exported by the former star imports
+for _name in ('nodes', 'util', 'Vector', 'FileHandler'):
+    _API[_name] = ('.' + _name, None)
+
+lazyImport(globals(), _API)
@@ -13,9 +13,25 @@
 #
 # (C) 2016 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
 
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
 from copy import copy, deepcopy
+from itertools import chain
 
 from KicadModTree.Vector import *
+from KicadModTree.util.kicad_util import textWriter
+
+try:
+    import numpy
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# below this number of points the overhead of creating numpy arrays is bigger than the gain
+NUMPY_MIN_POINTS = 64
+
+# active counters of countRegenerations()
+_regeneration_counters = []
 
 
 class MultipleParentsError(RuntimeError):
@@ -32,10 +48,78 @@ class RecursionDetectedError(RuntimeError):
         super(RecursionDetectedError, self).__init__(message)
 
 
+def _composeTransformations(outer, inner):
+    '''
+    combine two transformations. The inner transformation is applied first.
+
+    A transformation is either ``None`` (identity) or a tuple ``(a, b, c, d, e, f, rotation)`` which represents
+    the affine matrix ``[[a, b, c], [d, e, f], [0, 0, 1]]`` and the rotation added to rotated elements.
+    '''
+    if inner is None:
+        return outer
+    if outer is None:
+        return inner
+
+    oa, ob, oc, od, oe, of, orot = outer
+    ia, ib, ic, id, ie, if_, irot = inner
+
+    return (oa*ia + ob*id, oa*ib + ob*ie, oa*ic + ob*if_ + oc,
+            od*ia + oe*id, od*ib + oe*ie, od*ic + oe*if_ + of,
+            irot + orot)
+
+
+def _countRegeneration(node):
+    '''
+    report that the virtual childs of a node were generated
+    '''
+    for counter in _regeneration_counters:
+        counter[type(node).__name__] += 1
+
+
+@contextmanager
+def countRegenerations():
+    r"""Count how often the virtual childs of each node type are generated
+
+    Only generated childs are counted (like the pads of an ``ExposedPad`` or a ``PadArray``), childs which
+    are returned out of the cache are not.
+
+    :Example:
+
+    >>> from KicadModTree import *
+    >>> with countRegenerations() as regenerations:
+    ...     KicadFileHandler(kicad_mod).serialize()
+    >>> regenerations
+    Counter({'ChamferedPadGrid': 9, 'PadArray': 4, 'ExposedPad': 1})
+    """
+    counter = Counter()
+    _regeneration_counters.append(counter)
+    try:
+        yield counter
+    finally:
+        _regeneration_counters.remove(counter)
+
+
+def _hasDefaultBoundingBox(node):
+    return type(node).calculateBoundingBox == Node.calculateBoundingBox
+
+
 class Node(object):
+    # incremented on every change of the tree structure or of a transformation. Cached transformations
+    # which were calculated in an older generation are recalculated on their next access.
+    _transformation_generation = 0
+    _transformation_cache = None
+
     def __init__(self):
         self._parent = None
         self._childs = []
+        self._transformation_cache = None
+
+    @staticmethod
+    def _invalidateTransformations():
+        '''
+        mark all cached transformations as outdated
+        '''
+        Node._transformation_generation += 1
 
     def append(self, node):
         '''
@@ -50,6 +134,7 @@ class Node(object):
         self._childs.append(node)
 
         node._parent = self
+        Node._invalidateTransformations()
 
     def extend(self, nodes):
         '''
@@ -70,6 +155,7 @@ class Node(object):
             node._parent = self
 
         self._childs.extend(new_nodes)
+        Node._invalidateTransformations()
 
     def remove(self, node):
         '''
@@ -82,6 +168,7 @@ class Node(object):
             self._childs.remove(node)
 
         node._parent = None
+        Node._invalidateTransformations()
 
     def insert(self, node):
         '''
@@ -99,13 +186,58 @@ class Node(object):
     def copy(self):
         copy = deepcopy(self)
         copy._parent = None
+        Node._invalidateTransformations()
         return copy
 
     def serialize(self):
-        nodes = [self]
-        for child in self.getAllChilds():
-            nodes += child.serialize()
-        return nodes
+        return list(self.walk())
+
+    def _iterChilds(self, include_virtual):
+        if include_virtual:
+            return chain(self.getNormalChilds(), self.getVirtualChilds())
+        return iter(self.getNormalChilds())
+
+    def walk(self, order='pre', include_virtual=True, descend=None):
+        r"""Iterate over this node and all of its (grand-)childs
+
+        The tree is traversed with an explicit stack, so neither intermediate lists nor recursion are required.
+        Normal childs are visited before virtual childs.
+
+        :param order:
+            ``'pre'`` yields a node before its childs, ``'post'`` after them
+        :type order: ``str``
+        :param include_virtual:
+            also visit the virtual childs (default: True)
+        :type include_virtual: ``bool``
+        :param descend:
+            called for every child, its childs are only visited if this returns True (default: visit all)
+        :type descend: ``callable``
+
+        :Example:
+
+        >>> from KicadModTree import *
+        >>> pads = [node for node in kicad_mod.walk() if isinstance(node, Pad)]
+        """
+        if order == 'pre':
+            yield self
+        elif order != 'post':
+            raise ValueError("order has to be 'pre' or 'post', not '{}'".format(order))
+
+        stack = [(self, self._iterChilds(include_virtual))]
+        while stack:
+            node, childs = stack[-1]
+            for child in childs:
+                if order == 'pre':
+                    yield child
+                if descend is None or descend(child):
+                    stack.append((child, child._iterChilds(include_virtual)))
+                    break
+                if order == 'post':
+                    yield child
+            else:
+                stack.pop()
+                if order == 'post':
+                    yield node
 
     def getNormalChilds(self):
         '''
@@ -142,18 +274,98 @@ class Node(object):
 
         return self.getParent().getRootNode()
 
+    def _getLocalTransformation(self):
+        '''
+        transformation which this node applies to all of its childs (``None`` if it does not change positions)
+        '''
+        return None
+
+    def _getTransformation(self):
+        '''
+        get the composed transformation of all parent nodes, which is cached until the tree is changed
+        '''
+        generation = Node._transformation_generation
+
+        # search the first parent which has a valid cache, and resolve the transformations downwards from there
+        chain = []
+        node = self._parent
+        transformation = None
+        while node is not None:
+            cache = node._transformation_cache
+            if cache is not None and cache[0] == generation:
+                transformation = cache[1]
+                break
+            chain.append(node)
+            node = node._parent
+
+        for node in reversed(chain):
+            transformation = _composeTransformations(transformation, node._getLocalTransformation())
+            node._transformation_cache = (generation, transformation)
+
+        return transformation
+
+    def getTransformationMatrix(self):
+        '''
+        get the affine transformation matrix which is applied to the coordinates of this node
+
+        :return: 3x3 matrix as tuple of rows
+        '''
+        transformation = self._getTransformation()
+        if transformation is None:
+            return ((1., 0., 0.), (0., 1., 0.), (0., 0., 1.))
+
+        a, b, c, d, e, f, _ = transformation
+        return ((a, b, c), (d, e, f), (0., 0., 1.))
+
     def getRealPosition(self, coordinate, rotation=None):
         '''
         return position of point after applying all transformation and rotation operations
         '''
-        if not self._parent:
-            if rotation is None:
-                # TODO: most of the points are 2D Nodes
-                return Vector3D(coordinate)
-            else:
-                return Vector3D(coordinate), rotation
+        transformation = self._getTransformation()
+
+        if transformation is None:
+            # TODO: most of the points are 2D Nodes
+            position = Vector3D(coordinate)
+        else:
+            if not isinstance(coordinate, Vector2D):
+                coordinate = Vector2D(coordinate)
+
+            a, b, c, d, e, f, real_rotation = transformation
+            x, y = coordinate.x, coordinate.y
+            position = Vector3D(a*x + b*y + c, d*x + e*y + f)
+
+            if rotation is not None:
+                rotation += real_rotation
+
+        if rotation is None:
+            return position
+        else:
+            return position, rotation
+
+    def getRealPositions(self, coordinates):
+        '''
+        return positions of multiple points after applying all transformation operations
+
+        The transformation is only resolved once for all points. For large point lists numpy is used when available.
+        '''
+        transformation = self._getTransformation()
+
+        if transformation is None:
+            return [Vector3D(coordinate) for coordinate in coordinates]
+
+        points = [p if isinstance(p, Vector2D) else Vector2D(p) for p in coordinates]
+        a, b, c, d, e, f, _ = transformation
+
+        if NUMPY_AVAILABLE and len(points) >= NUMPY_MIN_POINTS:
+            xs = numpy.fromiter((p.x for p in points), dtype=float, count=len(points))
+            ys = numpy.fromiter((p.y for p in points), dtype=float, count=len(points))
 
-        return self._parent.getRealPosition(coordinate, rotation)
+            # tolist() converts back to python floats, which are required by the serializer
+            real_xs = (a*xs + b*ys + c).tolist()
+            real_ys = (d*xs + e*ys + f).tolist()
+            return [Vector3D(x, y) for x, y in zip(real_xs, real_ys)]
+
+        return [Vector3D(a*p.x + b*p.y + c, d*p.x + e*p.y + f) for p in points]
 
     def calculateBoundingBox(self, outline=None):
         min_x, min_y = 0, 0
@@ -165,7 +377,10 @@ class Node(object):
             max_x = outline['max']['x']
             max_y = outline['max']['y']
 
-        for child in self.getAllChilds():
+        # nodes without their own implementation only combine the outlines of their childs
+        for child in self.walk(descend=_hasDefaultBoundingBox):
+            if child is self or _hasDefaultBoundingBox(child):
+                continue
             child_outline = child.calculateBoundingBox()
 
             min_x = min([min_x, child_outline['min']['x']])
@@ -190,6 +405,74 @@ class Node(object):
 
         return "*"
 
+    def writeRenderTree(self, stream, complete=False, max_depth=None, max_childs=None):
+        r"""Write the render tree to a stream, line by line while the tree is traversed
+
+        Big trees can be shortened: the childs of nodes at ``max_depth``, and all childs after the first
+        ``max_childs`` of a node, are only counted and written as one line per node type (``* Pad x 16275``).
+
+        :param stream:
+            file like object the tree is written to (e.g. ``sys.stdout``)
+        :param complete:
+            also write the virtual childs, like ``getCompleteRenderTree`` (default: False)
+        :type complete: ``bool``
+        :param max_depth:
+            depth up to which nodes are written, this node has depth 0 (default: no limit)
+        :type max_depth: ``int``
+        :param max_childs:
+            number of childs which are written per node (default: no limit)
+        :type max_childs: ``int``
+
+        :Example:
+
+        >>> import sys
+        >>> from KicadModTree import *
+        >>> kicad_mod.writeRenderTree(sys.stdout, max_depth=1, max_childs=10)
+        """
+        self._writeRenderTree(textWriter(stream), complete, max_depth, max_childs, set())
+
+    def _writeRenderTree(self, write, complete, max_depth, max_childs, rendered_nodes):
+        stack = []
+
+        def writeNode(node, depth):
+            if node in rendered_nodes:
+                raise RecursionDetectedError('recursive definition of render tree!')
+            rendered_nodes.add(node)
+
+            indent = '  ' * depth
+            text = "{0} {1}".format(node._getRenderTreeSymbol(), node._getRenderTreeText())
+            write(indent + text.replace('\n', '\n' + indent) + '\n')
+
+            childs = node._iterChilds(complete)
+            if max_depth is not None and depth >= max_depth:
+                writeSummary(childs, depth + 1)
+            else:
+                stack.append((childs, depth + 1, [0]))
+
+        def writeSummary(childs, depth):
+            indent = '  ' * depth
+            # in the order of the first child of every type, Counter is not ordered on python 2
+            counts = OrderedDict()
+            for child in childs:
+                name = type(child).__name__
+                counts[name] = counts.get(name, 0) + 1
+            for name, count in counts.items():
+                write("{0}* {1} x {2}\n".format(indent, name, count))
+
+        writeNode(self, 0)
+        while stack:
+            childs, depth, written = stack[-1]
+            for child in childs:
+                if max_childs is not None and written[0] >= max_childs:
+                    writeSummary(chain([child], childs), depth)
+                    stack.pop()
+                    break
+                written[0] += 1
+                writeNode(child, depth)
+                break
+            else:
+                stack.pop()
+
     def getRenderTree(self, rendered_nodes=None):
         '''
         print render tree
@@ -197,17 +480,9 @@ class Node(object):
         if rendered_nodes is None:
             rendered_nodes = set()
 
-        if self in rendered_nodes:
-            raise RecursionDetectedError('recursive definition of render tree!')
-
-        rendered_nodes.add(self)
-
-        tree_str = "{0} {1}".format(self._getRenderTreeSymbol(), self._getRenderTreeText())
-        for child in self.getNormalChilds():
-            tree_str += '\n  '
-            tree_str += '  '.join(child.getRenderTree(rendered_nodes).splitlines(True))
-
-        return tree_str
+        lines = []
+        self._writeRenderTree(lines.append, False, None, None, rendered_nodes)
+        return ''.join(lines)[:-1]
 
     def getCompleteRenderTree(self, rendered_nodes=None):
         '''
@@ -216,14 +491,44 @@ class Node(object):
         if rendered_nodes is None:
             rendered_nodes = set()
 
-        if self in rendered_nodes:
-            raise RecursionDetectedError('recursive definition of render tree!')
+        lines = []
+        self._writeRenderTree(lines.append, True, None, None, rendered_nodes)
+        return ''.join(lines)[:-1]
+
 
-        rendered_nodes.add(self)
+class GeneratedNode(Node):
+    r"""Base class of nodes whose virtual childs are generated out of their parameters
 
-        tree_str = "{0} {1}".format(self._getRenderTreeSymbol(), self._getRenderTreeText())
-        for child in self.getAllChilds():
-            tree_str += '\n  '
-            tree_str += '  '.join(child.getCompleteRenderTree(rendered_nodes).splitlines(True))
+    The childs are created by ``_createVirtualChilds`` on the first call of ``getVirtualChilds`` and are cached
+    afterwards. Assigning any public attribute marks the cached childs as outdated. Changes which are done in
+    place (like ``node.size.x = 1``) are not detected, call ``invalidateVirtualChilds`` after them.
+    """
+    _virtual_childs_cache = None
+
+    def __setattr__(self, name, value):
+        if name[0] != '_':
+            Node.__setattr__(self, '_virtual_childs_cache', None)
+        Node.__setattr__(self, name, value)
+
+    def invalidateVirtualChilds(self):
+        '''
+        generate the virtual childs again on their next access
+        '''
+        self._virtual_childs_cache = None
 
-        return tree_str
+    def _createVirtualChilds(self):
+        '''
+        generate the virtual childs out of the current parameters
+        '''
+        return []
+
+    def getVirtualChilds(self):
+        '''
+        Get virtual childs of this node, which are generated again after a parameter changed
+        '''
+        childs = self._virtual_childs_cache
+        if childs is None:
+            _countRegeneration(self)
+            childs = self._createVirtualChilds()
+            self._virtual_childs_cache = childs
+        return childs
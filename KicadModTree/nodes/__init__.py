@@ -13,11 +13,24 @@
 #
 # (C) 2016 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
 
+from KicadModTree.util.lazy_import import lazyImport
+
+from . import base, specialized
+
+_NODES = {}
+_NODES.update((name, ('.specialized', name)) for name in specialized.__all__)
+_NODES.update((name, ('.base', name)) for name in base.__all__)
+
 # generic node
-from .Node import Node, MultipleParentsError, RecursionDetectedError
+_NODES.update((name, ('.Node', name)) for name in (
+    'Node', 'GeneratedNode', 'MultipleParentsError', 'RecursionDetectedError', 'countRegenerations'
+))
 
 # root node
-from .Footprint import Footprint
+_NODES['Footprint'] = ('.Footprint', 'Footprint')
+
+_NODES['base'] = ('.base', None)
+_NODES['specialized'] = ('.specialized', None)
 
-from .base import *
-from .specialized import *
+# the nodes are imported when they are used for the first time
+lazyImport(globals(), _NODES)
@@ -14,6 +14,8 @@
 # (C) 2016 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
 # (C) 2018 by Rene Poeschl, github @poeschlr
 
+from copy import copy
+
 from KicadModTree.util.paramUtil import *
 from KicadModTree.Vector import *
 from KicadModTree.nodes.Node import Node
@@ -377,6 +379,42 @@ class Pad(Node):
         self.at += distance_vector
         return self
 
+    def _cloneAt(self, number, at):
+        r""" Create a pad with the same parameters at another position
+
+        The parameters of this pad were already checked by the constructor, so they are copied
+        without validating them again. This is used by ``PadArray`` for big arrays of equal pads.
+
+        :params:
+            * *number* (``int``, ``str``)
+                number of the new pad
+            * *at* (``Vector2D``)
+                position of the new pad (before mirroring, like the ``at`` parameter of the constructor)
+        """
+
+        pad = copy(self)
+        Node.__init__(pad)
+
+        pad.number = number
+        pad.at = Vector2D(at)
+        if self.mirror[0] is not None:
+            pad.at.x = 2 * self.mirror[0] - pad.at.x
+        if self.mirror[1] is not None:
+            pad.at.y = 2 * self.mirror[1] - pad.at.y
+
+        # mutable parameters must not be shared between the pads
+        pad.size = Vector2D(self.size)
+        pad.offset = Vector2D(self.offset)
+        if self.drill is not None:
+            pad.drill = Vector2D(self.drill)
+        pad.mirror = list(self.mirror)
+        if hasattr(self, 'round_radius_handler'):
+            pad.round_radius_handler = copy(self.round_radius_handler)
+        if self.shape == Pad.SHAPE_CUSTOM:
+            pad.primitives = list(self.primitives)
+
+        return pad
+
     # calculate the outline of a pad
     def calculateBoundingBox(self):
         return Node.calculateBoundingBox(self)
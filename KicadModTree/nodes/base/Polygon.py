@@ -76,7 +76,14 @@ class Polygon(Node):
         return self
 
     def calculateBoundingBox(self):
-        return nodes.calculateBoundingBox()
+        points = self.getRealPositions(self.nodes)
+
+        min_x = min(p.x for p in points)
+        min_y = min(p.y for p in points)
+        max_x = max(p.x for p in points)
+        max_y = max(p.y for p in points)
+
+        return {'min': Vector2D(min_x, min_y), 'max': Vector2D(max_x, max_y)}
 
     def _getRenderTreeText(self):
         render_text = Node._getRenderTreeText(self)
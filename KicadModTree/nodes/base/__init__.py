@@ -13,16 +13,9 @@
 #
 # (C) 2016-2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
 
-from .Arc import Arc
+from KicadModTree.util.lazy_import import lazyImport
 
-from .Circle import Circle
-
-from .Line import Line
-
-from .Model import Model
-
-from .Pad import Pad
-
-from .Polygon import Polygon
-
-from .Text import Text
+# the nodes are imported when they are used for the first time
+lazyImport(globals(), {name: ('.' + name, name) for name in (
+    'Arc', 'Circle', 'Line', 'Model', 'Pad', 'Polygon', 'Text'
+)})
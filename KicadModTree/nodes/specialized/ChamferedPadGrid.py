@@ -20,6 +20,7 @@ from KicadModTree.util.paramUtil import *
 from KicadModTree.Vector import *
 from KicadModTree.nodes.base.Polygon import *
 from KicadModTree.nodes.specialized.ChamferedPad import *
+from KicadModTree.nodes.Node import GeneratedNode
 
 
 class ChamferSelPadGrid(CornerSelection):
@@ -141,7 +142,7 @@ class ChamferSelPadGrid(CornerSelection):
         return result
 
 
-class ChamferedPadGrid(Node):
+class ChamferedPadGrid(GeneratedNode):
     r"""Add a ChamferedPad to the render tree
 
     :param \**kwargs:
@@ -351,7 +352,7 @@ class ChamferedPadGrid(Node):
                     ))
         return pads
 
-    def getVirtualChilds(self):
+    def _createVirtualChilds(self):
         return self._generatePads()
 
     def __copy__(self):
@@ -23,13 +23,13 @@ from KicadModTree.util.paramUtil import *
 from KicadModTree.nodes.base.Pad import *
 from KicadModTree.nodes.specialized.ChamferedPadGrid import *
 from KicadModTree.nodes.specialized.PadArray import *
-from KicadModTree.nodes.Node import Node
+from KicadModTree.nodes.Node import Node, GeneratedNode
 from math import sqrt, floor
 from copy import copy
 import traceback
 
 
-class ExposedPad(Node):
+class ExposedPad(GeneratedNode):
     r"""Add an exposed pad
 
     Complete with correct paste, mask and via handling
@@ -551,8 +551,7 @@ class ExposedPad(Node):
 
         return pads
 
-    def getVirtualChilds(self):
-        # traceback.print_stack()
+    def _createVirtualChilds(self):
         if self.has_vias:
             self.round_radius_handler.limitMaxRadius(self.via_size/2)
 
@@ -19,7 +19,7 @@
 from types import GeneratorType
 from KicadModTree.nodes.base.Pad import *
 from KicadModTree.nodes.specialized.ChamferedPad import *
-from KicadModTree.nodes.Node import Node
+from KicadModTree.nodes.Node import Node, _countRegeneration
 
 from KicadModTree.util.paramUtil import *
 
@@ -98,7 +98,7 @@ class PadArray(Node):
         self._initInitialNumber(**kwargs)
         self._initSpacing(**kwargs)
         self._initStartingPosition(**kwargs)
-        self.virtual_childs = self._createPads(**kwargs)
+        self._createPads(**kwargs)
 
     # How many pads in the array
     def _initPincount(self, **kwargs):
@@ -200,8 +200,13 @@ class PadArray(Node):
             raise ValueError('pad spacing ({sp}) must be non-zero'.format(sp=self.spacing))
 
     def _createPads(self, **kwargs):
+        r"""Prepare the pads of the array
 
-        pads = []
+        Numbers and positions of all pads are stored in flat lists. Only the pads which differ from the
+        others (end pads and the pin 1 marking of THT arrays) are created here, together with one regular
+        pad which validates the shared parameters. All other pads are copies of this pad, which are
+        created when getVirtualChilds is called for the first time.
+        """
 
         x_start, y_start = self.startingPosition
         x_spacing, y_spacing = self.spacing
@@ -242,57 +247,88 @@ class PadArray(Node):
         else:
             delta_pos = Vector2D(0, 0)
 
+        try:
+            exclude_pins = set(self.exclude_pin_list)
+        except TypeError:
+            exclude_pins = self.exclude_pin_list
+
+        # numbers and positions of all pads which are part of the array
+        self._pad_numbers = []
+        self._pad_positions = []
+
+        # pads which are already created, by index into the lists above
+        self._created_pads = {}
+        self._pad_template = None
+        self._virtual_childs = None
+
+        last_index = len(pad_numbers) - 1
+        is_tht = kwargs.get('type') == Pad.TYPE_THT
+        tht_pad1_id = kwargs.get('tht_pad1_id', 1)
+
         for i, number in enumerate(pad_numbers):
-            includePad = True
-
-            # deleted pins are filtered by pad/pin position (they are 'None' in pad_numbers list)
-            if type(number) not in [int, str]:
-                includePad = False
-
-            # hidden pins are filtered out by pad number (index of pad_numbers list)
-            if not kwargs.get('deleted_pins'):
-                if type(self.initialPin) == 'int':
-                    includePad = (self.initialPin + i) not in self.exclude_pin_list
-                else:
-                    includePad = number not in self.exclude_pin_list
-
-            if includePad:
-                current_pad_pos = Vector2D(
-                    x_start + i * x_spacing,
-                    y_start + i * y_spacing
-                    )
+            if kwargs.get('deleted_pins'):
+                # deleted pins are filtered by pad/pin position (they are 'None' in pad_numbers list)
+                if type(number) not in [int, str]:
+                    continue
+            elif number in exclude_pins:
+                # hidden pins are filtered out by pad number
+                continue
+
+            current_pad_pos = (x_start + i * x_spacing, y_start + i * y_spacing)
+
+            if i == 0 or i == last_index or (is_tht and number == tht_pad1_id):
+                current_pad_pos = Vector2D(current_pad_pos)
                 current_pad_params = copy(kwargs)
-                if i == 0 or i == len(pad_numbers)-1:
+                if i == 0 or i == last_index:
                     current_pad_pos += delta_pos
                     current_pad_params = end_pad_params
-                if kwargs.get('type') == Pad.TYPE_THT and number == kwargs.get('tht_pad1_id', 1):
-                    current_pad_params['shape'] = kwargs.get('tht_pad1_shape', Pad.SHAPE_ROUNDRECT)
-                    if 'radius_ratio' not in current_pad_params:
-                        current_pad_params['radius_ratio'] = 0.25
-                    if 'maximum_radius' not in current_pad_params:
-                        current_pad_params['maximum_radius'] = 0.25
-                else:
-                    current_pad_params['shape'] = padShape
-                if kwargs.get('chamfer_size'):
-                    if i == 0 and 'chamfer_corner_selection_first' in kwargs:
-                        pads.append(
-                            ChamferedPad(
-                                number=number, at=current_pad_pos,
-                                corner_selection=kwargs.get('chamfer_corner_selection_first'),
-                                **current_pad_params
-                                ))
-                        continue
-                    if i == len(pad_numbers)-1 and 'chamfer_corner_selection_last' in kwargs:
-                        pads.append(
-                            ChamferedPad(
-                                number=number, at=current_pad_pos,
-                                corner_selection=kwargs.get('chamfer_corner_selection_last'),
-                                **current_pad_params
-                                ))
-                        continue
-                pads.append(Pad(number=number, at=current_pad_pos, **current_pad_params))
-
-        return pads
+                pad = self._createPad(i, last_index, number, current_pad_pos, current_pad_params, **kwargs)
+                self._created_pads[len(self._pad_numbers)] = pad
+            elif self._pad_template is None:
+                # the first regular pad checks the parameters which are shared by all regular pads
+                current_pad_params = copy(kwargs)
+                current_pad_params['shape'] = padShape
+                self._pad_template = Pad(number=number, at=current_pad_pos, **current_pad_params)
+                self._created_pads[len(self._pad_numbers)] = self._pad_template
+
+            self._pad_numbers.append(number)
+            self._pad_positions.append(current_pad_pos)
+
+    def _createPad(self, i, last_index, number, current_pad_pos, current_pad_params, **kwargs):
+        if kwargs.get('type') == Pad.TYPE_THT and number == kwargs.get('tht_pad1_id', 1):
+            current_pad_params['shape'] = kwargs.get('tht_pad1_shape', Pad.SHAPE_ROUNDRECT)
+            if 'radius_ratio' not in current_pad_params:
+                current_pad_params['radius_ratio'] = 0.25
+            if 'maximum_radius' not in current_pad_params:
+                current_pad_params['maximum_radius'] = 0.25
+        else:
+            current_pad_params['shape'] = kwargs.get('shape')
+        if kwargs.get('chamfer_size'):
+            if i == 0 and 'chamfer_corner_selection_first' in kwargs:
+                return ChamferedPad(
+                    number=number, at=current_pad_pos,
+                    corner_selection=kwargs.get('chamfer_corner_selection_first'),
+                    **current_pad_params
+                    )
+            if i == last_index and 'chamfer_corner_selection_last' in kwargs:
+                return ChamferedPad(
+                    number=number, at=current_pad_pos,
+                    corner_selection=kwargs.get('chamfer_corner_selection_last'),
+                    **current_pad_params
+                    )
+        return Pad(number=number, at=current_pad_pos, **current_pad_params)
+
+    @property
+    def virtual_childs(self):
+        return self.getVirtualChilds()
 
     def getVirtualChilds(self):
-        return self.virtual_childs
+        if self._virtual_childs is None:
+            _countRegeneration(self)
+            created_pads = self._created_pads
+            template = self._pad_template
+            self._virtual_childs = [
+                created_pads[idx] if idx in created_pads else template._cloneAt(number, position)
+                for idx, (number, position) in enumerate(zip(self._pad_numbers, self._pad_positions))]
+
+        return self._virtual_childs
@@ -0,0 +1,133 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+from array import array
+
+from KicadModTree.nodes.base.Pad import Pad
+from KicadModTree.nodes.Node import Node
+from KicadModTree.util.kicad_util import lispString
+
+
+class PadPanel(Node):
+    r"""Add a big number of equal pads at arbitrary positions
+
+    All pads share the same parameters, only the number and the center of every pad are stored in the flat arrays
+    ``numbers``, ``xs`` and ``ys``.
+    No ``Pad`` node is created for the pads, the file handler writes them directly as ``(pad ...)`` elements.
+    The output is the same as for a ``Pad`` node per pad, appended at the position of the panel.
+
+    :param \**kwargs:
+        parameters of the pads like for ``Pad``, except of *number* and *at*
+
+    :Example:
+
+    >>> from KicadModTree import *
+    >>> panel = PadPanel(type=Pad.TYPE_SMT, shape=Pad.SHAPE_RECT, size=[0.1, 3.8], layers=['F.Cu', 'F.Mask'])
+    >>> panel.addPad(1, 0, 0)
+    >>> panel.addPads([2, 3], [0.2, 0.4], [0, 0])
+    """
+
+    def __init__(self, **kwargs):
+        Node.__init__(self)
+
+        if 'number' in kwargs or 'at' in kwargs:
+            raise KeyError('number and position of the pads are given with addPad')
+
+        # validates the parameters once for all pads
+        self.pad_template = Pad(number='', at=[0, 0], **kwargs)
+
+        self.numbers = []
+        self.xs = array('d')
+        self.ys = array('d')
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def _mirrored(self, x, y):
+        mirror_x, mirror_y = self.pad_template.mirror
+        if mirror_x is not None:
+            x = 2 * mirror_x - x
+        if mirror_y is not None:
+            y = 2 * mirror_y - y
+        return x, y
+
+    def addPad(self, number, x, y):
+        r"""Add a pad to the panel
+
+        :param number: number of the pad
+        :param x: x coordinate of the pad center
+        :param y: y coordinate of the pad center
+        """
+        x, y = self._mirrored(x, y)
+        self.numbers.append(number)
+        self.xs.append(x)
+        self.ys.append(y)
+
+    def addPads(self, numbers, xs, ys):
+        r"""Add multiple pads to the panel
+
+        :param numbers: numbers of the pads
+        :param xs: x coordinates of the pad centers
+        :param ys: y coordinates of the pad centers
+        """
+        if self.pad_template.mirror != [None, None]:
+            for number, x, y in zip(numbers, xs, ys):
+                self.addPad(number, x, y)
+            return
+
+        numbers = list(numbers)
+        xs = array('d', xs)
+        ys = array('d', ys)
+        if not len(numbers) == len(xs) == len(ys):
+            raise ValueError('numbers and coordinates of the pads must have the same length')
+
+        self.numbers.extend(numbers)
+        self.xs.extend(xs)
+        self.ys.extend(ys)
+
+    def getPadPositions(self):
+        r"""Get the number and center of all pads (before applying the transformations of the parent nodes)
+
+        :return: iterator over ``(number, x, y)``
+        """
+        return zip(self.numbers, self.xs, self.ys)
+
+    def getPads(self):
+        r"""Create a ``Pad`` node for every pad of the panel
+
+        The panel is not changed, the pads are not part of the tree.
+
+        :return: ``list`` of ``Pad``
+        """
+        template = self.pad_template
+        pads = []
+        for number, x, y in self.getPadPositions():
+            pad = template._cloneAt(number, [x, y])
+            pad.at.x, pad.at.y = x, y  # already mirrored by addPad
+            pads.append(pad)
+        return pads
+
+    def _getRenderTreeText(self):
+        template = self.pad_template
+        render_strings = ['{} pads'.format(len(self))]
+        render_strings.append(lispString(template.type))
+        render_strings.append(lispString(template.shape))
+        render_strings.append(template.size.render('(size {x} {y})'))
+        render_strings.append('(layers {})'.format(' '.join(template.layers)))
+
+        render_text = Node._getRenderTreeText(self)
+        render_text += ' ({})'.format(' '.join(render_strings))
+
+        return render_text
@@ -16,7 +16,7 @@
 from __future__ import division
 
 from copy import copy
-from KicadModTree.nodes.Node import Node
+from KicadModTree.nodes.Node import Node, GeneratedNode
 from KicadModTree.util.paramUtil import *
 from KicadModTree.util.geometric_util import geometricArc, geometricLine, BaseNodeIntersection
 from KicadModTree.Vector import *
@@ -27,7 +27,7 @@ from KicadModTree.nodes.base.Line import Line
 from math import sqrt, sin, cos, pi, ceil
 
 
-class RingPadPrimitive(Node):
+class RingPadPrimitive(GeneratedNode):
     r"""Add a RingPad to the render tree
 
     :param \**kwargs:
@@ -61,7 +61,7 @@ class RingPadPrimitive(Node):
                     number=self.number
                     )
 
-    def getVirtualChilds(self):
+    def _createVirtualChilds(self):
         return [Pad(number=self.number,
                     type=Pad.TYPE_SMT, shape=Pad.SHAPE_CUSTOM,
                     at=(self.at+Vector2D(self.radius, 0)),
@@ -74,7 +74,7 @@ class RingPadPrimitive(Node):
                     )]
 
 
-class ArcPadPrimitive(Node):
+class ArcPadPrimitive(GeneratedNode):
     r"""Add a RingPad to the render tree
 
     :param \**kwargs:
@@ -165,6 +165,7 @@ class ArcPadPrimitive(Node):
             self.start_line.rotate(angle=angle, origin=origin, use_degrees=use_degrees)
         if self.end_line is not None:
             self.end_line.rotate(angle=angle, origin=origin, use_degrees=use_degrees)
+        self.invalidateVirtualChilds()
         return self
 
     def translate(self, distance_vector):
@@ -180,6 +181,7 @@ class ArcPadPrimitive(Node):
             self.start_line.translate(distance_vector)
         if self.end_line is not None:
             self.end_line.translate(distance_vector)
+        self.invalidateVirtualChilds()
         return self
 
     def _getStep(self):
@@ -227,7 +229,7 @@ class ArcPadPrimitive(Node):
                                  "did not result in the expected number of arcs.")
         return result
 
-    def getVirtualChilds(self):
+    def _createVirtualChilds(self):
         at = self.reference_arc.getMidPoint()
         primitives = self._getArcPrimitives()
         for p in primitives:
@@ -35,25 +35,23 @@ class Rotation(Node):
         Node.__init__(self)
         self.rotation = r  # in degree
 
-    def getRealPosition(self, coordinate, rotation=None):
-        if rotation is None:
-            rotation = 0
+    @property
+    def rotation(self):
+        return self._rotation
 
-        parsed_coordinate = Vector2D(coordinate)
+    @rotation.setter
+    def rotation(self, value):
+        self._rotation = value
+        Node._invalidateTransformations()
 
+    def _getLocalTransformation(self):
         phi = self.rotation*math.pi/180
-        rotation_coordinate = {'x': parsed_coordinate.x*math.cos(phi) + parsed_coordinate.y*math.sin(phi),
-                               'y': -parsed_coordinate.x*math.sin(phi) + parsed_coordinate.y*math.cos(phi)}
-
-        if not self._parent:
-            if rotation is None:
-                return rotation_coordinate
-            else:
-                return rotation_coordinate, rotation + self.rotation
-        else:
-            if rotation is None:
-                rotation = 0
-            return self._parent.getRealPosition(rotation_coordinate, rotation + self.rotation)
+        cos_phi = math.cos(phi)
+        sin_phi = math.sin(phi)
+
+        return (cos_phi, sin_phi, 0.,
+                -sin_phi, cos_phi, 0.,
+                self.rotation)
 
     def _getRenderTreeText(self):
         render_text = Node._getRenderTreeText(self)
@@ -13,16 +13,45 @@
 #
 # (C) 2016 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
 
-from .Translation import Translation
-from .Rotation import Rotation
+from KicadModTree.util.lazy_import import lazyImport
 
-from .PolygoneLine import PolygoneLine
-from .RectLine import RectLine
-from .RectFill import RectFill
-from .FilledRect import FilledRect
+_NODES = {
+    'Translation': '.Translation',
+    'Rotation': '.Rotation',
 
-from .PadArray import PadArray
-from .ExposedPad import ExposedPad
-from .ChamferedPad import ChamferedPad, CornerSelection
-from .ChamferedPadGrid import *
-from .RingPad import RingPad
+    'PolygoneLine': '.PolygoneLine',
+    'RectLine': '.RectLine',
+    'RectFill': '.RectFill',
+    'FilledRect': '.FilledRect',
+
+    'PadArray': '.PadArray',
+    'PadPanel': '.PadPanel',
+    'ExposedPad': '.ExposedPad',
+    'ChamferedPad': '.ChamferedPad',
+    'CornerSelection': '.ChamferedPad',
+    'ChamferedPadGrid': '.ChamferedPadGrid',
+    'ChamferSelPadGrid': '.ChamferedPadGrid',
+    'RingPad': '.RingPad',
+}
+
+# exported by the former "from .ChamferedPadGrid import *", kept for scripts which rely on them
+_COMPATIBILITY = {
+    'Node': 'KicadModTree.nodes.Node',
+    'GeneratedNode': 'KicadModTree.nodes.Node',
+    'Pad': 'KicadModTree.nodes.base.Pad',
+    'RoundRadiusHandler': 'KicadModTree.nodes.base.Pad',
+    'Polygon': 'KicadModTree.nodes.base.Polygon',
+    'PolygonPoints': 'KicadModTree.PolygonPoints',
+    'copy': 'KicadModTree.nodes.specialized.ChamferedPad',
+}
+_COMPATIBILITY.update((name, 'KicadModTree.util.paramUtil') for name in (
+    'getOptionalNumberTypeParam', 'isAnyLarger', 'round_to', 'toFloatArray', 'toIntArray', 'toNumberArray',
+    'toVectorUseCopyIfNumber'
+))
+_COMPATIBILITY.update((name, 'KicadModTree.Vector') for name in (
+    'Vector2D', 'Vector3D', 'atan2', 'cos', 'degrees', 'division', 'formatFloat', 'hypot', 'radians', 'round',
+    'sin', 'sqrt', 'warnings'
+))
+
+# the nodes are imported when they are used for the first time
+lazyImport(globals(), {name: (module, name) for name, module in list(_COMPATIBILITY.items()) + list(_NODES.items())})
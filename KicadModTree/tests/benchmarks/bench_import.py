@@ -0,0 +1,50 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+'''
+Measure the startup time of KicadModTree with "python -X importtime" (requires python 3.7).
+
+Every statement is run in a new interpreter, the minimum over all repetitions is reported.
+
+usage: python KicadModTree/tests/benchmarks/bench_import.py [repeat]
+'''
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "../../../"))
+
+from KicadModTree.tests.util.test_lazy_import import importTime, kicadModules  # NOQA
+
+STATEMENTS = ["import KicadModTree",
+              "from KicadModTree import Footprint, Pad, Text",
+              "from KicadModTree import Footprint, Pad, Text, KicadFileHandler",
+              "from KicadModTree import *"]
+
+
+def run(repeat=5):
+    for statement in STATEMENTS:
+        runs = [importTime(statement) for _ in range(repeat)]
+        total = min(t for _, t in runs)
+        print("{:65s} {:7.2f} ms {:3d} modules".format(statement, total / 1000.0, len(kicadModules(runs[0][0]))))
+
+    modules, _ = importTime("from KicadModTree import *")
+    print("\nslowest modules of 'from KicadModTree import *' (cumulative):")
+    for name in sorted(modules, key=modules.get, reverse=True)[1:11]:
+        print("  {:55s} {:7.2f} ms".format(name, modules[name] / 1000.0))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
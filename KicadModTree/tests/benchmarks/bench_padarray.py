@@ -0,0 +1,178 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2016 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+'''
+Compare the bulk mode of PadArray against creating and validating every pad on construction.
+
+usage: python KicadModTree/tests/benchmarks/bench_padarray.py
+'''
+
+import os
+import sys
+import timeit
+
+from copy import copy
+from types import GeneratorType
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "../../../"))
+
+from KicadModTree import *  # NOQA
+from KicadModTree.util.paramUtil import toVectorUseCopyIfNumber
+
+
+class LegacyPadArray(PadArray):
+    '''
+    PadArray as it was implemented before the bulk mode (used as reference)
+    '''
+
+    def __init__(self, **kwargs):
+        Node.__init__(self)
+        self._initPincount(**kwargs)
+        self._initIncrement(**kwargs)
+        self._initInitialNumber(**kwargs)
+        self._initSpacing(**kwargs)
+        self._initStartingPosition(**kwargs)
+        self._legacy_pads = self._createPads(**kwargs)
+
+    def _createPads(self, **kwargs):
+
+        pads = []
+
+        x_start, y_start = self.startingPosition
+        x_spacing, y_spacing = self.spacing
+
+        padShape = kwargs.get('shape')
+
+        # Special case, increment = 0
+        # this can be used for creating an array with all the same pad number
+        if self.increment == 0:
+            pad_numbers = [self.initialPin] * self.pincount
+        elif type(self.increment) == int:
+            pad_numbers = range(self.initialPin, self.initialPin + (self.pincount * self.increment), self.increment)
+        elif callable(self.increment):
+            pad_numbers = [self.initialPin]
+            for idx in range(1, self.pincount):
+                pad_numbers.append(self.increment(pad_numbers[-1]))
+        elif type(self.increment) == GeneratorType:
+            pad_numbers = [next(self.increment) for i in range(self.pincount)]
+        else:
+            raise TypeError("Wrong type for increment. It must be either a int, callable or generator.")
+
+        end_pad_params = copy(kwargs)
+        if kwargs.get('end_pads_size_reduction'):
+            size_reduction = kwargs['end_pads_size_reduction']
+            end_pad_params['size'] = toVectorUseCopyIfNumber(kwargs.get('size'), low_limit=0)
+
+            delta_size = Vector2D(
+                size_reduction.get('x+', 0) + size_reduction.get('x-', 0),
+                size_reduction.get('y+', 0) + size_reduction.get('y-', 0)
+                )
+
+            end_pad_params['size'] -= delta_size
+
+            delta_pos = Vector2D(
+                -size_reduction.get('x+', 0) + size_reduction.get('x-', 0),
+                -size_reduction.get('y+', 0) + size_reduction.get('y-', 0)
+                )/2
+        else:
+            delta_pos = Vector2D(0, 0)
+
+        for i, number in enumerate(pad_numbers):
+            includePad = True
+
+            # deleted pins are filtered by pad/pin position (they are 'None' in pad_numbers list)
+            if type(number) not in [int, str]:
+                includePad = False
+
+            # hidden pins are filtered out by pad number (index of pad_numbers list)
+            if not kwargs.get('deleted_pins'):
+                if type(self.initialPin) == 'int':
+                    includePad = (self.initialPin + i) not in self.exclude_pin_list
+                else:
+                    includePad = number not in self.exclude_pin_list
+
+            if includePad:
+                current_pad_pos = Vector2D(
+                    x_start + i * x_spacing,
+                    y_start + i * y_spacing
+                    )
+                current_pad_params = copy(kwargs)
+                if i == 0 or i == len(pad_numbers)-1:
+                    current_pad_pos += delta_pos
+                    current_pad_params = end_pad_params
+                if kwargs.get('type') == Pad.TYPE_THT and number == kwargs.get('tht_pad1_id', 1):
+                    current_pad_params['shape'] = kwargs.get('tht_pad1_shape', Pad.SHAPE_ROUNDRECT)
+                    if 'radius_ratio' not in current_pad_params:
+                        current_pad_params['radius_ratio'] = 0.25
+                    if 'maximum_radius' not in current_pad_params:
+                        current_pad_params['maximum_radius'] = 0.25
+                else:
+                    current_pad_params['shape'] = padShape
+                if kwargs.get('chamfer_size'):
+                    if i == 0 and 'chamfer_corner_selection_first' in kwargs:
+                        pads.append(
+                            ChamferedPad(
+                                number=number, at=current_pad_pos,
+                                corner_selection=kwargs.get('chamfer_corner_selection_first'),
+                                **current_pad_params
+                                ))
+                        continue
+                    if i == len(pad_numbers)-1 and 'chamfer_corner_selection_last' in kwargs:
+                        pads.append(
+                            ChamferedPad(
+                                number=number, at=current_pad_pos,
+                                corner_selection=kwargs.get('chamfer_corner_selection_last'),
+                                **current_pad_params
+                                ))
+                        continue
+                pads.append(Pad(number=number, at=current_pad_pos, **current_pad_params))
+
+        return pads
+
+    def getVirtualChilds(self):
+        return self._legacy_pads
+
+
+PARAMETERS = dict(pincount=2000, spacing=[0.5, 0], center=[0, 0], hidden_pins=[7, 300, 1500],
+                  type=Pad.TYPE_THT, shape=Pad.SHAPE_OVAL, size=[0.3, 1.2], drill=0.2, layers=Pad.LAYERS_THT)
+
+
+def serialize(pad_array_type):
+    kicad_mod = Footprint("benchmark_pad_array")
+    kicad_mod.append(pad_array_type(**PARAMETERS))
+    return KicadFileHandler(kicad_mod).serialize(timestamp=0)
+
+
+def run(repeat=5):
+    assert serialize(LegacyPadArray) == serialize(PadArray), "serialized output differs"
+
+    t_legacy = min(timeit.repeat(lambda: LegacyPadArray(**PARAMETERS), number=1, repeat=repeat))
+    t_bulk = min(timeit.repeat(lambda: PadArray(**PARAMETERS), number=1, repeat=repeat))
+    t_bulk_pads = min(timeit.repeat(lambda: PadArray(**PARAMETERS).getVirtualChilds(), number=1, repeat=repeat))
+    t_legacy_serialize = min(timeit.repeat(lambda: serialize(LegacyPadArray), number=1, repeat=repeat))
+    t_bulk_serialize = min(timeit.repeat(lambda: serialize(PadArray), number=1, repeat=repeat))
+
+    print("pad array: {} pads".format(PARAMETERS['pincount']))
+    print("legacy construction:         {:8.2f} ms".format(t_legacy*1000))
+    print("bulk construction:           {:8.2f} ms".format(t_bulk*1000))
+    print("bulk construction + pads:    {:8.2f} ms ({:.2f}x)".format(t_bulk_pads*1000, t_legacy/t_bulk_pads))
+    print("legacy construct+serialize:  {:8.2f} ms".format(t_legacy_serialize*1000))
+    print("bulk construct+serialize:    {:8.2f} ms ({:.2f}x)".format(t_bulk_serialize*1000,
+                                                                       t_legacy_serialize/t_bulk_serialize))
+
+
+if __name__ == '__main__':
+    run()
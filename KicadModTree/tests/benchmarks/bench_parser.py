@@ -0,0 +1,147 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2016 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+'''
+Compare the single pass regex scanner of parseLispString against the previous tokenizer,
+and measure how long it takes to load a footprint into a node tree.
+
+usage: python KicadModTree/tests/benchmarks/bench_parser.py
+'''
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "../../../"))
+
+from KicadModTree import *  # NOQA
+from KicadModTree.util.kicad_util import parseLispString
+
+from bench_serializer import create_footprint
+
+
+# tokenizer and parser as they were implemented before the regex scanner (used as reference)
+
+def legacy_lispTokenizer(input):
+    '''
+    Convert a string of characters into a list of tokens.
+    '''
+    input = input.replace('(', ' ( ').replace(')', ' ) ')
+
+    # split input, including whitespaces
+    base_tokens = re.split(r'(\s+)', input)
+
+    tokens = []
+    in_string = False
+
+    for token in base_tokens:
+        if not in_string and token.isspace():
+            continue
+
+        if len(token) == 0:
+            continue
+
+        if token[0] == '"':
+            if in_string:
+                tokens[-1] += token[1:]
+                in_string = False
+            else:
+                tokens.append(token[1:])
+                in_string = True
+
+        elif token[-1] == '"':
+            if in_string:
+                tokens[-1] += token[:-1]
+                in_string = False
+            else:
+                tokens.append(token[:-1])
+                in_string = True
+
+        else:
+            if in_string:
+                tokens[-1] += token
+            else:
+                tokens.append(token)
+
+    if in_string:
+        raise RuntimeError("missing closing quotation mark")
+
+    # TOOD: remove invalid spaces from quotation (when having brackets inside)
+
+    return tokens
+
+
+def legacy_parseLispString(input):
+    syntax_tree = []
+    current_node = syntax_tree
+    scope = [syntax_tree]
+
+    for token in legacy_lispTokenizer(input):
+        if token == "(":
+            scope.append([])
+            current_node.append(scope[-1])
+            current_node = scope[-1]
+
+        elif token == ")":
+            if len(scope) <= 1:
+                raise RuntimeError("missing opening brackets")
+
+            scope.pop()
+            current_node = scope[-1]
+
+        else:
+            current_node.append(token)
+
+    if len(scope) > 1:
+        raise RuntimeError("missing closing brackets")
+
+    if len(syntax_tree) == 1:
+        syntax_tree = syntax_tree[0]
+
+    return syntax_tree
+
+
+def run(repeat=5):
+    kicad_mod = create_footprint()
+    content = KicadFileHandler(kicad_mod).serialize(timestamp=0)
+
+    # the legacy tokenizer does not handle empty strings (like the number of paste pads), so
+    # its result is not compared, only the time it takes
+    assert KicadFileHandler(KicadModParser().parse(content)).serialize(timestamp=0) == content, \
+        "footprint changed after reading it"
+
+    def legacy():
+        legacy_parseLispString(content)
+
+    def scanner():
+        parseLispString(content)
+
+    def node_tree():
+        KicadModParser().parse(content)
+
+    t_legacy = min(timeit.repeat(legacy, number=1, repeat=repeat))
+    t_scanner = min(timeit.repeat(scanner, number=1, repeat=repeat))
+    t_node_tree = min(timeit.repeat(node_tree, number=1, repeat=repeat))
+
+    print("footprint: {} ({} bytes)".format(kicad_mod.name, len(content)))
+    print("legacy parser:     {:8.2f} ms".format(t_legacy*1000))
+    print("regex scanner:     {:8.2f} ms".format(t_scanner*1000))
+    print("speedup:           {:8.2f}x".format(t_legacy/t_scanner))
+    print("load node tree:    {:8.2f} ms".format(t_node_tree*1000))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,87 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+'''
+Compare the streaming render tree writer against the previous recursive string concatenation, and the summary
+mode used by the Z-Axis builders, on a flat footprint with many lines and on deeply nested translations.
+
+usage: python KicadModTree/tests/benchmarks/bench_render_tree.py
+'''
+
+import io
+import time
+
+from KicadModTree import *
+
+
+def legacy_getRenderTree(node):
+    # implementation before the streaming writer (used as reference)
+    tree_str = "{0} {1}".format(node._getRenderTreeSymbol(), node._getRenderTreeText())
+    for child in node.getNormalChilds():
+        tree_str += '\n  '
+        tree_str += '  '.join(legacy_getRenderTree(child).splitlines(True))
+    return tree_str
+
+
+def flatFootprint(lines=20000):
+    kicad_mod = Footprint("flat")
+    for i in range(lines):
+        kicad_mod.append(Line(start=[i, 0], end=[i, 1], layer='F.Cu'))
+    return kicad_mod
+
+
+def nestedFootprint(depth=400, lines=5):
+    kicad_mod = Footprint("nested")
+    parent = kicad_mod
+    for _ in range(depth):
+        node = Translation(0.1, 0)
+        for i in range(lines):
+            node.append(Line(start=[i, 0], end=[i, 1], layer='F.Cu'))
+        parent.append(node)
+        parent = node
+    return kicad_mod
+
+
+def summary(kicad_mod):
+    stream = io.StringIO()
+    kicad_mod.writeRenderTree(stream, max_depth=1, max_childs=20)
+    return stream.getvalue()
+
+
+def timeFunction(function, kicad_mod, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        result = function(kicad_mod)
+        seconds = time.time() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+
+def run(repeat=3):
+    for name, kicad_mod in (("20000 lines", flatFootprint()), ("400 nested translations", nestedFootprint())):
+        print("{}:".format(name))
+        seconds, expected = timeFunction(legacy_getRenderTree, kicad_mod, repeat)
+        print("  {:35s} {:10.2f} ms".format("recursive concatenation (before)", seconds * 1000))
+        seconds, result = timeFunction(Node.getRenderTree, kicad_mod, repeat)
+        print("  {:35s} {:10.2f} ms  {}".format("getRenderTree", seconds * 1000,
+                                                "equal" if result == expected else "DIFFERENT"))
+        seconds, result = timeFunction(summary, kicad_mod, repeat)
+        print("  {:35s} {:10.2f} ms  {} lines".format("summary (depth 1, 20 childs)", seconds * 1000,
+                                                       result.count('\n')))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,183 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2016 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+'''
+Compare the serializer registry of KicadFileHandler against grouping the nodes by their class name.
+
+usage: python KicadModTree/tests/benchmarks/bench_serialize_tree.py
+'''
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "../../../"))
+
+from KicadModTree import *  # NOQA
+from KicadModTree.KicadFileHandler import DEFAULT_WIDTH_POLYGON_PAD
+from KicadModTree.util.kicad_util import SexprSerializer
+
+
+class LegacyKicadFileHandler(KicadFileHandler):
+    '''
+    Grouping and dispatching as it was implemented before the serializer registry (used as reference)
+    '''
+
+    def _serializeTree(self):
+        nodes = self.kicad_mod.serialize()
+
+        grouped_nodes = {}
+
+        for single_node in nodes:
+            node_type = single_node.__class__.__name__
+
+            current_nodes = grouped_nodes.get(node_type, [])
+            current_nodes.append(single_node)
+
+            grouped_nodes[node_type] = current_nodes
+
+        sexpr = []
+
+        # serialize initial text nodes
+        if 'Text' in grouped_nodes:
+            reference_nodes = list(filter(lambda node: node.type == 'reference', grouped_nodes['Text']))
+            for node in reference_nodes:
+                sexpr.append(self._serialize_Text(node))
+                sexpr.append(SexprSerializer.NEW_LINE)
+                grouped_nodes['Text'].remove(node)
+
+            value_nodes = list(filter(lambda node: node.type == 'value', grouped_nodes['Text']))
+            for node in value_nodes:
+                sexpr.append(self._serialize_Text(node))
+                sexpr.append(SexprSerializer.NEW_LINE)
+                grouped_nodes['Text'].remove(node)
+
+        for key, value in sorted(grouped_nodes.items()):
+            # check if key is a base node, except Model
+            if key not in {'Arc', 'Circle', 'Line', 'Pad', 'Polygon', 'Text'}:
+                continue
+
+            # render base nodes
+            for node in value:
+                sexpr.append(self._callSerialize(node))
+                sexpr.append(SexprSerializer.NEW_LINE)
+
+        # serialize 3D Models at the end
+        if grouped_nodes.get('Model'):
+            for node in grouped_nodes.get('Model'):
+                sexpr.append(self._serialize_Model(node))
+                sexpr.append(SexprSerializer.NEW_LINE)
+
+        return sexpr
+
+    def _callSerialize(self, node):
+        method_type = node.__class__.__name__
+        method_name = "_serialize_{0}".format(method_type)
+        if hasattr(self, method_name):
+            return getattr(self, method_name)(node)
+        else:
+            exception_string = "{name} (node) not found, cannot serialized the node of type {type}"
+            raise NotImplementedError(exception_string.format(name=method_name, type=method_type))
+
+    def _serialize_CustomPadPrimitives(self, pad):
+        all_primitives = []
+        for p in pad.primitives:
+            all_primitives.extend(p.serialize())
+
+        grouped_nodes = {}
+
+        for single_node in all_primitives:
+            node_type = single_node.__class__.__name__
+
+            current_nodes = grouped_nodes.get(node_type, [])
+            current_nodes.append(single_node)
+
+            grouped_nodes[node_type] = current_nodes
+
+        sexpr_primitives = []
+
+        for key, value in sorted(grouped_nodes.items()):
+            # check if key is a base node, except Model
+            if key not in {'Arc', 'Circle', 'Line', 'Pad', 'Polygon', 'Text'}:
+                continue
+
+            # render base nodes
+            for p in value:
+                if isinstance(p, Polygon):
+                    sp = ['gr_poly',
+                          self._serialize_PolygonPoints(p, newline_after_pts=True)
+                         ]  # NOQA
+                elif isinstance(p, Line):
+                    sp = ['gr_line'] + self._serialize_LinePoints(p)
+                elif isinstance(p, Circle):
+                    sp = ['gr_circle'] + self._serialize_CirclePoints(p)
+                elif isinstance(p, Arc):
+                    sp = ['gr_arc'] + self._serialize_ArcPoints(p)
+                else:
+                    raise TypeError('Unsuported type of primitive for custom pad.')
+                sp.append(['width', DEFAULT_WIDTH_POLYGON_PAD if p.width is None else p.width])
+                sexpr_primitives.append(sp)
+                sexpr_primitives.append(SexprSerializer.NEW_LINE)
+
+        return sexpr_primitives
+
+
+def create_bga():
+    # 45x45 ball grid with 2025 pads, a silkscreen outline and many user texts
+    kicad_mod = Footprint("benchmark_bga")
+    kicad_mod.append(Text(type='user', text='%R', at=[0, 0], layer='F.Fab'))
+    kicad_mod.append(Text(type='reference', text='REF**', at=[0, -25], layer='F.SilkS'))
+    kicad_mod.append(Text(type='value', text='benchmark_bga', at=[0, 25], layer='F.Fab'))
+    for row in range(45):
+        kicad_mod.append(PadArray(pincount=45, spacing=[0.8, 0], center=[0, (row-22)*0.8], initial=row*45+1,
+                                  type=Pad.TYPE_SMT, shape=Pad.SHAPE_CIRCLE, size=0.4, layers=Pad.LAYERS_SMT))
+        kicad_mod.append(Text(type='user', text='row {}'.format(row), at=[-20, (row-22)*0.8], layer='Cmts.User'))
+    kicad_mod.append(RectLine(start=[-19, -19], end=[19, 19], layer='F.SilkS'))
+    kicad_mod.append(Model(filename='benchmark_bga.wrl'))
+    return kicad_mod
+
+
+def create_qfn():
+    # 500 custom pads with primitives on each side of a large QFN
+    kicad_mod = Footprint("benchmark_qfn")
+    kicad_mod.append(Text(type='reference', text='REF**', at=[0, -5], layer='F.SilkS'))
+    for i in range(2000):
+        rotation = Rotation((i // 500) * 90)
+        rotation.append(Pad(number=i+1, type=Pad.TYPE_SMT, shape=Pad.SHAPE_CUSTOM, at=[(i % 500)*0.4-100, 102],
+                            size=0.2, layers=Pad.LAYERS_SMT,
+                            primitives=[Polygon(nodes=[(-0.1, -0.4), (0.1, -0.4), (0.1, 0.4), (-0.1, 0.4)]),
+                                        Circle(center=(0, 0.4), radius=0.1), Line(start=(0, 0), end=(0, -0.5))]))
+        kicad_mod.append(rotation)
+    return kicad_mod
+
+
+def run(repeat=5):
+    for name, kicad_mod in (('bga', create_bga()), ('qfn', create_qfn())):
+        assert LegacyKicadFileHandler(kicad_mod).serialize(timestamp=0) == \
+            KicadFileHandler(kicad_mod).serialize(timestamp=0), "serialized output differs"
+
+        t_legacy = min(timeit.repeat(lambda: LegacyKicadFileHandler(kicad_mod)._serializeTree(),
+                                     number=1, repeat=repeat))
+        t_registry = min(timeit.repeat(lambda: KicadFileHandler(kicad_mod)._serializeTree(),
+                                       number=1, repeat=repeat))
+
+        print("{}: {} nodes".format(name, len(kicad_mod.serialize())))
+        print("  legacy grouping:    {:8.2f} ms".format(t_legacy*1000))
+        print("  registry grouping:  {:8.2f} ms ({:.2f}x)".format(t_registry*1000, t_legacy/t_registry))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,127 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2016 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+'''
+Compare the streaming SexprSerializer against the previous recursive string concatenation.
+
+usage: python KicadModTree/tests/benchmarks/bench_serializer.py
+'''
+
+import io
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "../../../"))
+
+from KicadModTree import *  # NOQA
+from KicadModTree.util.kicad_util import SexprSerializer
+
+
+class LegacySexprSerializer(SexprSerializer):
+    '''
+    Serializer as it was implemented before streaming support (used as reference)
+    '''
+
+    def sexpr_to_string(self, sexpr, prefix=None):
+        if prefix is None:
+            prefix = ""
+
+        serial_string = "("
+        loop_ctrl = {'first': True, 'indentation': False}
+
+        def get_separator():
+            if loop_ctrl['first']:
+                loop_ctrl['first'] = False
+                return_str = ""
+            else:
+                return_str = " "
+
+            if loop_ctrl['indentation']:
+                return_str += " "
+                loop_ctrl['indentation'] = False
+
+            return return_str
+
+        for attr in sexpr:
+            if isinstance(attr, (tuple, list)):
+                return_string = self.sexpr_to_string(attr, prefix + " ")
+
+                if loop_ctrl['indentation']:
+                    return_string = return_string.replace('\n', '\n ')
+                serial_string += get_separator()
+
+                serial_string += return_string
+            elif attr == SexprSerializer.NEW_LINE:
+                serial_string += "\n"
+                serial_string += prefix
+                loop_ctrl['indentation'] = True
+            else:
+                serial_string += get_separator()
+                serial_string += self.primitive_to_string(attr)
+
+        serial_string += ")"
+        return serial_string
+
+
+def create_footprint(pads_per_side=300):
+    kicad_mod = Footprint("benchmark_{}".format(4*pads_per_side))
+    kicad_mod.setDescription("benchmark footprint with {} pads".format(4*pads_per_side))
+    kicad_mod.append(Text(type='reference', text='REF**', at=[0, -3], layer='F.SilkS'))
+    kicad_mod.append(Text(type='value', text=kicad_mod.name, at=[0, 3], layer='F.Fab'))
+
+    length = pads_per_side*0.5
+    for i, (center, spacing, rotation) in enumerate([
+            ([0, -length/2], [0.5, 0], 0), ([length/2, 0], [0, 0.5], 90),
+            ([0, length/2], [-0.5, 0], 0), ([-length/2, 0], [0, -0.5], 90)]):
+        kicad_mod.append(PadArray(pincount=pads_per_side, initial=1+i*pads_per_side, spacing=spacing,
+                                  center=center, rotation=rotation, type=Pad.TYPE_SMT,
+                                  shape=Pad.SHAPE_ROUNDRECT, size=[0.25, 1], layers=Pad.LAYERS_SMT))
+
+    kicad_mod.append(ExposedPad(number=4*pads_per_side+1, size=[10, 10], paste_layout=[8, 8],
+                                via_layout=[6, 6], via_drill=0.3, via_grid=[1.5, 1.5]))
+    kicad_mod.append(RectLine(start=[-length/2-2, -length/2-2], end=[length/2+2, length/2+2], layer='F.SilkS'))
+
+    return kicad_mod
+
+
+def run(repeat=5):
+    kicad_mod = create_footprint()
+    file_handler = KicadFileHandler(kicad_mod)
+    sexpr = file_handler._serializeFootprint(timestamp=0)
+
+    reference = str(LegacySexprSerializer(sexpr))
+    stream = io.StringIO()
+    SexprSerializer(sexpr).write(stream)
+    assert stream.getvalue() == reference, "streaming serializer output differs"
+
+    def legacy():
+        str(LegacySexprSerializer(sexpr))
+
+    def streaming():
+        SexprSerializer(sexpr).write(io.StringIO())
+
+    t_legacy = min(timeit.repeat(legacy, number=1, repeat=repeat))
+    t_streaming = min(timeit.repeat(streaming, number=1, repeat=repeat))
+
+    print("footprint: {} ({} output lines)".format(kicad_mod.name, reference.count('\n')+1))
+    print("legacy serializer:    {:8.2f} ms".format(t_legacy*1000))
+    print("streaming serializer: {:8.2f} ms".format(t_streaming*1000))
+    print("speedup:              {:8.2f}x".format(t_legacy/t_streaming))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,146 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2016 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+'''
+Compare the slotted Vector2D against the previous dict based implementation (time and memory).
+
+usage: python KicadModTree/tests/benchmarks/bench_vector.py
+'''
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+from math import sin, cos, radians
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "../../../"))
+
+from KicadModTree import *  # NOQA
+
+
+class LegacyVector2D(object):
+    '''
+    The parts of Vector2D used by this benchmark, as they were implemented before (used as reference)
+    '''
+
+    def __init__(self, coordinates=None, y=None):
+        if coordinates is None:
+            coordinates = {}
+        elif type(coordinates) in [int, float]:
+            if y is not None:
+                coordinates = [coordinates, y]
+            else:
+                raise TypeError('you have to give x and y coordinate')
+        elif isinstance(coordinates, LegacyVector2D):
+            coordinates = coordinates.to_dict()
+
+        if type(coordinates) is dict:
+            self.x = float(coordinates.get('x', 0.))
+            self.y = float(coordinates.get('y', 0.))
+            return
+
+        if type(coordinates) in [list, tuple]:
+            if len(coordinates) == 2:
+                self.x = float(coordinates[0])
+                self.y = float(coordinates[1])
+                return
+            else:
+                raise TypeError('invalid list size (2 elements expected)')
+
+        raise TypeError('invalid parameters given')
+
+    @staticmethod
+    def __arithmetic_parse(value):
+        if isinstance(value, LegacyVector2D):
+            return value
+        elif type(value) in [int, float]:
+            return LegacyVector2D([value, value])
+        else:
+            return LegacyVector2D(value)
+
+    def __add__(self, value):
+        other = LegacyVector2D.__arithmetic_parse(value)
+        return LegacyVector2D({'x': self.x + other.x, 'y': self.y + other.y})
+
+    def __sub__(self, value):
+        other = LegacyVector2D.__arithmetic_parse(value)
+        return LegacyVector2D({'x': self.x - other.x, 'y': self.y - other.y})
+
+    def __mul__(self, value):
+        other = LegacyVector2D.__arithmetic_parse(value)
+        return LegacyVector2D({'x': self.x * other.x, 'y': self.y * other.y})
+
+    def to_dict(self):
+        return {'x': self.x, 'y': self.y}
+
+    def __copy__(self):
+        return LegacyVector2D(self.x, self.y)
+
+    def rotate(self, angle, origin=(0, 0), use_degrees=True):
+        op = LegacyVector2D(origin)
+
+        if use_degrees:
+            angle = radians(angle)
+
+        temp = op.x + cos(angle) * (self.x - op.x) - sin(angle) * (self.y - op.y)
+        self.y = op.y + sin(angle) * (self.x - op.x) + cos(angle) * (self.y - op.y)
+        self.x = temp
+
+        return self
+
+
+def workload(vector_type, count=20000):
+    '''
+    typical usage inside of the generators: create points, offset, scale and rotate them
+    '''
+    offset = vector_type(0.5, -0.25)
+    points = []
+    for i in range(count):
+        p = vector_type(i * 0.1, -i * 0.1)
+        p = (p + offset) * 2 - [1, 1]
+        p = vector_type(p).rotate(90, origin=offset)
+        points.append(p)
+    return points
+
+
+def allocated(vector_type, count=20000):
+    tracemalloc.start()
+    points = [vector_type(i, i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del points
+    return size / count
+
+
+def run(repeat=5):
+    legacy_points = workload(LegacyVector2D)
+    points = workload(Vector2D)
+    assert [(p.x, p.y) for p in points] == [(p.x, p.y) for p in legacy_points], "results differ"
+
+    t_legacy = min(timeit.repeat(lambda: workload(LegacyVector2D), number=1, repeat=repeat))
+    t_slotted = min(timeit.repeat(lambda: workload(Vector2D), number=1, repeat=repeat))
+
+    print("workload: 20000 points (create, add, multiply, subtract list, copy, rotate)")
+    print("legacy Vector2D:  {:8.2f} ms".format(t_legacy*1000))
+    print("slotted Vector2D: {:8.2f} ms".format(t_slotted*1000))
+    print("speedup:          {:8.2f}x".format(t_legacy/t_slotted))
+    print("memory per instance: legacy {:.0f} bytes, slotted {:.0f} bytes".format(
+        allocated(LegacyVector2D), allocated(Vector2D)))
+
+
+if __name__ == '__main__':
+    run()
@@ -191,3 +191,13 @@ class Vector2DTests(unittest.TestCase):
         r, a = p1.to_polar(use_degrees=True)
         self.assertAlmostEqual(r, math.sqrt(2))
         self.assertAlmostEqual(a, -135)
+
+    def test_memory_layout(self):
+        p1 = Vector2D()
+        self.assertEqual((p1.x, p1.y), (0, 0))
+        self.assertFalse(hasattr(p1, '__dict__'))
+        self.assertRaises(AttributeError, setattr, p1, 'z', 1)
+
+        p2 = Vector2D(Vector3D(1, 2, 3))
+        self.assertEqual(type(p2), Vector2D)
+        self.assertEqual(p2, Vector2D(1, 2))
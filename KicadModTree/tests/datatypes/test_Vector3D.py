@@ -208,3 +208,21 @@ class Vector3DTests(unittest.TestCase):
 
         # TODO: division by zero tests
         # TODO: invalid type tests
+
+    def test_inplace(self):
+        p1 = Vector3D([1, 2, 3])
+        p1 += 1
+        self.assertEqual(p1, Vector3D(2, 3, 4))
+
+        p1 -= [1, 1, 1]
+        self.assertEqual(p1, Vector3D(1, 2, 3))
+
+        p2 = -p1
+        self.assertIsInstance(p2, Vector3D)
+        self.assertEqual(p2, Vector3D(-1, -2, -3))
+
+    def test_memory_layout(self):
+        p1 = Vector3D()
+        self.assertEqual((p1.x, p1.y, p1.z), (0, 0, 0))
+        self.assertFalse(hasattr(p1, '__dict__'))
+        self.assertRaises(AttributeError, setattr, p1, 'w', 1)
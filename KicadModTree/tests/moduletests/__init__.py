@@ -18,3 +18,10 @@ from .test_kicad5_padshapes import Kicad5PadsTests
 from .test_exposed_pad import ExposedPadTests
 from .test_arc import ArcTests
 from .test_rotation import RotationTests
+from .test_file_handler import FileHandlerTests
+from .test_kicad_mod_parser import KicadModParserTests
+from .test_pad_array import PadArrayTests
+from .test_generated_node import GeneratedNodeTests
+from .test_mod_argparser import ModArgparserTests
+from .test_pad_panel import PadPanelTests
+from .test_render_tree import RenderTreeTests
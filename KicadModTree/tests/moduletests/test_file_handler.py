@@ -0,0 +1,148 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+import io
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from KicadModTree import *
+from KicadModTree.FileHandler import TIMESTAMP_MODE_ENV, SOURCE_DATE_EPOCH_ENV
+
+
+def create_footprint(pad_size=0.5):
+    kicad_mod = Footprint("test")
+    kicad_mod.append(Text(type='reference', text='REF**', at=[0, -3], layer='F.SilkS'))
+    kicad_mod.append(PadArray(pincount=4, spacing=[1, 0], center=[0, 0], type=Pad.TYPE_SMT,
+                              shape=Pad.SHAPE_RECT, size=[pad_size, 1], layers=Pad.LAYERS_SMT))
+    return kicad_mod
+
+
+class Marker(Node):
+    def __init__(self, at):
+        Node.__init__(self)
+        self.at = Vector2D(at)
+
+
+def serialize_marker(file_handler, node):
+    position = node.getRealPosition(node.at)
+    return ['fp_circle', ['center', position.x, position.y], ['end', position.x + 0.1, position.y],
+            ['layer', 'Cmts.User'], ['width', 0.05]]
+
+
+RESULT_NODE_ORDER = """(module test (layer F.Cu) (tedit 0)
+  (fp_text reference REF** (at 0 -3) (layer F.SilkS)
+    (effects (font (size 1 1) (thickness 0.15)))
+  )
+  (fp_text value test (at 0 3) (layer F.Fab)
+    (effects (font (size 1 1) (thickness 0.15)))
+  )
+  (fp_circle (center 2 1) (end 2.1 1) (layer Cmts.User) (width 0.05))
+  (fp_circle (center 1 1) (end 1.5 1) (layer F.Fab) (width 0.1))
+  (fp_line (start 0 0) (end 1 0) (layer F.Fab) (width 0.1))
+  (pad 1 smd rect (at 0 0) (size 0.5 1) (layers F.Cu F.Mask F.Paste))
+  (fp_text user first (at 0 1) (layer F.Fab)
+    (effects (font (size 1 1) (thickness 0.15)))
+  )
+  (fp_text user second (at 0 2) (layer F.Fab)
+    (effects (font (size 1 1) (thickness 0.15)))
+  )
+  (model test.wrl
+    (at (xyz 0 0 0))
+    (scale (xyz 1 1 1))
+    (rotate (xyz 0 0 0))
+  )
+)"""
+
+
+class FileHandlerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.environ = {k: os.environ.pop(k) for k in [TIMESTAMP_MODE_ENV, SOURCE_DATE_EPOCH_ENV] if k in os.environ}
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        KicadFileHandler.setTimestampMode(None)
+        for key in [TIMESTAMP_MODE_ENV, SOURCE_DATE_EPOCH_ENV]:
+            os.environ.pop(key, None)
+        os.environ.update(self.environ)
+        shutil.rmtree(self.tmp_dir)
+
+    def testFixedTimestamp(self):
+        file_handler = KicadFileHandler(create_footprint())
+
+        KicadFileHandler.setTimestampMode(0x5A000000)
+        self.assertIn('(tedit 5A000000)', file_handler.serialize())
+        self.assertIn('(tedit 1)', file_handler.serialize(timestamp=1))
+
+        KicadFileHandler.setTimestampMode(None)
+        os.environ[SOURCE_DATE_EPOCH_ENV] = '16'
+        self.assertIn('(tedit 10)', file_handler.serialize())
+        os.environ[TIMESTAMP_MODE_ENV] = '32'
+        self.assertIn('(tedit 20)', file_handler.serialize())
+
+        self.assertRaises(ValueError, KicadFileHandler.setTimestampMode, 'yesterday')
+
+    def testContentHashTimestamp(self):
+        os.environ[TIMESTAMP_MODE_ENV] = KicadFileHandler.TIMESTAMP_CONTENT_HASH
+
+        output = KicadFileHandler(create_footprint()).serialize()
+        self.assertEqual(output, KicadFileHandler(create_footprint()).serialize())
+        self.assertNotEqual(output, KicadFileHandler(create_footprint(pad_size=0.6)).serialize())
+
+        reference = KicadFileHandler(create_footprint()).serialize(timestamp=0)
+        self.assertEqual(output.split('\n')[1:], reference.split('\n')[1:])
+        self.assertTrue(re.match(r'^\(module test \(layer F.Cu\) \(tedit [0-9A-F]+\)$', output.split('\n')[0]))
+
+        stream = io.StringIO()
+        KicadFileHandler(create_footprint()).serializeToStream(stream)
+        self.assertEqual(stream.getvalue(), output)
+
+    def testSkipUnchangedFile(self):
+        KicadFileHandler.setTimestampMode(KicadFileHandler.TIMESTAMP_CONTENT_HASH)
+        filename = os.path.join(self.tmp_dir, 'test.kicad_mod')
+
+        self.assertTrue(KicadFileHandler(create_footprint()).writeFile(filename))
+        self.assertFalse(KicadFileHandler(create_footprint()).writeFile(filename))
+        self.assertTrue(KicadFileHandler(create_footprint(pad_size=0.6)).writeFile(filename))
+
+        with io.open(filename, 'r', newline='') as f:
+            self.assertEqual(f.read(), KicadFileHandler(create_footprint(pad_size=0.6)).serialize())
+
+    def testNodeOrder(self):
+        kicad_mod = Footprint("test")
+        kicad_mod.append(Model(filename='test.wrl'))
+        kicad_mod.append(Text(type='user', text='first', at=[0, 1], layer='F.Fab'))
+        kicad_mod.append(Pad(number=1, type=Pad.TYPE_SMT, shape=Pad.SHAPE_RECT, at=[0, 0], size=[0.5, 1],
+                             layers=Pad.LAYERS_SMT))
+        kicad_mod.append(Text(type='value', text='test', at=[0, 3], layer='F.Fab'))
+        translation = Translation(1, 1)
+        translation.append(Marker(at=[1, 0]))
+        translation.append(Circle(center=[0, 0], radius=0.5, layer='F.Fab', width=0.1))
+        kicad_mod.append(translation)
+        kicad_mod.append(Line(start=[0, 0], end=[1, 0], layer='F.Fab', width=0.1))
+        kicad_mod.append(Text(type='user', text='second', at=[0, 2], layer='F.Fab'))
+        kicad_mod.append(Text(type='reference', text='REF**', at=[0, -3], layer='F.SilkS'))
+
+        # unregistered node types are skipped
+        self.assertNotIn('Cmts.User', KicadFileHandler(kicad_mod).serialize(timestamp=0))
+
+        KicadFileHandler.registerNodeSerializer(Marker, serialize_marker, group='Circle')
+        try:
+            self.assertEqual(KicadFileHandler(kicad_mod).serialize(timestamp=0), RESULT_NODE_ORDER)
+        finally:
+            del KicadFileHandler._node_serializers[Marker]
@@ -0,0 +1,62 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+import unittest
+
+from KicadModTree import *
+from KicadModTree.nodes.specialized.RingPad import ArcPadPrimitive
+
+
+class GeneratedNodeTests(unittest.TestCase):
+
+    def testExposedPadGeneratedOnce(self):
+        kicad_mod = Footprint("exposed_pad")
+        kicad_mod.append(ExposedPad(number=3, size=[5, 5], paste_layout=6, via_layout=4,
+                                    paste_avoid_via=True, paste_coverage=0.5))
+
+        with countRegenerations() as regenerations:
+            first = KicadFileHandler(kicad_mod).serialize(timestamp=0)
+            kicad_mod.calculateBoundingBox()
+            kicad_mod.getCompleteRenderTree()
+            second = KicadFileHandler(kicad_mod).serialize(timestamp=0)
+
+        self.assertEqual(first, second)
+        self.assertEqual(regenerations['ExposedPad'], 1)
+        self.assertEqual(regenerations['PadArray'], 4)
+        self.assertEqual(regenerations['ChamferedPadGrid'], 9)
+
+    def testParameterChange(self):
+        exposed_pad = ExposedPad(number=3, size=[2.1, 3], mask_size=[2.1, 2.1], paste_layout=[2, 3])
+        pads = exposed_pad.getVirtualChilds()
+        self.assertIs(exposed_pad.getVirtualChilds(), pads)
+
+        exposed_pad.number = 4
+        with countRegenerations() as regenerations:
+            pads = exposed_pad.getVirtualChilds()
+        self.assertEqual(regenerations['ExposedPad'], 1)
+        self.assertEqual(pads[1].number, 4)
+
+        exposed_pad.invalidateVirtualChilds()
+        self.assertIsNot(exposed_pad.getVirtualChilds(), pads)
+
+    def testArcPadPrimitiveRotate(self):
+        arc_pad = ArcPadPrimitive(reference_arc=Arc(center=[0, 0], start=[2, 0], angle=90),
+                                  width=0.5, layers=['F.Cu'])
+        at = arc_pad.getVirtualChilds()[0].at
+
+        arc_pad.rotate(90)
+        rotated_at = arc_pad.getVirtualChilds()[0].at
+        self.assertAlmostEqual(rotated_at.x, -at.y)
+        self.assertAlmostEqual(rotated_at.y, at.x)
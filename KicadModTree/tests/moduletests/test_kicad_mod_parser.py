@@ -0,0 +1,89 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from KicadModTree import *
+
+from . import test_exposed_pad, test_kicad5_padshapes, test_rotation, test_simple_footprints
+
+RESULT_UNKNOWN_ELEMENTS = """(module test (layer F.Cu) (tedit 5B307E3A) locked
+  (fp_text user %R (at 0 0) (layer F.Fab)
+    (effects (font (size 1 1) (thickness 0.15)))
+  )
+  (fp_curve (pts (xy 0 0) (xy 1 0) (xy 1 1) (xy 0 1)) (layer F.SilkS) (width 0.12))
+  (pad 1 thru_hole oval (at 0 0) (size 1.7 1.95) (drill oval 0.9 1.2) (layers *.Cu *.Mask) (die_length 1))
+)"""
+
+
+def reference_results():
+    for module in [test_exposed_pad, test_kicad5_padshapes, test_rotation, test_simple_footprints]:
+        for name in sorted(dir(module)):
+            if name.startswith('RESULT_'):
+                yield name, getattr(module, name)
+
+
+class KicadModParserTests(unittest.TestCase):
+
+    def testRoundTrip(self):
+        for name, result in reference_results():
+            parser = KicadModParser()
+            kicad_mod = parser.parse(result)
+
+            self.assertEqual(parser.timestamp, 0, name)
+            self.assertEqual(parser.unknown_elements, [], name)
+            self.assertEqual(KicadFileHandler(kicad_mod).serialize(timestamp=0), result, name)
+
+    def testParsedNodes(self):
+        kicad_mod = KicadModParser().parse(test_simple_footprints.RESULT_SIMPLE_FOOTPRINT)
+
+        self.assertEqual(kicad_mod.name, 'test')
+        self.assertEqual(kicad_mod.description, 'A example footprint')
+        self.assertEqual([n.__class__.__name__ for n in kicad_mod.getNormalChilds()],
+                         ['Text', 'Text', 'Line', 'Line', 'Line', 'Line', 'Line', 'Line', 'Line', 'Line',
+                          'Pad', 'Pad', 'Model'])
+
+        pad = kicad_mod.getNormalChilds()[-2]
+        self.assertEqual(pad.number, '2')
+        self.assertEqual(pad.type, Pad.TYPE_THT)
+        self.assertEqual(pad.drill, Vector2D(1.2, 1.2))
+        self.assertEqual(pad.layers, Pad.LAYERS_THT)
+
+    def testUnknownElements(self):
+        parser = KicadModParser()
+        kicad_mod = parser.parse(RESULT_UNKNOWN_ELEMENTS)
+
+        self.assertEqual(parser.timestamp, 0x5B307E3A)
+        self.assertEqual(parser.unknown_elements, ['locked', 'fp_curve', 'die_length'])
+        self.assertEqual(len(kicad_mod.getNormalChilds()), 2)
+
+        self.assertRaises(ValueError, KicadModParser(strict=True).parse, RESULT_UNKNOWN_ELEMENTS)
+        self.assertRaises(ValueError, KicadModParser().parse, '(kicad_pcb (version 4))')
+
+    def testReadFile(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tmp_dir, 'test.kicad_mod')
+            kicad_mod = KicadModParser().parse(test_kicad5_padshapes.RESULT_SIMPLE_OTHER_CUSTOM_PAD)
+            KicadFileHandler(kicad_mod).writeFile(filename, timestamp=0)
+
+            kicad_mod = KicadFileHandler.readFile(filename)
+            self.assertEqual(KicadFileHandler(kicad_mod).serialize(timestamp=0),
+                             test_kicad5_padshapes.RESULT_SIMPLE_OTHER_CUSTOM_PAD)
+        finally:
+            shutil.rmtree(tmp_dir)
@@ -0,0 +1,139 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from KicadModTree import *
+
+# footprints which take a while to generate, set before the worker processes are forked
+SLOW_FOOTPRINTS = set()
+
+DEFINITIONS_YML = u"""
+part_a:
+  pincount: 2
+part_b:
+  pincount: 4
+broken:
+  pincount: 6
+part_c:
+  pincount: 8
+missing_pincount:
+  description: no pins
+"""
+
+DEFINITIONS_CSV = u"""name, pincount
+csv_a, 2
+csv_b, 3
+"""
+
+DEFINITIONS_JSON = u"""[
+  {"name": "json_a", "pincount": 3},
+  {"name": "json_b", "pincount": "many"}
+]
+"""
+
+
+def footprint_gen(args):
+    if args['name'] == 'broken':
+        raise RuntimeError("can not create footprint")
+    if args['name'] in SLOW_FOOTPRINTS:
+        time.sleep(1)
+
+    kicad_mod = Footprint(args['name'])
+    for pin in range(args['pincount']):
+        kicad_mod.append(Pad(number=pin + 1, type=Pad.TYPE_SMT, shape=Pad.SHAPE_RECT, at=[pin, 0], size=[0.5, 1],
+                             layers=Pad.LAYERS_SMT))
+    KicadFileHandler(kicad_mod).writeFile('{}.kicad_mod'.format(args['name']))
+    return {'pads': args['pincount']}
+
+
+class ModArgparserTests(unittest.TestCase):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tempdir = tempfile.mkdtemp()
+        os.chdir(self.tempdir)
+
+        for filename, content in (('parts.yml', DEFINITIONS_YML), ('parts.csv', DEFINITIONS_CSV),
+                                  ('parts.json', DEFINITIONS_JSON)):
+            with io.open(filename, 'w') as f:
+                f.write(content)
+
+        self.parser = ModArgparser(footprint_gen)
+        self.parser.add_parameter("name", type=str, required=True)
+        self.parser.add_parameter("pincount", type=int, required=True)
+        self.parser.add_parameter("description", type=str, required=False)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tempdir)
+
+    def assertResults(self, results, expected):
+        self.assertEqual([(r['name'], r['status']) for r in results], expected)
+
+    def testBatch(self):
+        for jobs in (1, 2):
+            results = self.parser.run_batch(['parts.yml', 'parts.csv'], jobs=jobs)
+            self.assertResults(results, [('part_a', 'ok'), ('part_b', 'ok'), ('broken', 'failed'), ('part_c', 'ok'),
+                                         ('missing_pincount', 'failed'), ('csv_a', 'ok'), ('csv_b', 'ok')])
+            self.assertEqual(results[2]['error'], "RuntimeError: can not create footprint")
+            self.assertEqual(results[4]['error'], "parameter expected: pincount")
+            self.assertEqual(results[5]['file'], 'parts.csv')
+            self.assertTrue(os.path.isfile('part_c.kicad_mod'))
+            self.assertTrue(os.path.isfile('csv_b.kicad_mod'))
+            self.assertEqual(results[3]['info'], {'pads': 8})
+            self.assertIsNone(results[4]['info'])
+
+    def testJson(self):
+        results = self.parser.run_batch(['parts.json'])
+        self.assertResults(results, [('json_a', 'ok'), ('json_b', 'failed')])
+        self.assertEqual(results[0]['info'], {'pads': 3})
+        self.assertTrue(results[1]['error'].startswith("invalid literal for int()"))
+
+    def testFailFast(self):
+        results = self.parser.run_batch(['parts.yml'], fail_fast=True)
+        self.assertResults(results, [('part_a', 'ok'), ('part_b', 'ok'), ('broken', 'failed'),
+                                     ('part_c', 'skipped'), ('missing_pincount', 'skipped')])
+        self.assertFalse(os.path.isfile('part_c.kicad_mod'))
+
+        # part_c is still generated when broken fails, the pool is stopped before it is finished
+        SLOW_FOOTPRINTS.add('part_c')
+        try:
+            results = self.parser.run_batch(['parts.yml'], jobs=2, fail_fast=True)
+        finally:
+            SLOW_FOOTPRINTS.clear()
+        self.assertEqual(results[2]['status'], 'failed')
+        self.assertEqual(results[3]['status'], 'skipped')
+        self.assertFalse(os.path.isfile('part_c.kicad_mod'))
+
+    def testSummary(self):
+        with self.assertRaises(SystemExit) as context:
+            self.parser.run(['parts.csv', 'parts.yml', '--jobs', '2', '--summary', 'summary.json'])
+        self.assertEqual(context.exception.code, 1)
+
+        with open('summary.json') as f:
+            summary = json.load(f)
+        self.assertResults(summary, [('csv_a', 'ok'), ('csv_b', 'ok'), ('part_a', 'ok'), ('part_b', 'ok'),
+                                     ('broken', 'failed'), ('part_c', 'ok'), ('missing_pincount', 'failed')])
+        self.assertEqual(set(summary[0]), {'name', 'file', 'seconds', 'status', 'error', 'info'})
+
+        # no exit code if all footprints were generated
+        self.parser.run(['parts.csv'])
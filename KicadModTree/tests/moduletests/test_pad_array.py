@@ -0,0 +1,60 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+import unittest
+
+from KicadModTree import *
+
+RESULT_THT_ARRAY = """(module pad_array (layer F.Cu) (tedit 0)
+  (pad 1 thru_hole roundrect (at 0 0) (size 1.5 2) (drill 0.9) (layers *.Cu *.Mask) (roundrect_rratio 0.166667))
+  (pad 2 thru_hole oval (at 2.54 0) (size 1.5 2) (drill 0.9) (layers *.Cu *.Mask))
+  (pad 4 thru_hole oval (at 7.62 0) (size 1.5 2) (drill 0.9) (layers *.Cu *.Mask))
+  (pad 5 thru_hole oval (at 10.16 0) (size 1.5 2) (drill 0.9) (layers *.Cu *.Mask))
+  (pad 6 thru_hole oval (at 12.7 0) (size 1.5 2) (drill 0.9) (layers *.Cu *.Mask))
+)"""
+
+
+class PadArrayTests(unittest.TestCase):
+
+    def testThtArray(self):
+        kicad_mod = Footprint("pad_array")
+        kicad_mod.append(PadArray(pincount=6, spacing=[2.54, 0], start=[0, 0], hidden_pins=[3],
+                                  type=Pad.TYPE_THT, shape=Pad.SHAPE_OVAL, size=[1.5, 2], drill=0.9,
+                                  layers=Pad.LAYERS_THT))
+
+        self.assertEqual(KicadFileHandler(kicad_mod).serialize(timestamp=0), RESULT_THT_ARRAY)
+
+    def testBulkPads(self):
+        pad_array = PadArray(pincount=300, spacing=[0, 0.5], center=[1, 0], x_mirror=0, hidden_pins=[7, 8],
+                             type=Pad.TYPE_SMT, shape=Pad.SHAPE_RECT, size=[0.3, 1.2], layers=Pad.LAYERS_SMT)
+
+        pads = pad_array.getVirtualChilds()
+        self.assertIs(pads, pad_array.getVirtualChilds())
+        self.assertEqual(len(pads), 298)
+        self.assertEqual([p.number for p in pads[:7]], [1, 2, 3, 4, 5, 6, 9])
+        self.assertEqual(pads[6].at, Vector2D(-1, 8 * 0.5 - 299 * 0.25))
+
+        # pads must not share their mutable parameters
+        pads[1].size.x = 1
+        pads[1].at.y = 0
+        self.assertEqual(pads[2].size, Vector2D(0.3, 1.2))
+        self.assertNotEqual(pads[2].at.y, 0)
+
+    def testInvalidParameters(self):
+        # the shared pad parameters are validated on construction, not when the pads are used
+        self.assertRaises(ValueError, PadArray, pincount=10, spacing=[1, 0], type=Pad.TYPE_SMT,
+                          shape='triangle', size=[1, 1], layers=Pad.LAYERS_SMT)
+        self.assertRaises(KeyError, PadArray, pincount=10, spacing=[1, 0], type=Pad.TYPE_THT,
+                          shape=Pad.SHAPE_RECT, size=[1, 1], layers=Pad.LAYERS_THT)
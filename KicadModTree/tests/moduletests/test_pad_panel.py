@@ -0,0 +1,86 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+import unittest
+
+from KicadModTree import *
+
+PAD_PARAMETERS = {'type': Pad.TYPE_SMT, 'shape': Pad.SHAPE_RECT, 'size': [0.1, 3.8], 'layers': ['F.Cu', 'F.Mask'],
+                  'solder_mask_margin': 0.25}
+
+POSITIONS = [(1, 0, 0), (2, 0, 6.985), (3, 0.2, 0), ('A', 0.2, 6.985)]
+
+RESULT_PANEL = """(module pad_panel (layer F.Cu) (tedit 0)
+  (pad 1 smd rect (at 0 0) (size 0.1 3.8) (layers F.Cu F.Mask)
+    (solder_mask_margin 0.25))
+  (pad 2 smd rect (at 0 6.985) (size 0.1 3.8) (layers F.Cu F.Mask)
+    (solder_mask_margin 0.25))
+  (pad 3 smd rect (at 0.2 0) (size 0.1 3.8) (layers F.Cu F.Mask)
+    (solder_mask_margin 0.25))
+  (pad A smd rect (at 0.2 6.985) (size 0.1 3.8) (layers F.Cu F.Mask)
+    (solder_mask_margin 0.25))
+)"""
+
+
+def createFootprint(parent, pads, **kwargs):
+    kicad_mod = Footprint("pad_panel")
+    kicad_mod.append(Pad(number='B', at=[-1, 0], **PAD_PARAMETERS))
+    kicad_mod.append(parent)
+    parent.append(pads)
+    kicad_mod.append(Pad(number='C', at=[1, 0], **PAD_PARAMETERS))
+    return KicadFileHandler(kicad_mod).serialize(timestamp=0)
+
+
+class PadPanelTests(unittest.TestCase):
+
+    def testSerialize(self):
+        panel = PadPanel(**PAD_PARAMETERS)
+        panel.addPads(*zip(*POSITIONS))
+
+        kicad_mod = Footprint("pad_panel")
+        kicad_mod.append(panel)
+        self.assertEqual(KicadFileHandler(kicad_mod).serialize(timestamp=0), RESULT_PANEL)
+
+    def testSameOutputAsPads(self):
+        for parameters in ({}, {'rotation': 90}, {'x_mirror': 1}, {'shape': Pad.SHAPE_ROUNDRECT, 'radius_ratio': 0.1}):
+            pad_parameters = dict(PAD_PARAMETERS, **parameters)
+            for parent in (Translation(0, 0), Translation(1.5, -2), Rotation(30)):
+                panel = PadPanel(**pad_parameters)
+                for number, x, y in POSITIONS:
+                    panel.addPad(number, x, y)
+
+                pads = Translation(0, 0)
+                for number, x, y in POSITIONS:
+                    pads.append(Pad(number=number, at=[x, y], **pad_parameters))
+
+                self.assertEqual(createFootprint(parent.copy(), panel), createFootprint(parent.copy(), pads))
+
+    def testGetPads(self):
+        panel = PadPanel(x_mirror=0, **PAD_PARAMETERS)
+        panel.addPads(*zip(*POSITIONS))
+
+        self.assertEqual(len(panel), 4)
+        pads = panel.getPads()
+        self.assertEqual([p.number for p in pads], [1, 2, 3, 'A'])
+        self.assertEqual(pads[2].at, Vector2D(-0.2, 0))
+        self.assertEqual(list(panel.getPadPositions())[3], ('A', -0.2, 6.985))
+
+    def testInvalidParameters(self):
+        self.assertRaises(ValueError, PadPanel, type=Pad.TYPE_SMT, shape='triangle', size=[1, 1],
+                          layers=Pad.LAYERS_SMT)
+        self.assertRaises(KeyError, PadPanel, at=[0, 0], **PAD_PARAMETERS)
+
+        panel = PadPanel(**PAD_PARAMETERS)
+        self.assertRaises(ValueError, panel.addPads, [1, 2], [0, 1], [0])
@@ -0,0 +1,106 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+import io
+import unittest
+
+from KicadModTree import *
+from KicadModTree.nodes.Node import RecursionDetectedError
+
+RESULT_RENDER_TREE = """+ Footprint
+  * Translation [x: 1, y: 2]
+    * Rotation [r: 30]
+      * PadArray
+      * RectLine [start: [x: 0.0, y: 0.0] end: [x: 2.0, y: 2.0]]
+  * Line (fp_line (start 0 0) (end 1 0) (layer F.SilkS) (width None))"""
+
+RESULT_COMPLETE_RENDER_TREE = """+ Footprint
+  * Translation [x: 1, y: 2]
+    * Rotation [r: 30]
+      * PadArray
+        + Pad(pad 1 smd rect (at 0 0) (size 1 1) (drill None) (layers F.Cu F.Mask F.Paste))
+        + Pad(pad 2 smd rect (at 1 0) (size 1 1) (drill None) (layers F.Cu F.Mask F.Paste))
+        + Pad(pad 3 smd rect (at 2 0) (size 1 1) (drill None) (layers F.Cu F.Mask F.Paste))
+      * RectLine [start: [x: 0.0, y: 0.0] end: [x: 2.0, y: 2.0]]
+        * Line (fp_line (start 0 0) (end 0 2) (layer F.SilkS) (width None))
+        * Line (fp_line (start 0 2) (end 2 2) (layer F.SilkS) (width None))
+        * Line (fp_line (start 2 2) (end 2 0) (layer F.SilkS) (width None))
+        * Line (fp_line (start 2 0) (end 0 0) (layer F.SilkS) (width None))
+  * Line (fp_line (start 0 0) (end 1 0) (layer F.SilkS) (width None))"""
+
+RESULT_SUMMARY = """+ Footprint
+  * Translation [x: 1, y: 2]
+    * Rotation x 1
+  * Line (fp_line (start 0 0) (end 1 0) (layer F.SilkS) (width None))
+  * Pad x 2
+  * Line x 1
+"""
+
+RESULT_SUMMARY_COMPLETE = """+ Footprint
+  * Translation [x: 1, y: 2]
+    * Rotation [r: 30]
+      * PadArray
+        + Pad(pad 1 smd rect (at 0 0) (size 1 1) (drill None) (layers F.Cu F.Mask F.Paste))
+        * Pad x 2
+      * RectLine x 1
+  * Line x 1
+"""
+
+
+def createFootprint():
+    kicad_mod = Footprint("render_tree")
+    translation = Translation(1, 2)
+    kicad_mod.append(translation)
+    rotation = Rotation(30)
+    translation.append(rotation)
+    rotation.append(PadArray(pincount=3, spacing=[1, 0], type=Pad.TYPE_SMT, shape=Pad.SHAPE_RECT, size=[1, 1],
+                             layers=Pad.LAYERS_SMT))
+    rotation.append(RectLine(start=[0, 0], end=[2, 2], layer='F.SilkS'))
+    kicad_mod.append(Line(start=[0, 0], end=[1, 0]))
+    return kicad_mod
+
+
+class RenderTreeTests(unittest.TestCase):
+
+    def testRenderTree(self):
+        kicad_mod = createFootprint()
+        self.assertEqual(kicad_mod.getRenderTree(), RESULT_RENDER_TREE)
+        self.assertEqual(kicad_mod.getCompleteRenderTree(), RESULT_COMPLETE_RENDER_TREE)
+
+        stream = io.StringIO()
+        kicad_mod.writeRenderTree(stream)
+        self.assertEqual(stream.getvalue(), RESULT_RENDER_TREE + '\n')
+
+    def testSummary(self):
+        kicad_mod = createFootprint()
+        for pad_number in range(2):
+            kicad_mod.append(Pad(number=pad_number, type=Pad.TYPE_SMT, shape=Pad.SHAPE_RECT, at=[0, 0],
+                                 size=[1, 1], layers=Pad.LAYERS_SMT))
+        kicad_mod.append(Line(start=[0, 0], end=[1, 0]))
+
+        stream = io.StringIO()
+        kicad_mod.writeRenderTree(stream, max_depth=1, max_childs=2)
+        self.assertEqual(stream.getvalue(), RESULT_SUMMARY)
+
+        stream = io.StringIO()
+        createFootprint().writeRenderTree(stream, complete=True, max_childs=1)
+        self.assertEqual(stream.getvalue(), RESULT_SUMMARY_COMPLETE)
+
+    def testRecursion(self):
+        kicad_mod = createFootprint()
+        line = kicad_mod.getNormalChilds()[-1]
+        kicad_mod.getNormalChilds()[0]._childs.append(line)
+        self.assertRaises(RecursionDetectedError, kicad_mod.getRenderTree)
+        self.assertRaises(RecursionDetectedError, kicad_mod.writeRenderTree, io.StringIO())
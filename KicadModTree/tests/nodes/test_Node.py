@@ -16,6 +16,8 @@
 import unittest
 
 from KicadModTree.nodes.Node import *
+from KicadModTree.nodes.specialized.Rotation import Rotation
+from KicadModTree.nodes.specialized.Translation import Translation
 
 
 class TestChildNode(Node):
@@ -264,3 +266,102 @@ class NodeTests(unittest.TestCase):
         node.insert(insertNode)
         self.assertEqual(len(node.getNormalChilds()), 1)
         self.assertEqual(len(insertNode.getNormalChilds()), 200)
+
+    def testRealPosition(self):
+        node = Node()
+        childNode = Node()
+        node.append(childNode)
+
+        self.assertEqual(childNode.getRealPosition([1, 2]), Vector3D(1, 2))
+        self.assertEqual(childNode.getRealPosition([1, 2], 10), (Vector3D(1, 2), 10))
+
+        translation = Translation(1, 2)
+        node.insert(translation)
+        self.assertEqual(childNode.getRealPosition([1, 2]), Vector3D(2, 4))
+
+        rotation = Rotation(90)
+        translation.insert(rotation)
+        position, rotation_angle = childNode.getRealPosition([1, 2], 10)
+        self.assertAlmostEqual(position.x, 3)
+        self.assertAlmostEqual(position.y, 1)
+        self.assertEqual(rotation_angle, 100)
+
+    def testTransformationCacheInvalidation(self):
+        node = Node()
+        translation = Translation(1, 0)
+        childNode = Node()
+        node.append(translation)
+        translation.append(childNode)
+
+        self.assertEqual(childNode.getRealPosition([0, 0]), Vector3D(1, 0))
+        self.assertEqual(childNode.getTransformationMatrix(), ((1, 0, 1), (0, 1, 0), (0, 0, 1)))
+
+        translation.offset_x = 5
+        self.assertEqual(childNode.getRealPosition([0, 0]), Vector3D(5, 0))
+
+        outerTranslation = Translation(0, 3)
+        outerTranslation.append(Node())
+        node.remove(translation)
+        outerTranslation.append(translation)
+        self.assertEqual(childNode.getRealPosition([0, 0]), Vector3D(5, 3))
+
+        translation.remove(childNode)
+        self.assertEqual(childNode.getRealPosition([0, 0]), Vector3D(0, 0))
+
+    def testRealPositions(self):
+        node = Node()
+        childNode = Node()
+        node.append(childNode)
+
+        points = [[0, 0], (1, 2), Vector2D(-3.5, 0.25), {'x': 7, 'y': -1}]
+        self.assertEqual(childNode.getRealPositions(points), [Vector3D(p) for p in points])
+
+        node.insert(Rotation(30))
+        node.insert(Translation(1, -2))
+
+        points = [Vector2D(i*0.1, -i*0.3) for i in range(200)]
+        for real_position, point in zip(childNode.getRealPositions(points), points):
+            expected_position = childNode.getRealPosition(point)
+            self.assertAlmostEqual(real_position.x, expected_position.x)
+            self.assertAlmostEqual(real_position.y, expected_position.y)
+
+    def testWalk(self):
+        class VirtualChildNode(Node):
+            def __init__(self):
+                Node.__init__(self)
+                self.virtual_child = Node()
+
+            def getVirtualChilds(self):
+                return [self.virtual_child]
+
+        node = Node()
+        childNode1 = VirtualChildNode()
+        childNode2 = Node()
+        grandchildNode = Node()
+        node.append(childNode1)
+        node.append(childNode2)
+        childNode1.append(grandchildNode)
+        virtualNode = childNode1.virtual_child
+
+        self.assertEqual(list(node.walk()), [node, childNode1, grandchildNode, virtualNode, childNode2])
+        self.assertEqual(list(node.walk()), node.serialize())
+        self.assertEqual(list(node.walk(order='post')), [grandchildNode, virtualNode, childNode1, childNode2, node])
+        self.assertEqual(list(node.walk(include_virtual=False)), [node, childNode1, grandchildNode, childNode2])
+        self.assertEqual(list(node.walk(descend=lambda n: n is not childNode1)), [node, childNode1, childNode2])
+        self.assertEqual(list(node.walk(order='post', descend=lambda n: n is not childNode1)),
+                         [childNode1, childNode2, node])
+
+        with self.assertRaises(ValueError):
+            list(node.walk(order='in'))
+
+    def testWalkDeepTree(self):
+        node = Node()
+        leaf = node
+        for i in range(5000):
+            child = Node()
+            leaf.append(child)
+            leaf = child
+
+        nodes = list(node.walk())
+        self.assertEqual(len(nodes), 5001)
+        self.assertIs(nodes[-1], leaf)
@@ -0,0 +1,146 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2016 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from KicadModTree import *
+from KicadModTree.util import kicad_util
+from KicadModTree.util.kicad_util import SexprSerializer, lispTokenizer, parseLispString, parseTimestamp, \
+    formatTimestamp, formatFloat, lispString, formatCacheInfo, clearFormatCaches
+
+
+NL = SexprSerializer.NEW_LINE
+
+RESULT_NESTED = """(module test
+  (fp_text reference REF**
+    (effects (font (size 1 1)))
+  )
+  (primitives
+    (gr_poly (pts
+       (xy 0 0) (xy 1 0)) (width 0))
+  ))"""
+
+
+class SexprSerializerTests(unittest.TestCase):
+
+    def testPrimitives(self):
+        self.assertEqual(str(SexprSerializer(['a', 1, 1.5, -0.0, 'b c', ''])), '(a 1 1.5 0 "b c" "")')
+
+    def testNestedIndentation(self):
+        sexpr = ['module', 'test', NL,
+                 ['fp_text', 'reference', 'REF**', NL,
+                  ['effects', ['font', ['size', 1, 1]]], NL], NL,
+                 ['primitives', NL,
+                  ['gr_poly', ['pts', NL, ['xy', 0, 0], ['xy', 1, 0]], ['width', 0]], NL]]
+
+        self.assertEqual(str(SexprSerializer(sexpr)), RESULT_NESTED)
+
+    def testStreamEqualsString(self):
+        sexpr = ['module', 'test', NL,
+                 ['descr', 'multi\nline'], NL,
+                 ['fp_text', 'value', NL, ['at', 1, 2, ['x', NL, 'a\nb']], NL], NL]
+
+        stream = io.StringIO()
+        SexprSerializer(sexpr).write(stream)
+        self.assertEqual(stream.getvalue(), str(SexprSerializer(sexpr)))
+
+    def testWriteFile(self):
+        kicad_mod = Footprint("test")
+        kicad_mod.setDescription("A example footprint")
+        kicad_mod.append(Text(type='reference', text='REF**', at=[0, -3], layer='F.SilkS'))
+        kicad_mod.append(PadArray(pincount=20, spacing=[1, 0], center=[0, 0], type=Pad.TYPE_SMT,
+                                  shape=Pad.SHAPE_RECT, size=[0.5, 1], layers=Pad.LAYERS_SMT))
+        file_handler = KicadFileHandler(kicad_mod)
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tmp_dir, 'test.kicad_mod')
+            file_handler.writeFile(filename, timestamp=0)
+            with io.open(filename, 'r', newline='') as f:
+                self.assertEqual(f.read(), file_handler.serialize(timestamp=0))
+        finally:
+            shutil.rmtree(tmp_dir)
+
+
+class FormatCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        clearFormatCaches()
+
+    def tearDown(self):
+        clearFormatCaches()
+
+    def testFormatFloat(self):
+        for i in range(2):
+            self.assertEqual(formatFloat(1.5), '1.5')
+            self.assertEqual(formatFloat(1), '1')
+            self.assertEqual(formatFloat(-0.0), '0')
+            self.assertEqual(formatFloat(-0.0000001), '0')
+            self.assertEqual(formatFloat(0.1234567), '0.123457')
+
+        info = formatCacheInfo()['formatFloat']
+        self.assertEqual(info['hits'], 5)
+        self.assertEqual(info['misses'], 5)
+
+    def testLispString(self):
+        for i in range(2):
+            self.assertEqual(lispString('F.Cu'), 'F.Cu')
+            self.assertEqual(lispString(''), '""')
+            self.assertEqual(lispString('a b'), '"a b"')
+            self.assertEqual(lispString('a\nb'), '"a\nb"')
+            self.assertEqual(lispString('say "hi"'), '"say \\"hi\\""')
+            self.assertEqual(lispString(1), '1')
+            self.assertEqual(lispString(1.0), '1.0')
+
+        info = formatCacheInfo()['lispString']
+        self.assertEqual(info['hits'], 7)
+        self.assertEqual(info['misses'], 7)
+        self.assertEqual(info['size'], 7)
+
+    def testBoundedCache(self):
+        for i in range(kicad_util.FORMAT_CACHE_SIZE + 10):
+            formatFloat(i * 0.5)
+        self.assertLessEqual(formatCacheInfo()['formatFloat']['size'], kicad_util.FORMAT_CACHE_SIZE)
+        self.assertEqual(formatFloat(0.5), '0.5')
+
+
+class LispParserTests(unittest.TestCase):
+
+    def testTokenizer(self):
+        self.assertEqual(lispTokenizer('(descr "a (b) \\"c\\"")'), ['(', 'descr', 'a (b) "c"', ')'])
+
+    def testParseLispString(self):
+        self.assertEqual(parseLispString('(pad "" smd rect\n  (at 1 -2.5) (layers F.Cu F.Paste))'),
+                         ['pad', '', 'smd', 'rect', ['at', '1', '-2.5'], ['layers', 'F.Cu', 'F.Paste']])
+        self.assertEqual(parseLispString(str(SexprSerializer(['descr', 'multi\nline "quoted"']))),
+                         ['descr', 'multi\nline "quoted"'])
+
+        self.assertRaises(RuntimeError, parseLispString, '(a (b)')
+        self.assertRaises(RuntimeError, parseLispString, '(a) b)')
+        self.assertRaises(RuntimeError, parseLispString, '(a "b)')
+
+    def testRoundTrip(self):
+        self.assertEqual(lispString('C:\\models\\pin header.wrl'), '"C:\\\\models\\\\pin header.wrl"')
+        for string in ['C:\\models\\pin header.wrl', 'C:\\models\\header.wrl', 'ends with \\', '\\\\ server',
+                       'escaped \\" quote', '\\n no newline', 'multi\nline "quoted"', '']:
+            self.assertEqual(parseLispString(str(SexprSerializer(['descr', string]))), ['descr', string])
+
+    def testTimestamp(self):
+        self.assertEqual(parseTimestamp(formatTimestamp(1530953274)), 1530953274)
@@ -0,0 +1,108 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+import os
+import subprocess
+import sys
+import unittest
+
+from KicadModTree.util.lazy_import import LAZY_IMPORT_SUPPORTED
+
+REPOSITORY_ROOT = os.path.join(os.path.dirname(os.path.realpath(__file__)), "../../../")
+
+# modules which are loaded by "import KicadModTree" without using any of its names
+LAZY_PACKAGES = {'KicadModTree', 'KicadModTree.util', 'KicadModTree.util.lazy_import', 'KicadModTree.nodes',
+                 'KicadModTree.nodes.base', 'KicadModTree.nodes.specialized'}
+
+
+def importTime(statement):
+    '''
+    run a statement in a new interpreter with "python -X importtime"
+
+    :return: dict of all imported modules -> cumulative import time in us,
+             total import time of KicadModTree in us
+    '''
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(p for p in (REPOSITORY_ROOT, env.get('PYTHONPATH')) if p)
+    output = subprocess.check_output([sys.executable, '-X', 'importtime', '-W', 'ignore', '-c', statement],
+                                     stderr=subprocess.STDOUT, env=env, universal_newlines=True)
+
+    modules = {}
+    total = 0
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(cumulative)
+
+        # modules imported on first use of a name are not nested below the package
+        if name.startswith(' KicadModTree'):
+            total += int(cumulative)
+    return modules, total
+
+
+def kicadModules(modules):
+    return {name for name in modules if name.startswith('KicadModTree')}
+
+
+@unittest.skipUnless(LAZY_IMPORT_SUPPORTED, "module level __getattr__ requires python 3.7")
+class LazyImportTests(unittest.TestCase):
+
+    def testPlainImport(self):
+        modules, _ = importTime("import KicadModTree")
+        self.assertEqual(kicadModules(modules), LAZY_PACKAGES)
+        self.assertNotIn('yaml', modules)
+
+    def testImportSingleName(self):
+        modules, _ = importTime("from KicadModTree import Footprint, Pad")
+        self.assertIn('KicadModTree.nodes.Footprint', modules)
+        self.assertIn('KicadModTree.nodes.base.Pad', modules)
+        self.assertNotIn('KicadModTree.nodes.specialized.ExposedPad', modules)
+        self.assertNotIn('KicadModTree.KicadFileHandler', modules)
+        self.assertNotIn('yaml', modules)
+
+    def testStarImport(self):
+        modules, _ = importTime("from KicadModTree import *; assert isinstance(Footprint('x'), Node)")
+        self.assertIn('KicadModTree.nodes.specialized.ExposedPad', modules)
+        self.assertIn('KicadModTree.ModArgparser', modules)
+        self.assertNotIn('yaml', modules)
+
+    def testImportTimeBudget(self):
+        # the plain import must stay much cheaper than loading the whole API
+        lazy = min(importTime("import KicadModTree")[1] for _ in range(3))
+        full = min(importTime("from KicadModTree import *")[1] for _ in range(3))
+        self.assertLess(lazy * 3, full)
+
+    def testSubmoduleImport(self):
+        # importing the module of a node directly must not replace the node exported by the package
+        importTime("import KicadModTree.nodes.base.Pad, KicadModTree.Point\n"
+                   "from KicadModTree.nodes.base import Pad\n"
+                   "from KicadModTree import Point\n"
+                   "assert isinstance(Pad, type) and isinstance(Point, type)")
+
+    def testExportedNames(self):
+        import KicadModTree
+        import KicadModTree.nodes
+
+        namespace = {}
+        exec("from KicadModTree import *", namespace)
+        for name in ('Footprint', 'Pad', 'PadArray', 'ExposedPad', 'Vector2D', 'Point', 'KicadFileHandler',
+                     'KicadModParser', 'ModArgparser', 'Node', 'countRegenerations', 'nodes'):
+            self.assertIn(name, namespace)
+            self.assertIs(namespace[name], getattr(KicadModTree, name))
+        self.assertIs(namespace['Footprint'], KicadModTree.nodes.Footprint)
+        self.assertIn('Footprint', dir(KicadModTree))
+        with self.assertRaises(AttributeError):
+            KicadModTree.NotExisting
@@ -13,14 +13,48 @@
 #
 # (C) 2016-2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
 
+import hashlib
+import sys
 import time
 import re
 
 
+# formatFloat and lispString memoize their results, footprints repeat the same coordinates, widths and
+# layer names many times. A cache which reaches FORMAT_CACHE_SIZE entries is cleared.
+FORMAT_CACHE_SIZE = 16384
+
+_float_cache = {}
+_string_cache = {}
+
+# [hits, misses]
+_float_cache_stats = [0, 0]
+_string_cache_stats = [0, 0]
+
+# strings which include a white space have to be quoted
+_LISP_WHITESPACE = re.compile(r'\s')
+
+
 def formatFloat(val):
     '''
     return well formated float
     '''
+    try:
+        result = _float_cache.get(val)
+    except TypeError:
+        # not hashable
+        return _formatFloat(val)
+
+    if result is None:
+        _float_cache_stats[1] += 1
+        if len(_float_cache) >= FORMAT_CACHE_SIZE:
+            _float_cache.clear()
+        result = _float_cache[val] = _formatFloat(val)
+    else:
+        _float_cache_stats[0] += 1
+    return result
+
+
+def _formatFloat(val):
     result = ('%f' % val).rstrip('0').rstrip('.')
     if result == '-0':
         result = '0'
@@ -34,81 +68,117 @@ def lispString(string):
     if type(string) is not str:
         string = str(string)
 
-    if len(string) == 0 or re.match(".*\s.*", string):
-        return '"{}"'.format(string.replace('"', '\\"'))  # escape text
+    result = _string_cache.get(string)
+    if result is None:
+        _string_cache_stats[1] += 1
+        if len(_string_cache) >= FORMAT_CACHE_SIZE:
+            _string_cache.clear()
+        result = _string_cache[string] = _lispString(string)
+    else:
+        _string_cache_stats[0] += 1
+    return result
+
+
+def _lispString(string):
+    if len(string) == 0 or _LISP_WHITESPACE.search(string):
+        return '"{}"'.format(string.replace('\\', '\\\\').replace('"', '\\"'))  # escape text
 
     return string
 
 
-def lispTokenizer(input):
+def formatCacheInfo():
+    r"""Statistics of the caches used by formatFloat and lispString
+
+    :return: ``dict`` with an entry for ``formatFloat`` and ``lispString``, each a ``dict`` of
+             ``hits``, ``misses`` and ``size`` (number of cached values)
+
+    :Example:
+
+    >>> from KicadModTree.util.kicad_util import formatCacheInfo
+    >>> formatCacheInfo()['formatFloat']
+    {'hits': 5472, 'misses': 312, 'size': 312}
+    """
+    return {
+        'formatFloat': {'hits': _float_cache_stats[0], 'misses': _float_cache_stats[1], 'size': len(_float_cache)},
+        'lispString': {'hits': _string_cache_stats[0], 'misses': _string_cache_stats[1], 'size': len(_string_cache)}
+    }
+
+
+def clearFormatCaches():
     '''
-    Convert a string of characters into a list of tokens.
+    remove all cached values of formatFloat and lispString and reset their statistics
     '''
-    input = input.replace('(', ' ( ').replace(')', ' ) ')
+    _float_cache.clear()
+    _string_cache.clear()
+    _float_cache_stats[:] = [0, 0]
+    _string_cache_stats[:] = [0, 0]
 
-    # split input, including whitespaces
-    base_tokens = re.split(r'(\s+)', input)
 
-    tokens = []
-    in_string = False
+# a single token of a lisp string: opening bracket, closing bracket, quoted string or plain atom.
+# A quotation mark without its counterpart is matched by the last group.
+_LISP_TOKEN = re.compile(r'''\s*(?:(\()|(\))|"((?:[^"\\]|\\.)*)"|([^\s()"]+)|("))''', re.DOTALL)
+_LISP_OPENING, _LISP_CLOSING, _LISP_QUOTED, _LISP_ATOM, _LISP_INVALID = range(1, 6)
 
-    for token in base_tokens:
-        if not in_string and token.isspace():
-            continue
+# only quotation marks and backslashes are escaped, other backslashes (like in windows paths) are kept
+_LISP_ESCAPE = re.compile(r'\\(["\\])')
 
-        if len(token) == 0:
-            continue
 
-        if token[0] == '"':
-            if in_string:
-                tokens[-1] += token[1:]
-                in_string = False
-            else:
-                tokens.append(token[1:])
-                in_string = True
-
-        elif token[-1] == '"':
-            if in_string:
-                tokens[-1] += token[:-1]
-                in_string = False
-            else:
-                tokens.append(token[:-1])
-                in_string = True
+def _unescapeLispString(string):
+    return _LISP_ESCAPE.sub(r'\1', string) if '\\' in string else string
 
-        else:
-            if in_string:
-                tokens[-1] += token
-            else:
-                tokens.append(token)
 
-    if in_string:
-        raise RuntimeError("missing closing quotation mark")
+def lispTokenizer(input):
+    '''
+    Convert a string of characters into a list of tokens.
 
-    # TOOD: remove invalid spaces from quotation (when having brackets inside)
+    The input is scanned in a single pass. Quoted strings are returned without their quotation marks.
+    '''
+    tokens = []
+    for match in _LISP_TOKEN.finditer(input):
+        kind = match.lastindex
+        if kind == _LISP_QUOTED:
+            tokens.append(_unescapeLispString(match.group(kind)))
+        elif kind == _LISP_INVALID:
+            raise RuntimeError("missing closing quotation mark")
+        else:
+            tokens.append(match.group(kind))
 
     return tokens
 
 
 def parseLispString(input):
+    '''
+    Convert a lisp string into nested lists of strings
+
+    Brackets inside of quoted strings are part of the string, so ``(descr "a (b)")``
+    results in ``['descr', 'a (b)']``.
+    '''
     syntax_tree = []
     current_node = syntax_tree
     scope = [syntax_tree]
 
-    for token in lispTokenizer(input):
-        if token == "(":
-            scope.append([])
-            current_node.append(scope[-1])
-            current_node = scope[-1]
+    for match in _LISP_TOKEN.finditer(input):
+        kind = match.lastindex
+        if kind == _LISP_ATOM:
+            current_node.append(match.group(kind))
+
+        elif kind == _LISP_OPENING:
+            current_node = []
+            scope[-1].append(current_node)
+            scope.append(current_node)
 
-        elif token == ")":
+        elif kind == _LISP_CLOSING:
             if len(scope) <= 1:
                 raise RuntimeError("missing opening brackets")
 
             scope.pop()
             current_node = scope[-1]
 
-        else:
-            current_node.append(token)
+        elif kind == _LISP_QUOTED:
+            current_node.append(_unescapeLispString(match.group(kind)))
+
+        elif kind == _LISP_INVALID:
+            raise RuntimeError("missing closing quotation mark")
 
     if len(scope) > 1:
         raise RuntimeError("missing closing brackets")
@@ -119,6 +189,23 @@ def parseLispString(input):
     return syntax_tree
 
 
+def textWriter(stream):
+    r"""Get a function which writes the native strings of the serializers into a text stream
+
+    On python 2 text streams like ``io.StringIO`` or files opened with ``io.open`` only accept ``unicode``,
+    so the (utf-8 encoded) byte strings are converted first. On python 3 this is ``stream.write`` itself.
+
+    :param stream: file like object opened in text mode
+    :return: callable which accepts the string fragments of the output
+    """
+    if sys.version_info[0] != 2:
+        return stream.write
+
+    def write(text):
+        stream.write(text if isinstance(text, unicode) else text.decode('utf-8'))  # NOQA
+    return write
+
+
 class SexprSerializer(object):
     '''
     Converts a nested python list into a sexpr syntax which can be parsed by KiCad
@@ -144,46 +231,62 @@ class SexprSerializer(object):
             raise RuntimeError("unexpected type: {}".format(pType))
 
     def sexpr_to_string(self, sexpr, prefix=None):
-        if prefix is None:
-            prefix = ""
+        parts = []
+        self._write_sexpr(parts.append, sexpr, prefix or "", "")
+        return "".join(parts)
 
-        serial_string = "("
+    def _write_sexpr(self, write, sexpr, prefix, extra_indent):
+        '''
+        write a single list to the output, streaming every token directly into write()
 
-        # see: https://stackoverflow.com/questions/3190706/nonlocal-keyword-in-python-2-x
-        loop_ctrl = {'first': True, 'indentation': False}
+        :param write: callable which accepts the string fragments of the output
+        :param sexpr: list which should be written
+        :param prefix: indentation used for line breaks inside this list
+        :param extra_indent: additional indentation for every line break inside of this list. It is accumulated
+                             for every nesting level which starts on a new line.
+        '''
+        write("(")
 
-        def get_separator():
-            if loop_ctrl['first']:
-                loop_ctrl['first'] = False
-                return_str = ""
-            else:
-                return_str = " "
+        first = True
+        indentation = False
 
-            if loop_ctrl['indentation']:
-                return_str += " "
-                loop_ctrl['indentation'] = False
+        for attr in sexpr:
+            if attr is SexprSerializer.NEW_LINE:
+                write("\n")
+                write(extra_indent)
+                write(prefix)
+                indentation = True
+                continue
+
+            if first:
+                first = False
+            else:
+                write(" ")
 
-            return return_str
+            if indentation:
+                write(" ")
 
-        for attr in sexpr:
             if isinstance(attr, (tuple, list)):
-                return_string = self.sexpr_to_string(attr, prefix + " ")
+                child_indent = extra_indent + " " if indentation else extra_indent
+                self._write_sexpr(write, attr, prefix + " ", child_indent)
+            else:
+                primitive = self.primitive_to_string(attr)
+                if extra_indent and "\n" in primitive:
+                    primitive = primitive.replace("\n", "\n" + extra_indent)
+                write(primitive)
 
-                if loop_ctrl['indentation']:
-                    return_string = return_string.replace('\n', '\n ')
-                serial_string += get_separator()
+            indentation = False
 
-                serial_string += return_string
-            elif attr == SexprSerializer.NEW_LINE:
-                serial_string += "\n"
-                serial_string += prefix
-                loop_ctrl['indentation'] = True
-            else:
-                serial_string += get_separator()
-                serial_string += self.primitive_to_string(attr)
+        write(")")
+
+    def write(self, stream):
+        '''
+        write the sexpr into a stream, without building the whole string in memory
 
-        serial_string += ")"
-        return serial_string
+        :param stream: file like object opened in text mode (for example a file opened with ``io.open`` or
+                       ``io.StringIO``)
+        '''
+        self._write_sexpr(textWriter(stream), self.sexpr, "", "")
 
     def __str__(self):
         '''
@@ -193,8 +296,26 @@ class SexprSerializer(object):
 
 
 def parseTimestamp(timestamp):
-    raise NotImplemented()
-    return time.time()  # TOOD
+    r"""Parse a timestamp written by formatTimestamp
+
+    :param timestamp: hexadecimal timestamp as used by the ``tedit`` field
+    :return: timestamp as ``int``
+    """
+    return int(timestamp, 16)
+
+
+def contentTimestamp(content):
+    r"""Derive a stable timestamp from the content of a file
+
+    The same content always results in the same timestamp, which makes the
+    output of a generator independent of the time it was run.
+
+    :param content: content of the file
+    :return: timestamp which fits into the 32 bit of a KiCad ``tedit`` field
+    """
+    if not isinstance(content, bytes):
+        content = content.encode('utf-8')
+    return int(hashlib.sha1(content).hexdigest()[:8], 16)
 
 
 def formatTimestamp(timestamp=None):
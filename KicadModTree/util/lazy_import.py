@@ -0,0 +1,91 @@
+# KicadModTree is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# KicadModTree is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+#
+# (C) 2018 by Thomas Pointhuber, <thomas.pointhuber@gmx.at>
+
+import sys
+import types
+
+# module level __getattr__ and __dir__ (PEP 562)
+LAZY_IMPORT_SUPPORTED = sys.version_info >= (3, 7)
+
+
+def _resolve(package, name, location):
+    module_name, attribute = location
+    if module_name.startswith('.'):
+        module_name = package + module_name
+
+    # __import__ instead of importlib.import_module, which bypasses "python -X importtime"
+    __import__(module_name)
+    module = sys.modules[module_name]
+    return module if attribute is None else getattr(module, attribute)
+
+
+class _LazyPackage(types.ModuleType):
+    # Importing a submodule stores it as attribute of its package. Most submodules have the same name as the class
+    # they define (KicadModTree.nodes.base.Pad defines Pad), so importing one directly would replace the class
+    # exported by the package with the module. Bind the exported object instead.
+
+    def __setattr__(self, name, value):
+        location = self.__dict__['_lazy_attributes'].get(name)
+        if location is not None and location[1] is not None and isinstance(value, types.ModuleType) \
+                and value.__name__ == '{}.{}'.format(self.__name__, name):
+            value = _resolve(self.__name__, name, location)
+        types.ModuleType.__setattr__(self, name, value)
+
+
+def lazyImport(module_globals, attributes):
+    r"""Export names of a package which are only imported when they are used for the first time
+
+    Sets ``__all__``, so ``from package import *`` still exports all names, as well as ``__getattr__``
+    and ``__dir__`` of the package. Python versions before 3.7 do not support ``__getattr__`` for modules,
+    there all names are imported immediately.
+
+    :param module_globals:
+        ``globals()`` of the package ``__init__``
+    :type module_globals: ``dict``
+
+    :param attributes:
+        exported name -> (module, attribute). The module name can start with "." to refer to a
+        submodule of the package, attribute None exports the module itself.
+    :type attributes: ``dict``
+
+    :Example:
+
+    >>> lazyImport(globals(), {'Pad': ('.Pad', 'Pad'), 'base': ('.base', None)})
+    """
+
+    package = module_globals['__name__']
+    module_globals['__all__'] = sorted(attributes)
+
+    if not LAZY_IMPORT_SUPPORTED:
+        for name, location in attributes.items():
+            module_globals[name] = _resolve(package, name, location)
+        return
+
+    def __getattr__(name):
+        location = attributes.get(name)
+        if location is None:
+            raise AttributeError("module '{}' has no attribute '{}'".format(package, name))
+
+        value = _resolve(package, name, location)
+        module_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(module_globals) | set(attributes))
+
+    module_globals['__getattr__'] = __getattr__
+    module_globals['__dir__'] = __dir__
+    module_globals['_lazy_attributes'] = attributes
+    sys.modules[package].__class__ = _LazyPackage
@@ -49,6 +49,7 @@ import os
 import math
 
 sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "\\..\\..")
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "tools"))
 
 from collections import namedtuple
 
@@ -56,6 +57,7 @@ from KicadModTree import Point
 from KicadModTree.nodes.base import Line, Arc, Circle, Text, Pad
 from KicadModTree.nodes.specialized import RectFill
 from KicadModTree.util.kicad_util import formatFloat
+from keepout_index import KeepoutIndex
 
 class Layer:
 
@@ -635,7 +637,7 @@ class Keepout():
 
     def __init__(self, layer):
         self.layer = layer
-        self.keepouts = []
+        self.keepouts = KeepoutIndex(bounds=lambda keepout: (keepout.x0, keepout.x1, keepout.y0, keepout.y1))
         self.min_length = 0.01
         layer.keepout = self
 
@@ -713,24 +715,24 @@ class Keepout():
         if self.DEBUG & 2:
             print("S", line)
 
-        changes = len(self.keepouts) > 0
-        while changes != False:
-            changes = False
-            for keepout in self.keepouts:
-                if keepout.VlineIntersects(line.x0) if vertical else keepout.HlineIntersects(line.y0):
-                    for i in reversed(range(0, len(segments))):
-                        segment = segments[i]
-                        changes = keepout.VLineTrim(segment) if vertical else keepout.HLineTrim(segment)
-                        if changes != False:
-                            segments.pop(i)
-                            for segment in changes:
-                                add_segment(segment[0], segment[1], segment[2], segment[3])
-                            
-                        if self.DEBUG & 2:
-                            print("CHOP - line:", segment[0], segment[1], segment[2], segment[3], "keepout:", keepout)
-
-            if changes != False:
-                break
+        # only keepouts touching the line can trim it, the tolerance covers the rounding in VlineIntersects
+        if vertical:
+            keepouts = self.keepouts.intersectingVLine(line.x0, line.y0, line.y1, tolerance=1e-6)
+        else:
+            keepouts = self.keepouts.intersectingHLine(line.y0, line.x0, line.x1, tolerance=1e-6)
+
+        for keepout in keepouts:
+            if keepout.VlineIntersects(line.x0) if vertical else keepout.HlineIntersects(line.y0):
+                for i in reversed(range(0, len(segments))):
+                    segment = segments[i]
+                    changes = keepout.VLineTrim(segment) if vertical else keepout.HLineTrim(segment)
+                    if changes != False:
+                        segments.pop(i)
+                        for segment in changes:
+                            add_segment(segment[0], segment[1], segment[2], segment[3])
+
+                    if self.DEBUG & 2:
+                        print("CHOP - line:", segment[0], segment[1], segment[2], segment[3], "keepout:", keepout)
 
         if self.DEBUG & 2:
             print("LI", segments)
@@ -12,6 +12,7 @@ sys.path.append(os.path.join(sys.path[0], "..", "..", ".."))
 from KicadModTree import *  # NOQA
 from KicadModTree.nodes.base.Pad import Pad  # NOQA
 sys.path.append(os.path.join(sys.path[0], "..", "..", "tools"))  # load parent path of tools
+from config_loader import loadYaml
 
 from KicadModTree import *
 import itertools
@@ -241,11 +242,10 @@ if __name__ == '__main__':
     if args.verbose:
         DEBUG_LEVEL = args.verbose
     
-    with open(args.global_config, 'r') as config_stream:
-        try:
-            configuration = yaml.safe_load(config_stream)
-        except yaml.YAMLError as exc:
-            print(exc)
+    try:
+        configuration = loadYaml(args.global_config)
+    except yaml.YAMLError as exc:
+        print(exc)
 
     # with open(args.series_config, 'r') as config_stream:
         # try:
@@ -253,22 +253,20 @@ if __name__ == '__main__':
         # except yaml.YAMLError as exc:
             # print(exc)
     
-    with open(args.ipc_doc, 'r') as config_stream:
-        try:
-            configuration.update(yaml.safe_load(config_stream))
-        except yaml.YAMLError as exc:
-            print(exc)
+    try:
+        configuration.update(loadYaml(args.ipc_doc, frozen=True))
+    except yaml.YAMLError as exc:
+        print(exc)
 
     # generate dict of A, B .. Y, Z, AA, AB .. CY less easily-confused letters
     rowNamesList = [x for x in ascii_uppercase if x not in ["I", "O", "Q", "S", "X", "Z"]]
     configuration.update({'row_names': list(itertools.islice(rowNameGenerator(rowNamesList), 80))})
 
     for filepath in args.files:
-        with open(filepath, 'r') as command_stream:
-            try:
-                cmd_file = yaml.safe_load(command_stream)
-            except yaml.YAMLError as exc:
-                print(exc)
+        try:
+            cmd_file = loadYaml(filepath)
+        except yaml.YAMLError as exc:
+            print(exc)
         for pkg in cmd_file:
             print("generating part for parameter set {}".format(pkg))
             generateFootprint(configuration, cmd_file[pkg], pkg)
@@ -2,9 +2,13 @@
 
 import sys
 import os
+from copy import deepcopy
 import argparse
 import yaml
 import math
+import time
+import traceback
+import multiprocessing
 
 sys.path.append(os.path.join(sys.path[0], "..", "..", ".."))  # load parent path of KicadModTree
 
@@ -15,6 +19,8 @@ from footprint_text_fields import addTextFields
 from ipc_pad_size_calculators import *
 from quad_dual_pad_border import add_dual_or_quad_pad_border
 from drawing_tools import nearestSilkPointOnOrthogonalLine
+from build_cache import BuildCache, fileHash, DEFAULT_CACHE_FILE
+from config_loader import loadYaml
 
 sys.path.append(os.path.join(sys.path[0], "..", "utils"))
 from ep_handling_utils import getEpRoundRadiusParams
@@ -32,21 +38,20 @@ def roundToBase(value, base):
 class Gullwing():
     def __init__(self, configuration):
         self.configuration = configuration
-        with open(ipc_doc_file, 'r') as ipc_stream:
-            try:
-                self.ipc_defintions = yaml.safe_load(ipc_stream)
+        try:
+            self.ipc_defintions = loadYaml(ipc_doc_file, frozen=True)
 
-                self.configuration['min_ep_to_pad_clearance'] = 0.2
+            self.configuration['min_ep_to_pad_clearance'] = 0.2
 
-                #ToDo: find a settings file that can contain these.
-                self.configuration['paste_radius_ratio'] = 0.25
-                self.configuration['paste_maximum_radius'] = 0.25
+            #ToDo: find a settings file that can contain these.
+            self.configuration['paste_radius_ratio'] = 0.25
+            self.configuration['paste_maximum_radius'] = 0.25
 
-                if 'ipc_generic_rules' in self.ipc_defintions:
-                    self.configuration['min_ep_to_pad_clearance'] = self.ipc_defintions['ipc_generic_rules'].get('min_ep_to_pad_clearance', 0.2)
+            if 'ipc_generic_rules' in self.ipc_defintions:
+                self.configuration['min_ep_to_pad_clearance'] = self.ipc_defintions['ipc_generic_rules'].get('min_ep_to_pad_clearance', 0.2)
 
-            except yaml.YAMLError as exc:
-                print(exc)
+        except yaml.YAMLError as exc:
+            print(exc)
 
     def calcPadDetails(self, device_dimensions, EP_size, ipc_data, ipc_round_base):
         # Zmax = Lmin + 2JT + √(CL^2 + F^2 + P^2)
@@ -137,7 +142,9 @@ class Gullwing():
 
         return dimensions
 
-    def generateFootprint(self, device_params, header):
+    def generateFootprint(self, device_params, header, dry_run=False):
+        # dry_run: only return the names of the files which would be written
+        written_files = []
         dimensions = Gullwing.deviceDimensions(device_params)
 
         if 'deleted_pins' in device_params:
@@ -152,11 +159,13 @@ class Gullwing():
             print("A footprint may not have deleted pins and hidden pins.")
         else:
             if dimensions['has_EP'] and 'thermal_vias' in device_params:
-                self.__createFootprintVariant(device_params, header, dimensions, True)
+                written_files.append(self.__createFootprintVariant(device_params, header, dimensions, True, dry_run))
+
+            written_files.append(self.__createFootprintVariant(device_params, header, dimensions, False, dry_run))
 
-            self.__createFootprintVariant(device_params, header, dimensions, False)
+        return written_files
 
-    def __createFootprintVariant(self, device_params, header, dimensions, with_thermal_vias):
+    def __createFootprintVariant(self, device_params, header, dimensions, with_thermal_vias, dry_run=False):
         fab_line_width = self.configuration.get('fab_line_width', 0.1)
         silk_line_width = self.configuration.get('silk_line_width', 0.12)
 
@@ -256,6 +265,11 @@ class Gullwing():
             .format(
                 model3d_path_prefix=model3d_path_prefix, lib_name=lib_name,
                 fp_name=fp_name_2)
+
+        output_dir = '{lib_name:s}.pretty/'.format(lib_name=lib_name)
+        filename =  '{outdir:s}{fp_name:s}.kicad_mod'.format(outdir=output_dir, fp_name=fp_name)
+        if dry_run:
+            return filename
         #print(fp_name)
         #print(pad_details)
 
@@ -586,14 +600,113 @@ class Gullwing():
 
         kicad_mod.append(Model(filename=model_name))
 
-        output_dir = '{lib_name:s}.pretty/'.format(lib_name=lib_name)
-        if not os.path.isdir(output_dir): #returns false if path does not yet exist!! (Does not check path validity)
-            os.makedirs(output_dir)
-        filename =  '{outdir:s}{fp_name:s}.kicad_mod'.format(outdir=output_dir, fp_name=fp_name)
+        # exist_ok: the workers of --jobs can create the same directory at the same time
+        os.makedirs(output_dir, exist_ok=True)
 
         file_handler = KicadFileHandler(kicad_mod)
         file_handler.writeFile(filename)
 
+        return filename
+
+# generator instance of the current process (created once per worker, see init_worker)
+worker_generator = None
+
+def init_worker(worker_configuration, worker_ipc_density, worker_ipc_doc_file):
+    # the generator reads these module level settings, so every worker needs its own copy
+    global configuration, ipc_density, ipc_doc_file, worker_generator
+
+    configuration = worker_configuration
+    ipc_density = worker_ipc_density
+    ipc_doc_file = worker_ipc_doc_file
+    worker_generator = Gullwing(configuration)
+
+def generate_parameter_set(job):
+    filepath, pkg, device_params, header = job
+    start_time = time.time()
+    written_files = []
+    try:
+        written_files = worker_generator.generateFootprint(device_params, header)
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+
+    return filepath, pkg, time.time() - start_time, error, written_files
+
+def output_files(generator, job):
+    _, _, device_params, header = job
+    try:
+        # the generator modifies the parameters
+        return generator.generateFootprint(deepcopy(device_params), header, dry_run=True)
+    except Exception:
+        # reported when the parameter set is generated
+        return []
+
+def load_jobs(files):
+    jobs = []
+    for filepath in files:
+        try:
+            cmd_file = loadYaml(filepath)
+        except yaml.YAMLError as exc:
+            raise ValueError("{} is not a valid parameter file:\n{}".format(filepath, exc))
+        header = cmd_file.pop('FileHeader')
+
+        for pkg in cmd_file:
+            jobs.append((filepath, pkg, cmd_file[pkg], header))
+
+    # parameter sets writing the same file would overwrite each other in a random order with --jobs,
+    # none of them is generated
+    generator = Gullwing(configuration)
+    writers = {}
+    for job in jobs:
+        for filename in output_files(generator, job):
+            writers.setdefault(os.path.normpath(filename), []).append(job)
+
+    rejected = []
+    for filename, conflicting_jobs in sorted(writers.items()):
+        if len(conflicting_jobs) > 1:
+            for filepath, pkg, _, _ in conflicting_jobs:
+                rejected.append((filepath, pkg, "{} is also written by {}".format(filename, ', '.join(
+                    job_id(job) for job in conflicting_jobs if job[:2] != (filepath, pkg)))))
+
+    rejected_ids = set((filepath, pkg) for filepath, pkg, _ in rejected)
+    return [job for job in jobs if job[:2] not in rejected_ids], rejected
+
+def job_id(job):
+    filepath, pkg, _, _ = job
+    return '{}:{}'.format(os.path.normpath(filepath), pkg)
+
+def job_key(cache, job):
+    _, _, device_params, header = job
+    return cache.inputKey(device_params, header, configuration, ipc_density, fileHash(ipc_doc_file))
+
+def run_jobs(jobs, num_jobs, cache, keys):
+    init_args = (configuration, ipc_density, ipc_doc_file)
+
+    if num_jobs == 1:
+        init_worker(*init_args)
+        results = map(generate_parameter_set, jobs)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(num_jobs, initializer=init_worker, initargs=init_args)
+        # imap keeps the order of the jobs, which makes the output deterministic
+        results = pool.imap(generate_parameter_set, jobs)
+
+    failed = []
+    try:
+        for job, (filepath, pkg, duration, error, written_files) in zip(jobs, results):
+            if error is None:
+                print("generating part for parameter set {}".format(pkg))
+                cache.update(job_id(job), keys[job_id(job)], written_files)
+            else:
+                print("generating part for parameter set {} FAILED".format(pkg))
+                failed.append((filepath, pkg, error))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return failed
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='use confing .yaml files to create footprints. See readme.md for details about the parameter file format.')
     parser.add_argument('files', metavar='file', type=str, nargs='+',
@@ -604,6 +717,12 @@ if __name__ == "__main__":
     parser.add_argument('--ipc_doc', type=str, nargs='?', help='IPC definition document', default='../ipc_definitions.yaml')
     parser.add_argument('--force_rectangle_pads', action='store_true', help='Force the generation of rectangle pads instead of rounded rectangle')
     parser.add_argument('--kicad4_compatible', action='store_true', help='Create footprints compatible with version 4 (avoids round-rect and custom pads).')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='ignore the build cache and generate all parameter sets')
+    parser.add_argument('--cache_file', type=str, nargs='?', default=DEFAULT_CACHE_FILE,
+                        help='file storing the inputs of already generated parameter sets')
+    parser.add_argument('-j', '--jobs', type=int, nargs='?', const=0, default=1,
+                        help='number of parallel worker processes (without a number: one per cpu core)')
     args = parser.parse_args()
 
     if args.density == 'L':
@@ -613,17 +732,15 @@ if __name__ == "__main__":
 
     ipc_doc_file = args.ipc_doc
 
-    with open(args.global_config, 'r') as config_stream:
-        try:
-            configuration = yaml.safe_load(config_stream)
-        except yaml.YAMLError as exc:
-            print(exc)
+    try:
+        configuration = loadYaml(args.global_config)
+    except yaml.YAMLError as exc:
+        print(exc)
 
-    with open(args.series_config, 'r') as config_stream:
-        try:
-            configuration.update(yaml.safe_load(config_stream))
-        except yaml.YAMLError as exc:
-            print(exc)
+    try:
+        configuration.update(loadYaml(args.series_config))
+    except yaml.YAMLError as exc:
+        print(exc)
 
     if args.force_rectangle_pads or args.kicad4_compatible:
         configuration['round_rect_max_radius'] = None
@@ -631,16 +748,29 @@ if __name__ == "__main__":
 
     configuration['kicad4_compatible'] = args.kicad4_compatible
 
-    for filepath in args.files:
-        gw = Gullwing(configuration)
-
-        with open(filepath, 'r') as command_stream:
-            try:
-                cmd_file = yaml.safe_load(command_stream)
-            except yaml.YAMLError as exc:
-                print(exc)
-        header = cmd_file.pop('FileHeader')
-
-        for pkg in cmd_file:
-            print("generating part for parameter set {}".format(pkg))
-            gw.generateFootprint(cmd_file[pkg], header)
+    cache = BuildCache(args.cache_file, enabled=not args.rebuild)
+
+    # the keys are calculated before generating, because the generator modifies the parameters
+    jobs = []
+    keys = {}
+    all_jobs, rejected = load_jobs(args.files)
+    for filepath, pkg, error in rejected:
+        print("parameter set {} REJECTED".format(pkg))
+    for job in all_jobs:
+        keys[job_id(job)] = job_key(cache, job)
+        if cache.isUpToDate(job_id(job), keys[job_id(job)]):
+            print("parameter set {} is up to date".format(job[1]))
+        else:
+            jobs.append(job)
+
+    num_jobs = args.jobs if args.jobs > 0 else multiprocessing.cpu_count()
+    try:
+        failed = rejected + run_jobs(jobs, min(num_jobs, max(len(jobs), 1)), cache, keys)
+    finally:
+        cache.save()
+
+    if failed:
+        print("\n{} of {} parameter sets failed:".format(len(failed), len(jobs) + len(rejected)))
+        for filepath, pkg, error in failed:
+            print("\n{} ({}):\n{}".format(pkg, filepath, error))
+        sys.exit(1)
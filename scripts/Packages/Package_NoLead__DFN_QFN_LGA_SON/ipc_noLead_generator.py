@@ -16,6 +16,7 @@ sys.path.append(os.path.join(sys.path[0], "..", "..", "tools"))  # load parent p
 from footprint_text_fields import addTextFields
 from ipc_pad_size_calculators import *
 from quad_dual_pad_border import add_dual_or_quad_pad_border
+from config_loader import loadYaml
 
 sys.path.append(os.path.join(sys.path[0], "..", "utils"))
 from ep_handling_utils import getEpRoundRadiusParams
@@ -39,21 +40,20 @@ def roundToBase(value, base):
 class NoLead():
     def __init__(self, configuration):
         self.configuration = configuration
-        with open(ipc_doc_file, 'r') as ipc_stream:
-            try:
-                self.ipc_defintions = yaml.safe_load(ipc_stream)
+        try:
+            self.ipc_defintions = loadYaml(ipc_doc_file, frozen=True)
 
-                self.configuration['min_ep_to_pad_clearance'] = 0.2
+            self.configuration['min_ep_to_pad_clearance'] = 0.2
 
-                #ToDo: find a settings file that can contain these.
-                self.configuration['paste_radius_ratio'] = 0.25
-                self.configuration['paste_maximum_radius'] = 0.25
+            #ToDo: find a settings file that can contain these.
+            self.configuration['paste_radius_ratio'] = 0.25
+            self.configuration['paste_maximum_radius'] = 0.25
 
-                if 'ipc_generic_rules' in self.ipc_defintions:
-                    self.configuration['min_ep_to_pad_clearance'] = self.ipc_defintions['ipc_generic_rules'].get('min_ep_to_pad_clearance', 0.2)
+            if 'ipc_generic_rules' in self.ipc_defintions:
+                self.configuration['min_ep_to_pad_clearance'] = self.ipc_defintions['ipc_generic_rules'].get('min_ep_to_pad_clearance', 0.2)
 
-            except yaml.YAMLError as exc:
-                print(exc)
+        except yaml.YAMLError as exc:
+            print(exc)
 
     def calcPadDetails(self, device_dimensions, EP_size, ipc_data, ipc_round_base):
         # Zmax = Lmin + 2JT + √(CL^2 + F^2 + P^2)
@@ -547,17 +547,15 @@ if __name__ == "__main__":
 
     ipc_doc_file = args.ipc_doc
 
-    with open(args.global_config, 'r') as config_stream:
-        try:
-            configuration = yaml.safe_load(config_stream)
-        except yaml.YAMLError as exc:
-            print(exc)
+    try:
+        configuration = loadYaml(args.global_config)
+    except yaml.YAMLError as exc:
+        print(exc)
 
-    with open(args.series_config, 'r') as config_stream:
-        try:
-            configuration.update(yaml.safe_load(config_stream))
-        except yaml.YAMLError as exc:
-            print(exc)
+    try:
+        configuration.update(loadYaml(args.series_config))
+    except yaml.YAMLError as exc:
+        print(exc)
 
     if args.force_rectangle_pads or args.kicad4_compatible:
         configuration['round_rect_max_radius'] = None
@@ -568,10 +566,9 @@ if __name__ == "__main__":
     for filepath in args.files:
         no_lead = NoLead(configuration)
 
-        with open(filepath, 'r') as command_stream:
-            try:
-                cmd_file = yaml.safe_load(command_stream)
-            except yaml.YAMLError as exc:
-                print(exc)
+        try:
+            cmd_file = loadYaml(filepath)
+        except yaml.YAMLError as exc:
+            print(exc)
         for pkg in cmd_file:
             no_lead.generateFootprint(cmd_file[pkg], pkg)
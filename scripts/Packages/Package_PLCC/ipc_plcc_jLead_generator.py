@@ -12,6 +12,7 @@ from KicadModTree import *  # NOQA
 from KicadModTree.nodes.base.Pad import Pad  # NOQA
 sys.path.append(os.path.join(sys.path[0], "..", "..", "tools"))  # load parent path of tools
 from footprint_text_fields import addTextFields
+from config_loader import loadYaml
 
 ipc_density = 'nominal'
 ipc_doc_file = '../ipc_definitions.yaml'
@@ -28,11 +29,10 @@ def params_inch_to_metric(device_params):
 class QFP():
     def __init__(self, configuration):
         self.configuration = configuration
-        with open(ipc_doc_file, 'r') as ipc_stream:
-            try:
-                self.ipc_defintions = yaml.safe_load(ipc_stream)
-            except yaml.YAMLError as exc:
-                print(exc)
+        try:
+            self.ipc_defintions = loadYaml(ipc_doc_file, frozen=True)
+        except yaml.YAMLError as exc:
+            print(exc)
 
 
 
@@ -465,17 +465,15 @@ if __name__ == "__main__":
 
     ipc_doc_file = args.ipc_doc
 
-    with open(args.global_config, 'r') as config_stream:
-        try:
-            configuration = yaml.safe_load(config_stream)
-        except yaml.YAMLError as exc:
-            print(exc)
+    try:
+        configuration = loadYaml(args.global_config)
+    except yaml.YAMLError as exc:
+        print(exc)
 
-    with open(args.series_config, 'r') as config_stream:
-        try:
-            configuration.update(yaml.safe_load(config_stream))
-        except yaml.YAMLError as exc:
-            print(exc)
+    try:
+        configuration.update(loadYaml(args.series_config))
+    except yaml.YAMLError as exc:
+        print(exc)
 
     if args.force_rectangle_pads:
         configuration['round_rect_max_radius'] = None
@@ -484,11 +482,10 @@ if __name__ == "__main__":
     for filepath in args.files:
         qfp = QFP(configuration)
 
-        with open(filepath, 'r') as command_stream:
-            try:
-                cmd_file = yaml.safe_load(command_stream)
-            except yaml.YAMLError as exc:
-                print(exc)
+        try:
+            cmd_file = loadYaml(filepath)
+        except yaml.YAMLError as exc:
+            print(exc)
         for pkg in cmd_file:
             if cmd_file[pkg].get('units', 'mm') == 'inches':
                 params_inch_to_metric(cmd_file[pkg])
@@ -14,6 +14,7 @@ sys.path.append(os.path.join(sys.path[0], "..", "tools"))  # load parent path of
 from footprint_text_fields import addTextFields
 from ipc_pad_size_calculators import *
 from drawing_tools import nearestSilkPointOnOrthogonalLineSmallClerance
+from config_loader import loadYaml
 
 size_definition_path = "size_definitions/"
 def roundToBase(value, base):
@@ -32,17 +33,15 @@ def merge_dicts(*dict_args):
 class TwoTerminalSMDchip():
     def __init__(self, command_file, configuration):
         self.configuration = configuration
-        with open(command_file, 'r') as command_stream:
-            try:
-                self.footprint_group_definitions = yaml.safe_load(command_stream)
-            except yaml.YAMLError as exc:
-                print(exc)
+        try:
+            self.footprint_group_definitions = loadYaml(command_file)
+        except yaml.YAMLError as exc:
+            print(exc)
         ipc_doc = configuration['ipc_definition']
-        with open(ipc_doc, 'r') as ipc_stream:
-            try:
-                self.ipc_defintions = yaml.safe_load(ipc_stream)
-            except yaml.YAMLError as exc:
-                print(exc)
+        try:
+            self.ipc_defintions = loadYaml(ipc_doc, frozen=True)
+        except yaml.YAMLError as exc:
+            print(exc)
 
     def calcPadDetails(self, device_dimensions, ipc_data, ipc_round_base, footprint_group_data):
         # Zmax = Lmin + 2JT + √(CL^2 + F^2 + P^2)
@@ -110,11 +109,10 @@ class TwoTerminalSMDchip():
             device_size_docs = footprint_group_data['size_definitions']
             package_size_defintions={}
             for device_size_doc in device_size_docs:
-                with open(size_definition_path+device_size_doc, 'r') as size_stream:
-                    try:
-                        package_size_defintions.update(yaml.safe_load(size_stream))
-                    except yaml.YAMLError as exc:
-                        print(exc)
+                try:
+                    package_size_defintions.update(loadYaml(size_definition_path+device_size_doc))
+                except yaml.YAMLError as exc:
+                    print(exc)
 
             for size_name in package_size_defintions:
                 device_size_data = package_size_defintions[size_name]
@@ -338,17 +336,15 @@ if __name__ == "__main__":
     parser.add_argument('--force_rectangle_pads', action='store_true', help='Force the generation of rectangle pads instead of rounded rectangle (KiCad 4.x compatibility.)')
     args = parser.parse_args()
 
-    with open(args.global_config, 'r') as config_stream:
-        try:
-            configuration = yaml.safe_load(config_stream)
-        except yaml.YAMLError as exc:
-            print(exc)
+    try:
+        configuration = loadYaml(args.global_config)
+    except yaml.YAMLError as exc:
+        print(exc)
 
-    with open(args.series_config, 'r') as config_stream:
-        try:
-            configuration.update(yaml.safe_load(config_stream))
-        except yaml.YAMLError as exc:
-            print(exc)
+    try:
+        configuration.update(loadYaml(args.series_config))
+    except yaml.YAMLError as exc:
+        print(exc)
     args = parser.parse_args()
     configuration['ipc_definition'] = args.ipc_definition
     if args.force_rectangle_pads:
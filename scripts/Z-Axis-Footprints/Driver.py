@@ -1,7 +1,31 @@
+import argparse
+import json
+import os
 import sys
 
 from ElastomerPadsRouted import ElastomerPadsRouted
 from ElastomerPadBuilder import ElastomerPadBuilder
+from Verbosity import QUIET, SUMMARY
+from KicadModTree import ModArgparser
+
+# fields of a panel spec besides its name, every field is passed to the with<Field> method of the builder
+PANEL_FIELDS = [
+    # (field, type, required, default of the batch mode)
+    ("numPads", int, True, None),
+    ("numCols", int, True, None),
+    ("pitchX", float, True, None),
+    ("pitchY", float, True, None),
+    ("padWidth", float, True, None),
+    ("padHeight", float, True, None),
+    ("cutPadWidth", float, False, 0.0),
+    ("cutPadHeight", float, False, 0.0),
+    ("cutGapPart", float, False, 0.0),
+    ("offsetForCutLineY", float, False, 0.0),
+    ("blankSize", float, False, 0.0),
+    ("numGroups", int, False, 0),
+    # the builders of the workers only print the results table by default
+    ("verbosity", int, False, QUIET),
+]
 
 def zfill621():
     z = ElastomerPadsRouted("zfill-621-rev-b-elastomer-pads")
@@ -92,11 +116,75 @@ def aldec_pads():
     builder.makeFootprint()
 
 
+def buildPanel(spec):
+    """
+    Build and save a single panel with the ElastomerPadBuilder.
+
+    Parameters
+    ----------
+    spec : dict
+        ``name`` of the panel and the values of the PANEL_FIELDS, missing fields keep the builder defaults
+        (run_batch passes every field, missing ones are set to the default of PANEL_FIELDS)
+
+    Returns
+    -------
+    dict
+        ``pads``: number of pads of the panel, ``output``: path of the written footprint
+    """
+    builder = ElastomerPadBuilder(spec['name'])
+    for field, _, _, _ in PANEL_FIELDS:
+        if field in spec:
+            getattr(builder, "with" + field[0].upper() + field[1:])(spec[field])
+
+    builder.build().makeFootprint()
+    return {'pads': len(builder.pad_grid),
+            'output': os.path.abspath(builder.footprint_name + ".kicad_mod")}
+
+
+def run_batch(argv=None):
+    """
+    Build all panels of .json, .csv or .yml spec files, in parallel on all cpu cores by default.
+
+    The specs of all panels are checked before the first panel is built. The fields of a spec are the
+    name of the panel and the PANEL_FIELDS, a .json file holds a list of specs like
+    ``[{"name": "aldec-zwrap-pads", "numPads": 52, "numCols": 6, ...}]``.
+    """
+    parser = argparse.ArgumentParser(description="build the elastomer panels of spec files")
+    parser.add_argument('files', metavar='file', nargs='+', help=".json, .csv or .yml files with panel specs")
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help="number of worker processes, 0 uses all cpu cores (default: 0)")
+    parser.add_argument('--fail-fast', action='store_true', help="stop at the first panel which can not be built")
+    parser.add_argument('--summary', help="write the result of every panel as json into this file")
+    args = parser.parse_args(argv)
+
+    panel_parser = ModArgparser(buildPanel)
+    panel_parser.add_parameter("name", type=str, required=True)
+    for field, field_type, required, default in PANEL_FIELDS:
+        panel_parser.add_parameter(field, type=field_type, required=required, default=default)
+
+    results = panel_parser.run_batch(args.files, jobs=args.jobs, fail_fast=args.fail_fast)
+
+    print("\n{:40s} {:8s} {:>9s} {:>8s}  {}".format("panel", "status", "seconds", "pads", "output"))
+    for result in results:
+        info = result['info'] or {}
+        print("{:40s} {:8s} {:9.2f} {:>8}  {}".format(
+            str(result['name']), result['status'], result['seconds'], info.get('pads', '-'),
+            info.get('output', result['error'] or '')))
+
+    if args.summary:
+        with open(args.summary, 'w') as summary_stream:
+            json.dump(results, summary_stream, indent=2)
+
+    if any(result['status'] != 'ok' for result in results):
+        sys.exit(1)
+
+
 def run_from_ui():
 
     # Expecting exactly 13 arguments after the script name
     if len(sys.argv) < 14:
         print("Usage: python Driver.py panelName numPadsX padPitchX padPitchY cutGap padWidth padHeight cutPadWidth cutPadHeight cutPadOffset blankSize numRepeatX numRepeatY")
+        print("       python Driver.py batch [-j JOBS] [--fail-fast] [--summary FILE] specs.json [...]")
         sys.exit(1)
 
     # Extract arguments
@@ -121,26 +209,27 @@ def run_from_ui():
     print(f"blankSize: {blankSize}\nnumRepeatX: {numRepeatX}\nnumRepeatY: {numRepeatY}\n")
 
     # Build the Elastomer pad using builder pattern
-    builder = (
-        ElastomerPadBuilder(panelName)
-        .withNumPads(numPadsX)
-        .withNumCols(2*numRepeatY)        
-        .withPitchX(padPitchX)
-        .withPitchY(padPitchY)
-        .withPadWidth(padWidth)
-        .withPadHeight(padHeight)
-        .withCutPadWidth(cutPadWidth)
-        .withCutPadHeight(cutPadHeight)
-        .withCutGapPart(cutGap)
-        .withOffsetForCutLineY(cutPadOffset)
-        .withBlankSize(blankSize)
-        .withNumGroups(numRepeatX)
-        .build()
-    )
-
-    builder.makeFootprint()
+    buildPanel({
+        'name': panelName,
+        'numPads': numPadsX,
+        'numCols': 2*numRepeatY,
+        'pitchX': padPitchX,
+        'pitchY': padPitchY,
+        'padWidth': padWidth,
+        'padHeight': padHeight,
+        'cutPadWidth': cutPadWidth,
+        'cutPadHeight': cutPadHeight,
+        'cutGapPart': cutGap,
+        'offsetForCutLineY': cutPadOffset,
+        'blankSize': blankSize,
+        'numGroups': numRepeatX,
+        'verbosity': SUMMARY,
+    })
 
 if __name__ == "__main__":
-    run_from_ui()
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        run_batch(sys.argv[2:])
+    else:
+        run_from_ui()
     #aldec_pads()
-    #builderTester()
\ No newline at end of file
+    #builderTester()
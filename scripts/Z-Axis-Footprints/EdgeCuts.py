@@ -6,11 +6,13 @@ sys.path.append('../..') # enable package import from parent directory
 
 from KicadModTree import *
 from KicadModTree.nodes.specialized.PadArray import PadArray
+from Verbosity import SUMMARY, printRenderTree
 
 
 class EdgeCuts():
-    def __init__(self, name):
+    def __init__(self, name, verbosity=SUMMARY):
         self.footprint_name = name
+        self.verbosity = verbosity
         self.kicad_mod = Footprint(self.footprint_name)
 
     def save(self):
@@ -21,7 +23,7 @@ class EdgeCuts():
         return val * 25.4
 
     def printInfo(self):
-        print(self.kicad_mod.getRenderTree())
+        printRenderTree(self.kicad_mod, self.verbosity)
 
     def makeEdgeCut(self, width=1.0, height=1.0, use_mm=False):
         if use_mm:
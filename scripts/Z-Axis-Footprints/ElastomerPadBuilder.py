@@ -1,8 +1,6 @@
-from re import S
 import re
 import sys
 import os
-from tkinter import SEL
 
 
 sys.path.append(os.path.join(sys.path[0],".."))
@@ -10,7 +8,8 @@ sys.path.append('../..') # enable package import from parent directory
 
 from KicadModTree import *
 from KicadModTree.nodes.specialized.PadArray import PadArray
-from collections import defaultdict
+from PadGrid import PadGrid
+from Verbosity import SUMMARY, printRenderTree
 
 
 # works well, but names could be better 
@@ -18,7 +17,9 @@ class ElastomerPadBuilder():
     def __init__(self, name):
         self.footprint_name = name
         self.kicad_mod = Footprint(self.footprint_name)
-        self.pad_positions = []
+        self.pad_panel = None
+        self.pad_grid = PadGrid()
+        self.last_pad_number = 0
         self.cut_pad_positions = []
         self.numPattern = 0 
         self.cutMove = 0
@@ -34,6 +35,33 @@ class ElastomerPadBuilder():
         self.cutPadHeight = 0
         self.numGroups = 0
         self.blankSize = 0
+        self.verbosity = SUMMARY
+
+
+    @property
+    def pad_positions(self):
+        # (number, x, y) of every pad created by createPads
+        if self.pad_panel is None:
+            return []
+        return list(self.pad_panel.getPadPositions())
+
+
+    @property
+    def pad_bounds(self):
+        # (min_x, min_y, max_x, max_y) of the pad centers, kept up to date by createPads
+        return self.pad_grid.bounds()
+
+
+    @property
+    def next_pad_number(self):
+        # first free number after the pads created by createPads
+        return self.last_pad_number + 1
+
+
+    def withVerbosity(self, val):
+        # Verbosity.QUIET, SUMMARY or FULL (complete render tree)
+        self.verbosity = val
+        return self
 
 
     def withNumGroups(self, val):
@@ -111,7 +139,7 @@ class ElastomerPadBuilder():
 
 
     def printFootprintInfo(self):
-        print(self.kicad_mod.getRenderTree())
+        printRenderTree(self.kicad_mod, self.verbosity)
 
 
     def save(self, name):
@@ -128,19 +156,23 @@ class ElastomerPadBuilder():
         return padX
 
 
-    def createPad(self, number, x, y, w, h):
-        return Pad(
-            number=number,
+    def createPads(self):
+        # all pads share their geometry, the panel only stores number and center of every pad
+        self.pad_panel = PadPanel(
             type=Pad.TYPE_SMT,
             shape=Pad.SHAPE_RECT,
-            at=[x, y],
-            size=[w, h],
+            size=[self.padWidth, self.padHeight],
             layers=['F.Cu', 'F.Mask'],
             solder_mask_margin=0.25
         )
 
+        numbers = self.pad_panel.numbers
+        xs = self.pad_panel.xs
+        ys = self.pad_panel.ys
+        self.pad_grid = PadGrid()
+        self.last_pad_number = 0
+        addToGrid = self.pad_grid.addPad
 
-    def createPads(self):
         padNumber = 1
         padX = 0
         padY = 0
@@ -159,10 +191,11 @@ class ElastomerPadBuilder():
             padX = self.adjustForGap(k, padX)
             for i in range(self.numPads):
                 for j in range(self.numCols):
-                    pad = self.createPad(padNumber, padX, padY, 
-                                         self.padWidth, self.padHeight)
-                    self.kicad_mod.append(pad)
-                    self.pad_positions.append((padNumber, padX, padY))
+                    numbers.append(padNumber)
+                    xs.append(padX)
+                    ys.append(padY)
+                    addToGrid(padX, padY)
+                    self.last_pad_number = padNumber
                     padNumber += 1
                     if doMove:
                         padY += gapBtwnGroupsY
@@ -173,26 +206,26 @@ class ElastomerPadBuilder():
                 padX += self.pitchX
                 padY = 0
 
+        self.kicad_mod.append(self.pad_panel)
+
 
     def connectPads(self, trace_width=0.1):
         """ Draw copper lines between pads vertically within each column """
-        columns = defaultdict(list)
+        if self.pad_panel is None:
+            return
 
-        for pad_num, x, y in self.pad_positions:
-            columns[round(x, 5)].append((pad_num, x, y))
+        xs = self.pad_panel.xs
+        ys = self.pad_panel.ys
 
-        # Sort columns by X position (left-to-right)
-        for col_x in sorted(columns.keys()):
-            # Sort pads in this column by Y position (bottom-to-top)
-            col_pads = sorted(columns[col_x], key=lambda p: p[2])
-            
+        # columns left-to-right, pads bottom-to-top
+        for col_pads in self.pad_grid.iterColumns():
             # Draw vertical lines between consecutive pads
             for i in range(len(col_pads) - 1):
-                (pad_a, x1, y1) = col_pads[i]
-                (pad_b, x2, y2) = col_pads[i + 1]
+                a = col_pads[i]
+                b = col_pads[i + 1]
                 line = Line(
-                    start=[x1, y1 + self.inToMM(0.001)],  # tiny offset
-                    end=[x2, y2 - self.inToMM(0.001)],
+                    start=[xs[a], ys[a] + self.inToMM(0.001)],  # tiny offset
+                    end=[xs[b], ys[b] - self.inToMM(0.001)],
                     layer='F.Cu',
                     width=self.inToMM(trace_width)
                 )
@@ -202,14 +235,13 @@ class ElastomerPadBuilder():
     def addEdgeCuts(self, clearanceX=1.0, clearanceY=0.5):
         # add edge cuts around the pads with specified clearance
         # units are in MM
-        if not self.pad_positions:
+        if self.pad_bounds is None:
             return
 
         # Find min/max pad coordinates
-        xs = [x for _, x, _ in self.pad_positions]
-        ys = [y for _, _, y in self.pad_positions]
-        min_x, max_x = min(xs) - clearanceX, max(xs) + clearanceX
-        min_y, max_y = min(ys) - clearanceY, max(ys) + clearanceY
+        min_x, min_y, max_x, max_y = self.pad_bounds
+        min_x, max_x = min_x - clearanceX, max_x + clearanceX
+        min_y, max_y = min_y - clearanceY, max_y + clearanceY
 
         # Define corners (lists for KicadModTree)
         corners = [
@@ -236,21 +268,18 @@ class ElastomerPadBuilder():
             Place horizontal cut-line pads perpendicular to vertical main pads,
             centered on the first and last columns.
         """
-        if not self.pad_positions:
+        if self.pad_bounds is None:
             return
 
         if not self.cutPadWidth or not self.cutPadHeight:
             return
 
         # Determine pad bounds
-        xs = [x for _, x, _ in self.pad_positions]
-        ys = [y for _, _, y in self.pad_positions]
-        min_x, max_x = min(xs), max(xs)
-        min_y, max_y = min(ys), max(ys)
+        min_x, min_y, max_x, max_y = self.pad_bounds
         
         min_x = min_x - self.cutPadWidth
         max_x = max_x + self.cutPadWidth
-        padNumber = max([n for n, _, _ in self.pad_positions]) + 1
+        padNumber = self.next_pad_number
         y = 0
         
         for i in range(self.numCols):
@@ -286,25 +315,15 @@ class ElastomerPadBuilder():
         Each trace extends beyond pad height by extension_mm.
         """
 
-        if not self.pad_positions:
+        if not self.pad_grid:
             return
 
-        from collections import defaultdict
-        rows = defaultdict(list)
-
         if self.padWidth != 0:
             trace_width = self.padWidth
 
-        # Group pads by Y coordinate
-        for pad_num, x, y in self.pad_positions:
-            rows[round(y, 5)].append((pad_num, x, y))
-
-        sorted_row_keys = sorted(rows.keys())
-        bottom_row_y = sorted_row_keys[0]
-        top_row_y = sorted_row_keys[-1]
-
-        bottom_row = rows[bottom_row_y]
-        top_row = rows[top_row_y]
+        panel = self.pad_panel
+        bottom_row = [(panel.numbers[i], panel.xs[i], panel.ys[i]) for i in self.pad_grid.bottomRow()]
+        top_row = [(panel.numbers[i], panel.xs[i], panel.ys[i]) for i in self.pad_grid.topRow()]
 
         # ---- Bottom row vertical traces ----
         for pad_num, x, y in bottom_row:
@@ -334,11 +353,11 @@ class ElastomerPadBuilder():
 
 
     def makeCutLinesWrap(self):
+        if self.pad_bounds is None:
+            return
+
         # Determine pad bounds
-        xs = [x for _, x, _ in self.pad_positions]
-        ys = [y for _, _, y in self.pad_positions]
-        min_x, max_x = min(xs), max(xs)
-        min_y, max_y = min(ys), max(ys)
+        min_x, min_y, max_x, max_y = self.pad_bounds
         
         if not self.offsetForCutLineY:
             return
@@ -348,7 +367,7 @@ class ElastomerPadBuilder():
 
         min_x = min_x - self.cutPadWidth
         max_x = max_x + self.cutPadWidth
-        padNumber = max([n for n, _, _ in self.pad_positions]) + 1
+        padNumber = self.next_pad_number
         
         # adjust to edge of top of pad
         y = (-1) * (self.padHeight/2)
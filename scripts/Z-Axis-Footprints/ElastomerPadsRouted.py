@@ -33,7 +33,6 @@ Notes:
 """
 import sys
 import os
-from collections import defaultdict
 
 
 # Absolute path to where KicadModTree lives in your repo
@@ -44,17 +43,33 @@ if kmt_path not in sys.path:
     
 from KicadModTree import *
 from KicadModTree.nodes.specialized.PadArray import PadArray
-from collections import defaultdict
+from PadGrid import PadGrid
+from Verbosity import SUMMARY, printRenderTree
 
 class ElastomerPadsRouted():
-    def __init__(self, name):
+    def __init__(self, name, verbosity=SUMMARY):
         self.footprint_name = name
+        self.verbosity = verbosity
         self.kicad_mod = Footprint(self.footprint_name)
         self.pad_positions = []
+        self.pad_grid = PadGrid()
+        self.last_pad_number = 0
         self.cut_pad_positions = []
         # NOTE - add more fields so we can impl builder pattern later
 
 
+    @property
+    def pad_bounds(self):
+        # (min_x, min_y, max_x, max_y) of the pad centers, kept up to date by createPads
+        return self.pad_grid.bounds()
+
+
+    @property
+    def next_pad_number(self):
+        # first free number after the pads created by createPads
+        return self.last_pad_number + 1
+
+
     def setFootprint(self):
         if self.kicad_mod:
             self.kicad_mod.setDescription("footprint for " + self.footprint_name)
@@ -108,6 +123,8 @@ class ElastomerPadsRouted():
                                          padWidth, padHeight)
                     self.kicad_mod.append(pad)
                     self.pad_positions.append((padNumber, padX, padY))
+                    self.pad_grid.addPad(padX, padY)
+                    self.last_pad_number = padNumber
                     padNumber += 1
                     padY += pitchY
                 padX += pitchX
@@ -116,16 +133,10 @@ class ElastomerPadsRouted():
 
     def connectPads(self, trace_width=0.1):
         """ Draw copper lines between pads vertically within each column """
-        columns = defaultdict(list)
-
-        for pad_num, x, y in self.pad_positions:
-            columns[round(x, 5)].append((pad_num, x, y))
+        # columns left-to-right, pads bottom-to-top
+        for column in self.pad_grid.iterColumns():
+            col_pads = [self.pad_positions[i] for i in column]
 
-        # Sort columns by X position (left-to-right)
-        for col_x in sorted(columns.keys()):
-            # Sort pads in this column by Y position (bottom-to-top)
-            col_pads = sorted(columns[col_x], key=lambda p: p[2])
-            
             # Draw vertical lines between consecutive pads
             for i in range(len(col_pads) - 1):
                 (pad_a, x1, y1) = col_pads[i]
@@ -144,7 +155,7 @@ class ElastomerPadsRouted():
             Place horizontal cut-line pads perpendicular to vertical main pads,
             centered on the first and last columns.
         """
-        if not self.pad_positions:
+        if self.pad_bounds is None:
             return
 
         # Convert dimensions to mm
@@ -153,14 +164,11 @@ class ElastomerPadsRouted():
         pitchY = self.inToMM(pitchY)
 
         # Determine pad bounds
-        xs = [x for _, x, _ in self.pad_positions]
-        ys = [y for _, _, y in self.pad_positions]
-        min_x, max_x = min(xs), max(xs)
-        min_y, max_y = min(ys), max(ys)
+        min_x, min_y, max_x, max_y = self.pad_bounds
         
         min_x = min_x - padWidth
         max_x = max_x + padWidth
-        padNumber = max([n for n, _, _ in self.pad_positions]) + 1
+        padNumber = self.next_pad_number
         y = 0
         
         for i in range(numCols):
@@ -191,14 +199,13 @@ class ElastomerPadsRouted():
     def addEdgeCuts(self, clearanceX=1.0, clearanceY=0.5):
         # add edge cuts around the pads with specified clearance
         # units are in MM
-        if not self.pad_positions:
+        if self.pad_bounds is None:
             return
 
         # Find min/max pad coordinates
-        xs = [x for _, x, _ in self.pad_positions]
-        ys = [y for _, _, y in self.pad_positions]
-        min_x, max_x = min(xs) - clearanceX, max(xs) + clearanceX
-        min_y, max_y = min(ys) - clearanceY, max(ys) + clearanceY
+        min_x, min_y, max_x, max_y = self.pad_bounds
+        min_x, max_x = min_x - clearanceX, max_x + clearanceX
+        min_y, max_y = min_y - clearanceY, max_y + clearanceY
 
         # Define corners (lists for KicadModTree)
         corners = [
@@ -222,7 +229,7 @@ class ElastomerPadsRouted():
 
 
     def printFootprintInfo(self):
-        print(self.kicad_mod.getRenderTree())
+        printRenderTree(self.kicad_mod, self.verbosity)
 
 
     def save(self, name):
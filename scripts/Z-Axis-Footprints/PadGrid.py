@@ -0,0 +1,96 @@
+from array import array
+
+
+class PadGrid():
+    """
+    Index of the pads of an elastomer panel by column and row.
+
+    The builders add every pad when they create it, pads are referred to by
+    the order in which they were added (the index into pad_positions).
+    Columns are grouped by round(x, 5) and rows by round(y, 5).
+
+    The pads are created column by column from left to right and bottom to
+    top, so the columns come out ordered and nothing has to be sorted.
+    Pads added out of order are still handled, only then the affected
+    columns are sorted when they are read.
+
+    The bounding box of the pad centers is updated with every pad.
+    """
+
+    def __init__(self):
+        self.ys = array('d')
+        self.columns = {}   # round(x, 5) -> pad indices, bottom to top
+        self.rows = {}      # round(y, 5) -> pad indices, in the order they were added
+        self.bottomRowKey = None
+        self.topRowKey = None
+        self.minX = self.minY = float('inf')
+        self.maxX = self.maxY = float('-inf')
+        self._lastColumnKey = None
+        self._columnsSorted = True
+        self._unsortedColumns = set()
+
+
+    def __len__(self):
+        return len(self.ys)
+
+
+    def addPad(self, x, y):
+        index = len(self.ys)
+        self.ys.append(y)
+
+        if x < self.minX:
+            self.minX = x
+        if x > self.maxX:
+            self.maxX = x
+        if y < self.minY:
+            self.minY = y
+        if y > self.maxY:
+            self.maxY = y
+
+        colKey = round(x, 5)
+        column = self.columns.get(colKey)
+        if column is None:
+            column = self.columns[colKey] = []
+            if self._lastColumnKey is not None and colKey < self._lastColumnKey:
+                self._columnsSorted = False
+            self._lastColumnKey = colKey
+        elif y < self.ys[column[-1]]:
+            self._unsortedColumns.add(colKey)
+        column.append(index)
+
+        rowKey = round(y, 5)
+        row = self.rows.get(rowKey)
+        if row is None:
+            row = self.rows[rowKey] = []
+            if self.bottomRowKey is None or rowKey < self.bottomRowKey:
+                self.bottomRowKey = rowKey
+            if self.topRowKey is None or rowKey > self.topRowKey:
+                self.topRowKey = rowKey
+        row.append(index)
+
+        return index
+
+
+    def bounds(self):
+        """ (min_x, min_y, max_x, max_y) of the pad centers, None without pads """
+        if not self.ys:
+            return None
+        return (self.minX, self.minY, self.maxX, self.maxY)
+
+
+    def iterColumns(self):
+        """ Pad indices of every column, columns left to right and pads bottom to top """
+        keys = self.columns if self._columnsSorted else sorted(self.columns)
+        for key in keys:
+            column = self.columns[key]
+            if key in self._unsortedColumns:
+                column = sorted(column, key=self.ys.__getitem__)
+            yield column
+
+
+    def bottomRow(self):
+        return self.rows[self.bottomRowKey] if self.rows else []
+
+
+    def topRow(self):
+        return self.rows[self.topRowKey] if self.rows else []
@@ -5,11 +5,13 @@ sys.path.append(os.path.join(sys.path[0],".."))
 sys.path.append('../..') # enable package import from parent directory
 
 from KicadModTree import *
+from Verbosity import SUMMARY, printRenderTree
 
 class PanelCutLines():
     
-    def __init__(self, name):
+    def __init__(self, name, verbosity=SUMMARY):
         self.footprint_name = name
+        self.verbosity = verbosity
         self.kicad_mod = Footprint(self.footprint_name)
 
     def inToMM(self, val):
@@ -53,7 +55,7 @@ class PanelCutLines():
             self.kicad_mod.append(pad_left)
             self.kicad_mod.append(pad_right)
         
-        print(self.kicad_mod.getRenderTree())
+        printRenderTree(self.kicad_mod, self.verbosity)
         self.save()
 
 
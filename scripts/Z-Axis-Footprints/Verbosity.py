@@ -0,0 +1,16 @@
+import sys
+
+# verbosity levels of the footprint builders
+QUIET = 0       # nothing
+SUMMARY = 1     # top level nodes of the footprint, the rest only counted per node type
+FULL = 2        # complete render tree
+
+SUMMARY_CHILDS = 20
+
+
+def printRenderTree(kicad_mod, verbosity=SUMMARY):
+    """ Print the render tree of a footprint as much as the verbosity asks for """
+    if verbosity >= FULL:
+        kicad_mod.writeRenderTree(sys.stdout)
+    elif verbosity == SUMMARY:
+        kicad_mod.writeRenderTree(sys.stdout, max_depth=1, max_childs=SUMMARY_CHILDS)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+'''
+Compare the PadPanel of ElastomerPadBuilder.py against one Pad node per pad on the example panels of Driver.py.
+
+Only the pads are created (createPads) and serialized, the output of both variants has to be equal.
+
+usage: python scripts/Z-Axis-Footprints/bench_elastomer_panels.py
+'''
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "../.."))
+
+from KicadModTree import *  # NOQA
+from ElastomerPadBuilder import ElastomerPadBuilder  # NOQA
+
+
+def builderTester(builder_class):
+    return (builder_class("test-for-groups-builder")
+            .withNumPads(217)
+            .withNumCols(15)
+            .withPitchX(0.007874)
+            .withPitchY(0.275)
+            .withPadWidth(0.004)
+            .withPadHeight(0.15)
+            .withCutPadWidth(0.08)
+            .withCutPadHeight(.004)
+            .withCutGapPart(0.018)
+            .withNumGroups(5)
+            .build())
+
+
+def aldec_pads(builder_class):
+    return (builder_class("aldec-zwrap-pads")
+            .withNumPads(52)
+            .withNumCols(6)
+            .withPitchX(0.019685039)
+            .withPitchY(0.17716535)
+            .withPadWidth(0.0137795)
+            .withPadHeight(0.094488)
+            .withCutGapPart(0.03937)
+            .withOffsetForCutLineY(0.031496)
+            .withCutPadHeight(0.008)
+            .withCutPadWidth(0.16)
+            .withBlankSize(0.334646)
+            .withNumGroups(3)
+            .build())
+
+
+class LegacyElastomerPadBuilder(ElastomerPadBuilder):
+    # one Pad node per pad (implementation before the PadPanel)
+
+    def createPads(self):
+        ElastomerPadBuilder.createPads(self)
+        self.kicad_mod.remove(self.pad_panel)
+        for number, x, y in self.pad_panel.getPadPositions():
+            self.kicad_mod.append(Pad(number=number, type=Pad.TYPE_SMT, shape=Pad.SHAPE_RECT, at=[x, y],
+                                      size=[self.padWidth, self.padHeight], layers=['F.Cu', 'F.Mask'],
+                                      solder_mask_margin=0.25))
+
+
+def timePanel(example, builder_class, repeat):
+    best = None
+    for _ in range(repeat):
+        builder = example(builder_class)
+        start = time.time()
+        builder.setFootprint()
+        builder.createPads()
+        output = KicadFileHandler(builder.kicad_mod).serialize(timestamp=0)
+        seconds = time.time() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, len(builder.pad_positions), output
+
+
+def run(repeat=3):
+    for example in (builderTester, aldec_pads):
+        print("{}:".format(example.__name__))
+
+        outputs = []
+        for name, builder_class in (("Pad per pad (before)", LegacyElastomerPadBuilder),
+                                    ("PadPanel", ElastomerPadBuilder)):
+            seconds, pads, output = timePanel(example, builder_class, repeat)
+            outputs.append(output)
+            print("  {:25s} {:6d} pads {:10.2f} ms".format(name, pads, seconds * 1000))
+
+        print("  output {}".format("equal" if outputs[0] == outputs[1] else "DIFFERENT"))
+
+
+if __name__ == '__main__':
+    run()
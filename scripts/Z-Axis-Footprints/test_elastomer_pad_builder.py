@@ -0,0 +1,94 @@
+# Tests of ElastomerPadBuilder and ElastomerPadsRouted, they are not part of the KicadModTree unit tests
+#
+# usage: cd scripts/Z-Axis-Footprints && python -m unittest test_elastomer_pad_builder
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "../.."))
+
+from KicadModTree import *  # NOQA
+from ElastomerPadBuilder import ElastomerPadBuilder  # NOQA
+from ElastomerPadsRouted import ElastomerPadsRouted  # NOQA
+
+
+def aldecPads():
+    # aldec_pads of Driver.py
+    return (ElastomerPadBuilder("aldec-zwrap-pads")
+            .withNumPads(52)
+            .withNumCols(6)
+            .withPitchX(0.019685039)
+            .withPitchY(0.17716535)
+            .withPadWidth(0.0137795)
+            .withPadHeight(0.094488)
+            .withCutGapPart(0.03937)
+            .withOffsetForCutLineY(0.031496)
+            .withCutPadHeight(0.008)
+            .withCutPadWidth(0.16)
+            .withBlankSize(0.334646)
+            .withNumGroups(3)
+            .build())
+
+
+def sharedColumnPads():
+    # no cut gap: the first column of a group is the last column of the previous one
+    return (ElastomerPadBuilder("shared-column-pads")
+            .withNumPads(4)
+            .withNumCols(5)
+            .withPitchX(0.01)
+            .withPitchY(0.1)
+            .withPadWidth(0.004)
+            .withPadHeight(0.05)
+            .withNumGroups(3)
+            .build())
+
+
+class ElastomerPadBuilderTests(unittest.TestCase):
+
+    def assertBounds(self, builder):
+        numbers = [n for n, _, _ in builder.pad_positions]
+        xs = [x for _, x, _ in builder.pad_positions]
+        ys = [y for _, _, y in builder.pad_positions]
+
+        self.assertEqual(builder.pad_bounds, (min(xs), min(ys), max(xs), max(ys)))
+        self.assertEqual(builder.next_pad_number, max(numbers) + 1)
+
+        # the edge cuts are the outermost lines of the footprint
+        builder.addEdgeCuts(clearanceX=7.5, clearanceY=3.5)
+        outline = builder.kicad_mod.calculateBoundingBox()
+        min_x, min_y, max_x, max_y = builder.pad_bounds
+        self.assertAlmostEqual(outline['min']['x'], min_x - 7.5)
+        self.assertAlmostEqual(outline['min']['y'], min_y - 3.5)
+        self.assertAlmostEqual(outline['max']['x'], max_x + 7.5)
+        self.assertAlmostEqual(outline['max']['y'], max_y + 3.5)
+
+    def testBounds(self):
+        for example in (aldecPads, sharedColumnPads):
+            builder = example()
+            self.assertIsNone(builder.pad_bounds)
+            self.assertEqual(builder.next_pad_number, 1)
+
+            builder.createPads()
+            builder.connectPads(trace_width=0.0137795)
+            self.assertBounds(builder)
+
+    def testCutLinesWrap(self):
+        builder = aldecPads()
+        builder.createPads()
+        builder.makeCutLinesWrap()
+
+        min_x, _, max_x, _ = builder.pad_bounds
+        cut_pads = [node for node in builder.kicad_mod.getNormalChilds() if isinstance(node, Pad)]
+        self.assertEqual(len(cut_pads), 2 * 4)
+        self.assertEqual(cut_pads[0].number, 52 * 6 * 3 + 1)
+        self.assertAlmostEqual(cut_pads[0].at.x, min_x - builder.cutPadWidth)
+        self.assertAlmostEqual(cut_pads[1].at.x, max_x + builder.cutPadWidth)
+
+    def testElastomerPadsRouted(self):
+        routed = ElastomerPadsRouted("routed-pads")
+        self.assertIsNone(routed.pad_bounds)
+
+        routed.createPads(numPads=10, numCols=5, pitchX=0.008, pitchY=0.275, padWidth=0.004, padHeight=0.15,
+                          cutGapPart=0.025591, numGroups=5)
+        self.assertBounds(routed)
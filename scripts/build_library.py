@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+
+'''
+kicad-footprint-generator is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+kicad-footprint-generator is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with kicad-footprint-generator. If not, see < http://www.gnu.org/licenses/ >.
+'''
+
+# Run all footprint generators listed in build_manifest.yaml.
+#
+# Every generator is started as its own python process inside of its working directory, so the relative
+# configuration paths of the generators keep working. Generators which share a working directory are run one
+# after another (they write into the same .pretty folders), different working directories are built in parallel.
+#
+# usage: python3 build_library.py [--jobs N] [--only PATTERN ...] [--list] [--summary summary.json] [--yaml_cache DIR]
+
+import argparse
+import fnmatch
+import glob
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+import yaml
+
+SCRIPTS_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+DEFAULT_MANIFEST = os.path.join(SCRIPTS_DIR, 'build_manifest.yaml')
+
+sys.path.append(os.path.join(SCRIPTS_DIR, 'tools'))
+from config_loader import CACHE_DIRECTORY_ENVIRONMENT
+
+# number of output lines which are shown for a failing generator
+ERROR_OUTPUT_LINES = 20
+
+
+class Generator(object):
+    def __init__(self, name, directory, script, args):
+        self.name = name
+        self.directory = directory
+        self.script = script
+        self.args = args
+
+    def command(self):
+        return [sys.executable, self.script] + self.args
+
+
+def _expandArgs(directory, args, exclude):
+    expanded = []
+    for arg in args:
+        if glob.has_magic(arg):
+            # patterns without a match are dropped
+            matches = sorted(glob.glob(os.path.join(directory, arg), recursive=True))
+            matches = [os.path.relpath(m, directory) for m in matches]
+            expanded.extend(m for m in matches if not any(fnmatch.fnmatch(m, e) for e in exclude))
+        else:
+            expanded.append(arg)
+    return expanded
+
+
+def loadManifest(manifest_file):
+    r"""Load all generators of a manifest file
+
+    Script patterns are expanded into one generator per matching script.
+
+    :param manifest_file: path of the manifest
+    :return: list of generators in manifest order
+    """
+    with open(manifest_file, 'r') as manifest_stream:
+        manifest = yaml.safe_load(manifest_stream)
+
+    manifest_dir = os.path.dirname(os.path.realpath(manifest_file))
+    generators = []
+    for entry in manifest['generators']:
+        directory = os.path.join(manifest_dir, entry['directory'])
+        if not os.path.isdir(directory):
+            raise ValueError("working directory of generator '{}' does not exist: {}"
+                             .format(entry['name'], directory))
+
+        scripts = sorted(glob.glob(os.path.join(directory, entry['script'])))
+        scripts = [os.path.basename(s) for s in scripts]
+        scripts = [s for s in scripts if not any(fnmatch.fnmatch(s, e) for e in entry.get('exclude', []))]
+        if not scripts:
+            raise ValueError("no script found for generator '{}' ({})".format(entry['name'], entry['script']))
+
+        args = _expandArgs(directory, entry.get('args', []), entry.get('exclude_args', []))
+        for script in scripts:
+            name = entry['name'].replace('*', os.path.splitext(script)[0])
+            if any(g.name == name for g in generators):
+                raise ValueError("generator name '{}' is not unique".format(name))
+            generators.append(Generator(name, directory, script, args))
+
+    return generators
+
+
+def _footprintFiles(directory):
+    files = {}
+    for path, _, filenames in os.walk(directory):
+        for filename in filenames:
+            if filename.endswith('.kicad_mod'):
+                filepath = os.path.join(path, filename)
+                files[filepath] = os.stat(filepath).st_mtime
+    return files
+
+
+def runGenerator(generator):
+    r"""Run a single generator inside of its working directory
+
+    :return: dict with name, status, seconds, footprints (number of written files) and output
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([ROOT_DIR] + [p for p in [env.get('PYTHONPATH')] if p])
+
+    files_before = _footprintFiles(generator.directory)
+    start_time = time.time()
+    process = subprocess.run(generator.command(), cwd=generator.directory, env=env,
+                             stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+    seconds = time.time() - start_time
+    files_after = _footprintFiles(generator.directory)
+
+    written = [f for f, mtime in files_after.items() if files_before.get(f) != mtime]
+
+    return {
+        'name': generator.name,
+        'directory': os.path.relpath(generator.directory, SCRIPTS_DIR),
+        'status': 'ok' if process.returncode == 0 else 'failed',
+        'returncode': process.returncode,
+        'seconds': seconds,
+        'footprints': len(written),
+        'output': process.stdout
+    }
+
+
+def runGeneratorGroup(generators):
+    return [runGenerator(g) for g in generators]
+
+
+def groupByDirectory(generators):
+    groups = {}
+    for generator in generators:
+        groups.setdefault(generator.directory, []).append(generator)
+    return list(groups.values())
+
+
+def buildLibrary(generators, jobs=None):
+    r"""Run all given generators, parallel over the working directories
+
+    :return: results in the order of the given generators
+    """
+    groups = groupByDirectory(generators)
+    jobs = min(jobs or multiprocessing.cpu_count(), len(groups)) or 1
+
+    results = {}
+    if jobs == 1:
+        group_results = map(runGeneratorGroup, groups)
+    else:
+        pool = multiprocessing.Pool(jobs)
+        group_results = pool.imap_unordered(runGeneratorGroup, groups)
+
+    for group_result in group_results:
+        for result in group_result:
+            print("{status:6s} {name} ({footprints} footprints, {seconds:.1f}s)".format(**result))
+            sys.stdout.flush()
+            results[result['name']] = result
+
+    if jobs != 1:
+        pool.close()
+        pool.join()
+
+    return [results[g.name] for g in generators]
+
+
+def printSummary(results, seconds):
+    name_width = max([len(r['name']) for r in results] + [len('generator')])
+    print()
+    print("{:{w}s} {:>8s} {:>10s}  {}".format('generator', 'time [s]', 'footprints', 'status', w=name_width))
+    for result in results:
+        print("{name:{w}s} {seconds:8.1f} {footprints:10d}  {status}".format(w=name_width, **result))
+
+    failed = [r for r in results if r['status'] != 'ok']
+    print()
+    print("{} footprints written by {} generators in {:.1f}s, {} failed"
+          .format(sum(r['footprints'] for r in results), len(results), seconds, len(failed)))
+
+    for result in failed:
+        print()
+        print("---- {} (exit code {}) ----".format(result['name'], result['returncode']))
+        print('\n'.join(result['output'].splitlines()[-ERROR_OUTPUT_LINES:]))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the footprint library by running all generators of a manifest.')
+    parser.add_argument('--manifest', type=str, default=DEFAULT_MANIFEST,
+                        help='manifest file listing the generators (default: build_manifest.yaml)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='number of generators running in parallel (default: number of cpu cores)')
+    parser.add_argument('--only', type=str, nargs='+', metavar='PATTERN',
+                        help='only run generators whose name matches one of the given glob patterns')
+    parser.add_argument('--list', action='store_true', help='list the generators and exit')
+    parser.add_argument('--summary', type=str, help='write the results as json into the given file')
+    parser.add_argument('--yaml_cache', type=str, metavar='DIR',
+                        help='keep the parsed yaml configuration files in this directory for the following builds')
+    args = parser.parse_args()
+
+    if args.yaml_cache:
+        # inherited by all generator processes, see tools/config_loader.py
+        os.environ[CACHE_DIRECTORY_ENVIRONMENT] = os.path.abspath(args.yaml_cache)
+
+    generators = loadManifest(args.manifest)
+    if args.only:
+        generators = [g for g in generators if any(fnmatch.fnmatch(g.name, p) for p in args.only)]
+
+    if args.list:
+        for generator in generators:
+            print("{:45s} {}".format(generator.name, ' '.join(
+                [os.path.join(os.path.relpath(generator.directory, SCRIPTS_DIR), generator.script)] + generator.args)))
+        sys.exit(0)
+
+    start_time = time.time()
+    results = buildLibrary(generators, args.jobs)
+    printSummary(results, time.time() - start_time)
+
+    if args.summary:
+        with open(args.summary, 'w') as summary_stream:
+            json.dump([{k: v for k, v in r.items() if k != 'output'} for r in results], summary_stream, indent=2)
+
+    sys.exit(1 if any(r['status'] != 'ok' for r in results) else 0)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+'''
+Compare the dependency ordered dictInherit of dict_tools.py against the previous recursive
+implementation on families built from the largest size_definitions files.
+
+Every device of a file is stored as the difference to another device of the file:
+
+ * flat: all devices inherit from the first one (one level of inheritance)
+ * chain: every device inherits from the previous one (the last device has as many ancestors as the file has devices)
+ * reversed: every device inherits from the next one (children are listed before their parents)
+
+usage: python scripts/tools/bench_dict_inherit.py
+'''
+
+import collections.abc
+import copy
+import os
+import time
+
+import yaml
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..")
+
+from dict_tools import dictMerge, dictInherit  # NOQA
+
+SIZE_DEFINITIONS = ["Packages/Package_NoLead__DFN_QFN_LGA_SON/size_definitions/dfn.yaml",
+                    "Packages/Package_NoLead__DFN_QFN_LGA_SON/size_definitions/lfcsp.yaml",
+                    "Packages/Package_Gullwing__QFP_SOIC_SO/size_definitions/soic.yaml",
+                    "Packages/Package_Gullwing__QFP_SOIC_SO/size_definitions/tssop.yaml",
+                    "Packages/Package_Gullwing__QFP_SOIC_SO/size_definitions/lqfp.yaml"]
+
+
+def legacy_dictInherit(d):
+    # implementation before the dependency ordered resolver (used as reference)
+    def dictInherit(d, child, parent):
+        if 'inherit' not in parent:
+            del child['inherit']
+            p = copy.deepcopy(parent)
+            return dictMerge(p, child)
+        elif d[parent['inherit']] is child:
+            raise RecursionError
+        else:
+            return dictInherit(d, parent, d[parent['inherit']])
+
+    for (k, v) in d.items():
+        if isinstance(v, collections.abc.Mapping) and 'inherit' in v:
+            d[k] = dictInherit(d, v, d[v['inherit']])
+
+
+def merged(a, b):
+    result = copy.deepcopy(a)
+    for k, v in b.items():
+        result[k] = merged(result[k] if isinstance(result.get(k), dict) else {}, v) if isinstance(v, dict) else v
+    return result
+
+
+def expected_dictInherit(d):
+    # straightforward resolution, every entry merges a copy of its resolved parent
+    def resolve(key):
+        entry = d[key]
+        if 'inherit' not in entry:
+            return entry
+        return merged(resolve(entry['inherit']), {k: v for k, v in entry.items() if k != 'inherit'})
+
+    return {key: resolve(key) for key in d}
+
+
+def difference(parent, child):
+    diff = {}
+    for k, v in child.items():
+        if isinstance(v, dict) and isinstance(parent.get(k), dict):
+            sub = difference(parent[k], v)
+            if sub:
+                diff[k] = sub
+        elif parent.get(k, diff) != v:
+            diff[k] = v
+    return diff
+
+
+def createFamily(devices, shape):
+    names = list(devices)
+    if shape == 'reversed':
+        names.reverse()
+
+    family = {names[0]: devices[names[0]]}
+    for previous, name in zip(names, names[1:]):
+        parent = names[0] if shape == 'flat' else previous
+        family[name] = difference(devices[parent], devices[name])
+        family[name]['inherit'] = parent
+
+    return {name: family[name] for name in devices}
+
+
+def timeResolver(resolver, family, repeat):
+    best = None
+    for _ in range(repeat):
+        d = copy.deepcopy(family)
+        start = time.time()
+        resolver(d)
+        seconds = time.time() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, d
+
+
+def loadDevices(filename):
+    with open(os.path.join(SCRIPTS_DIR, filename)) as f:
+        return {k: v for k, v in yaml.safe_load(f).items() if isinstance(v, dict)}
+
+
+def run(repeat=5):
+    families = [(os.path.basename(filename), loadDevices(filename)) for filename in SIZE_DEFINITIONS]
+    families.append(("all files", {k: v for _, devices in families for k, v in devices.items()}))
+
+    for name, devices in families:
+        print("{} ({} devices):".format(name, len(devices)))
+        for shape in ('flat', 'chain', 'reversed'):
+            family = createFamily(devices, shape)
+            expected = expected_dictInherit(family)
+
+            for resolver_name, resolver in (("recursive + deepcopy (before)", legacy_dictInherit),
+                                            ("dependency ordered (dictInherit)", dictInherit)):
+                try:
+                    seconds, result = timeResolver(resolver, family, repeat)
+                    status = "ok" if result == expected else "WRONG RESULT"
+                except (RecursionError, TypeError) as e:
+                    seconds, status = 0, "{}: {}".format(type(e).__name__, e)
+                print("  {:8s} {:35s} {:8.2f} ms  {}".format(shape, resolver_name, seconds * 1000, status))
+
+
+if __name__ == '__main__':
+    run()
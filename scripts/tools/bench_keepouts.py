@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+'''
+Compare the silkscreen trimming of drawing_tools.py for round pads approximated by rectangles
+(addKeepoutRound) against exact oval keepouts (addKeepoutOval), with and without a KeepoutIndex.
+
+The silkscreen of the 40 pin THT parts consists of a body outline close to the pads, a line between every pin
+and a circle around every pin.
+
+usage: python scripts/tools/bench_keepouts.py
+'''
+
+import math
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "../.."))
+
+from KicadModTree import *  # NOQA
+from drawing_tools import addKeepoutRound, addKeepoutOval, KeepoutIndex, addRectWithKeepout, \
+    addVLineWithKeepout, addCircleWithKeepout  # NOQA
+
+PITCH = 2.54
+PAD_SIZE = 1.7
+SILK_CLEARANCE = 0.32
+SILK_WIDTH = 0.12
+
+PARTS = [(1, 40), (2, 20)]
+
+
+def padPositions(rows, pins_per_row):
+    return [(c * PITCH, r * PITCH) for r in range(rows) for c in range(pins_per_row)]
+
+
+def createKeepouts(pads, keepout_type, indexed):
+    keepouts = KeepoutIndex() if indexed else []
+    for x, y in pads:
+        keepouts = keepouts + keepout_type(x, y, PAD_SIZE + 2 * SILK_CLEARANCE, PAD_SIZE + 2 * SILK_CLEARANCE)
+    return keepouts
+
+
+def drawSilk(rows, pins_per_row, keepout_type, indexed):
+    pads = padPositions(rows, pins_per_row)
+    keepouts = createKeepouts(pads, keepout_type, indexed)
+
+    kicad_mod = Footprint("benchmark_keepouts")
+    w = (pins_per_row - 1) * PITCH
+    h = (rows - 1) * PITCH
+    addRectWithKeepout(kicad_mod, -PITCH / 2 + 0.3, -1.2, w + PITCH - 0.6, h + 2.4, 'F.SilkS', SILK_WIDTH, keepouts)
+    for c in range(pins_per_row):
+        addVLineWithKeepout(kicad_mod, c * PITCH + PITCH / 4, -1.2, h + 1.2, 'F.SilkS', SILK_WIDTH, keepouts)
+    for x, y in pads:
+        addCircleWithKeepout(kicad_mod, x + 0.7, y, 0.7, 'F.SilkS', SILK_WIDTH, keepouts)
+    return kicad_mod
+
+
+def lineInsidePad(rows, pins_per_row, kicad_mod):
+    # check the middle of every straight silk line against the real (round) pad outline
+    keepout_radius = PAD_SIZE / 2 + SILK_CLEARANCE - 1e-6
+    for node in kicad_mod.getNormalChilds():
+        if isinstance(node, Line):
+            mx = (node.start_pos.x + node.end_pos.x) / 2
+            my = (node.start_pos.y + node.end_pos.y) / 2
+            for x, y in padPositions(rows, pins_per_row):
+                if math.hypot(mx - x, my - y) < keepout_radius:
+                    return True
+    return False
+
+
+def run(repeat=3):
+    for rows, pins_per_row in PARTS:
+        for keepout_type in (addKeepoutRound, addKeepoutOval):
+            kicad_mod = drawSilk(rows, pins_per_row, keepout_type, True)
+            assert not lineInsidePad(rows, pins_per_row, kicad_mod), "silkscreen line inside of a pad keepout"
+
+        print("{}x{} pins, pitch {} mm:".format(rows, pins_per_row, PITCH))
+        t_reference = None
+        for name, keepout_type, indexed in (("rectangles (addKeepoutRound)", addKeepoutRound, False),
+                                            ("rectangles + KeepoutIndex", addKeepoutRound, True),
+                                            ("ovals (addKeepoutOval)", addKeepoutOval, False),
+                                            ("ovals + KeepoutIndex", addKeepoutOval, True)):
+            keepouts = len(createKeepouts(padPositions(rows, pins_per_row), keepout_type, indexed))
+            t = min(timeit.repeat(lambda: drawSilk(rows, pins_per_row, keepout_type, indexed),
+                                  number=1, repeat=repeat))
+            t_reference = t_reference or t
+            print("  {:30s} {:5d} keepouts {:8.2f} ms ({:.2f}x)".format(name, keepouts, t*1000, t_reference/t))
+
+
+if __name__ == '__main__':
+    run()
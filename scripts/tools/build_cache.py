@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+
+# Content addressed cache for incremental footprint generation
+#
+# A footprint only has to be generated again if one of its inputs changed. The inputs are the resolved
+# parameter set, the configuration, additional documents (like the ipc definitions) and the source code
+# of the generator itself (including KicadModTree and all helper modules of this repository).
+#
+# The cache stores for every parameter set the hash of its inputs and the hash of every file written for it.
+# A parameter set is up to date if the input hash is unchanged and all output files still exist unmodified.
+#
+# Usage inside of a generator:
+#
+#   cache = BuildCache('.build_cache.json')
+#   key = cache.inputKey(device_params, header, configuration, fileHash(ipc_doc_file))
+#   if not cache.isUpToDate(job_id, key):
+#       files = generate(device_params)
+#       cache.update(job_id, key, files)
+#   cache.save()
+
+import hashlib
+import json
+import os
+import sys
+
+REPOSITORY_ROOT = os.path.realpath(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..'))
+
+DEFAULT_CACHE_FILE = '.build_cache.json'
+
+# increment to invalidate all existing caches (for example when the cache format changes)
+CACHE_VERSION = 1
+
+
+def fileHash(filename):
+    """Calculate the hash of the content of a file
+
+    Parameters
+    ----------
+    filename : str
+        path of the file
+
+    Returns
+    -------
+    hex digest of the file content (None if the file does not exist)
+    """
+    if not os.path.isfile(filename):
+        return None
+
+    hasher = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        hasher.update(f.read())
+    return hasher.hexdigest()
+
+
+def sourceHash(root=REPOSITORY_ROOT):
+    """Hash the source code of all loaded modules which belong to the repository
+
+    This covers the generator script, KicadModTree and all helper modules of the tools directory
+    which were imported by the generator.
+
+    Parameters
+    ----------
+    root : str
+        only modules below this directory are considered (default: repository root)
+
+    Returns
+    -------
+    hex digest over the content of all source files
+    """
+    sources = set()
+    for module in list(sys.modules.values()):
+        filename = getattr(module, '__file__', None)
+        if not filename:
+            continue
+        filename = os.path.realpath(filename)
+        if filename.endswith('.pyc'):
+            filename = filename[:-1]
+        if filename.startswith(root) and filename.endswith('.py'):
+            sources.add(filename)
+
+    hasher = hashlib.sha1()
+    for filename in sorted(sources):
+        hasher.update(os.path.relpath(filename, root).encode('utf-8'))
+        hasher.update((fileHash(filename) or '').encode('utf-8'))
+    return hasher.hexdigest()
+
+
+class BuildCache(object):
+    """Remembers which parameter sets were generated with which inputs
+
+    Parameters
+    ----------
+    cache_file : str
+        file the cache is stored in (json)
+    enabled : bool
+        if False, every parameter set is reported as outdated (forces a full rebuild)
+    """
+
+    def __init__(self, cache_file=DEFAULT_CACHE_FILE, enabled=True):
+        self.cache_file = cache_file
+        self.enabled = enabled
+        self.entries = {}
+        self._source_hash = None
+
+        if os.path.isfile(cache_file):
+            try:
+                with open(cache_file, 'r') as cache_stream:
+                    content = json.load(cache_stream)
+                if content.get('version') == CACHE_VERSION:
+                    self.entries = content.get('entries', {})
+            except ValueError:
+                # a corrupt cache only means we have to build everything again
+                self.entries = {}
+
+    def inputKey(self, *inputs):
+        """Calculate the key of a parameter set
+
+        The hash of the generator sources is always part of the key.
+
+        Parameters
+        ----------
+        inputs :
+            everything which influences the output (must be serializable as json, other values use str())
+
+        Returns
+        -------
+        hex digest of all inputs
+        """
+        if self._source_hash is None:
+            self._source_hash = sourceHash()
+
+        serialized = json.dumps([self._source_hash] + list(inputs), sort_keys=True, default=str)
+        return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+
+    def isUpToDate(self, job_id, key):
+        """Check if the outputs of a parameter set can be reused
+
+        Parameters
+        ----------
+        job_id : str
+            unique identifier of the parameter set (like "<definition file>:<parameter set name>")
+        key : str
+            key of the current inputs, see inputKey
+
+        Returns
+        -------
+        True if the inputs did not change and all output files are still unchanged
+        """
+        if not self.enabled:
+            return False
+
+        entry = self.entries.get(job_id)
+        if entry is None or entry['key'] != key:
+            return False
+
+        return all(fileHash(filename) == digest for filename, digest in entry['outputs'].items())
+
+    def update(self, job_id, key, output_files):
+        """Store the inputs and the written files of a parameter set
+
+        Parameters
+        ----------
+        job_id : str
+            unique identifier of the parameter set
+        key : str
+            key of the inputs, see inputKey
+        output_files : list of str
+            files which were written for this parameter set
+        """
+        self.entries[job_id] = {
+            'key': key,
+            'outputs': {filename: fileHash(filename) for filename in output_files}
+        }
+
+    def save(self):
+        """Write the cache file"""
+        with open(self.cache_file, 'w') as cache_stream:
+            json.dump({'version': CACHE_VERSION, 'entries': self.entries}, cache_stream, indent=1, sort_keys=True)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+
+# Shared loader for the yaml files used by the generators
+#
+# The same configuration files (config_KLCv3.0.yaml, the series configs, ipc_definitions.yaml, ...) are read by
+# nearly every generator, some of them several times per run. This module
+#
+# - parses with the C implementation of the yaml loader (LibYAML) if it is available,
+# - keeps every parsed document in memory, keyed by its path and the modification time of the file,
+# - optionally stores the parsed documents as pickle files in a cache directory, which is reused by the following
+#   runs (enabled with setCacheDirectory() or the environment variable KICAD_FOOTPRINT_YAML_CACHE).
+#
+# Every call of loadYaml returns an independent copy, so a generator can modify its configuration without
+# affecting other footprints. Documents which are only read can be loaded with frozen=True instead, which returns
+# a shared read-only view without copying. copy.copy() and copy.deepcopy() of a frozen document return a plain,
+# modifiable dict or list.
+#
+# Usage:
+#
+#   configuration = loadYaml(args.global_config)
+#   configuration.update(loadYaml(args.series_config))
+#   ipc_definitions = loadYaml(ipc_doc_file, frozen=True)
+
+import hashlib
+import os
+import pickle
+from copy import deepcopy
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+CACHE_DIRECTORY_ENVIRONMENT = 'KICAD_FOOTPRINT_YAML_CACHE'
+
+# increment to invalidate all existing cache files (for example when the cache format changes)
+CACHE_VERSION = 1
+
+_cache_directory = os.environ.get(CACHE_DIRECTORY_ENVIRONMENT) or None
+
+# realpath -> _Document
+_documents = {}
+
+
+class FrozenDict(dict):
+    """Read-only dict, every modification raises a TypeError. Copies are plain dicts"""
+
+    def _readOnly(self, *args, **kwargs):
+        raise TypeError("configuration loaded with frozen=True can not be modified")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _readOnly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(dict(self), memo)
+
+
+class FrozenList(list):
+    """Read-only list, every modification raises a TypeError. Copies are plain lists"""
+
+    def _readOnly(self, *args, **kwargs):
+        raise TypeError("configuration loaded with frozen=True can not be modified")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = append = extend = insert = pop = remove = reverse = sort = \
+        _readOnly
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(list(self), memo)
+
+
+def freeze(value):
+    """Convert a parsed yaml document into a read-only version of itself
+
+    Parameters
+    ----------
+    value :
+        document as returned by the yaml loader
+
+    Returns
+    -------
+    the same document with all dicts replaced by FrozenDict and all lists replaced by FrozenList
+    """
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+class _Document(object):
+    def __init__(self, stamp, data):
+        self.stamp = stamp
+        self.data = data
+        self.frozen = None
+
+
+def setCacheDirectory(directory):
+    """Store the parsed documents in a directory, to be reused by later runs
+
+    Parameters
+    ----------
+    directory : str
+        directory of the pickle files (created if missing), None disables the persistent cache
+    """
+    global _cache_directory
+    _cache_directory = directory
+
+
+def clearCache():
+    """Forget all documents kept in memory (the cache directory is not touched)"""
+    _documents.clear()
+
+
+def _cacheFile(path):
+    return os.path.join(_cache_directory, hashlib.sha1(path.encode('utf-8')).hexdigest() + '.pickle')
+
+
+def _readCacheFile(path, stamp):
+    try:
+        with open(_cacheFile(path), 'rb') as cache_stream:
+            version, cached_path, cached_stamp, data = pickle.load(cache_stream)
+    except Exception:
+        # missing, corrupt or written by an incompatible python version
+        return None
+
+    if version != CACHE_VERSION or cached_path != path or cached_stamp != stamp:
+        return None
+    return data
+
+
+def _writeCacheFile(path, stamp, data):
+    if not os.path.isdir(_cache_directory):
+        os.makedirs(_cache_directory)
+
+    # write to a temporary file first, generators running in parallel could read the cache file at the same time
+    cache_file = _cacheFile(path)
+    temp_file = '{}.{}.tmp'.format(cache_file, os.getpid())
+    with open(temp_file, 'wb') as cache_stream:
+        pickle.dump((CACHE_VERSION, path, stamp, data), cache_stream, pickle.HIGHEST_PROTOCOL)
+    getattr(os, 'replace', os.rename)(temp_file, cache_file)
+
+
+def _parse(path, stamp):
+    data = _readCacheFile(path, stamp) if _cache_directory else None
+    if data is None:
+        with open(path, 'r') as yaml_stream:
+            document = yaml.load(yaml_stream, Loader=SafeLoader)
+        data = pickle.dumps(document, pickle.HIGHEST_PROTOCOL)
+        if _cache_directory:
+            _writeCacheFile(path, stamp, data)
+    return data
+
+
+def loadYaml(filename, frozen=False):
+    """Load a yaml file, parsing it only if it was not loaded before or changed since then
+
+    Parameters
+    ----------
+    filename : str
+        path of the yaml file
+    frozen : bool
+        return a shared, read-only view (FrozenDict/FrozenList) instead of a copy
+
+    Returns
+    -------
+    content of the yaml file
+
+    Raises
+    ------
+    yaml.YAMLError if the file is not valid yaml
+    """
+    path = os.path.realpath(filename)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime, stat.st_size)
+
+    document = _documents.get(path)
+    if document is None or document.stamp != stamp:
+        document = _Document(stamp, _parse(path, stamp))
+        _documents[path] = document
+
+    if frozen:
+        if document.frozen is None:
+            document.frozen = freeze(pickle.loads(document.data))
+        return document.frozen
+
+    # unpickling is much faster than parsing and gives every caller its own copy
+    return pickle.loads(document.data)
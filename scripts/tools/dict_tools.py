@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 
 import collections.abc
-import copy
 
 def dictMerge(a, b):
     """Recursively merges the contents of two dict objects
@@ -37,6 +36,35 @@ def dictMerge(a, b):
             a[k] = v
     return a
 
+def _mergeShared(base, override):
+    # like dictMerge(copy.deepcopy(base), override), but only the dicts on the
+    # path to an overridden value are copied, everything else is shared
+    result = dict(base)
+    for (k, v) in override.items():
+        if isinstance(v, collections.abc.Mapping) and k in result:
+            parent = result[k]
+            result[k] = _mergeShared(parent if isinstance(parent, collections.abc.Mapping) else {}, v)
+        else:
+            result[k] = v
+    return result
+
+def _inheritanceChain(d, key, resolved):
+    # keys from `key` up to (excluding) the first ancestor which is resolved or
+    # does not inherit anything, followed by that ancestor
+    chain = []
+    while key not in resolved:
+        v = d[key]
+        if not isinstance(v, collections.abc.Mapping) or 'inherit' not in v:
+            break
+        if key in chain:
+            cycle = chain[chain.index(key):] + [key]
+            raise RecursionError("inheritance cycle: {}".format(" -> ".join(str(k) for k in cycle)))
+        chain.append(key)
+        if v['inherit'] not in d:
+            raise KeyError("'{}' inherits from '{}', which does not exist".format(key, v['inherit']))
+        key = v['inherit']
+    return chain, key
+
 def dictInherit(d):
     """Recursively merges dictionaries within a hierarchy using 'inherit' entries
     
@@ -46,10 +74,14 @@ def dictInherit(d):
     object within the namespace.
     
     Inheritance is done recursively, so it is possible to have multiple levels
-    of inheritance (object c can inherit b, which itself inherits from a). When
-    this function is executed, it iterates through every entry in `d` and runs
-    dictMerge() until all of the 'inherit' entries have been resolved. The 
-    result is applied to `d` in-place.
+    of inheritance (object c can inherit b, which itself inherits from a). The
+    entries are resolved in dependency order, every entry is merged exactly once
+    and its result is reused by all of its children. The result is applied to
+    `d` in-place.
+    
+    Resolved entries share all sub-dictionaries and values they do not
+    override with their parent, nothing is copied. Copy an entry before
+    modifying it if the other entries must not change.
     
     Parameters
     ----------
@@ -60,9 +92,12 @@ def dictInherit(d):
     Raises
     ------
     RecursionError
-        If two dictionaries attempt to inherit each other
+        If dictionaries inherit each other, the message contains the whole
+        cycle (like "a -> b -> c -> a")
     KeyError
         If a dictionary tries to inherit from a key that is not in `d`
+    TypeError
+        If a dictionary tries to inherit from an entry that is not a dictionary
     
     Notes
     -----
@@ -102,18 +137,18 @@ def dictInherit(d):
     }
     """
     
-    def dictInherit(d, child, parent):
-        if 'inherit' not in parent:
-            del child['inherit']
-            p = copy.deepcopy(parent)
-            return dictMerge(p, child)
-        elif d[parent['inherit']] is child:
-            raise RecursionError
-        else:
-            return dictInherit(d, parent, d[parent['inherit']])
-
-    for (k, v) in d.items():
-        if isinstance(v, collections.abc.Mapping) and 'inherit' in v:
-            d[k] = dictInherit(d, v, d[v['inherit']])
-        else:
+    resolved = {}
+    for key in d:
+        chain, ancestor = _inheritanceChain(d, key, resolved)
+        if not chain:
             continue
+        
+        base = resolved.get(ancestor, d[ancestor])
+        if not isinstance(base, collections.abc.Mapping):
+            raise TypeError("'{}' inherits from '{}', which is not a dictionary".format(chain[-1], ancestor))
+        
+        for k in reversed(chain):
+            base = _mergeShared(base, {ck: cv for (ck, cv) in d[k].items() if ck != 'inherit'})
+            resolved[k] = base
+    
+    d.update(resolved)
@@ -13,6 +13,7 @@ sys.path.append(os.path.join(sys.path[0], "..", ".."))  # load kicad_mod path
 
 from KicadModTree import *  # NOQA
 from footprint_global_properties import *
+from keepout_index import KeepoutIndex
 
 # tool function for generating 3D-scripts
 def script3d_writevariable(file, line, varname, value):
@@ -75,56 +76,112 @@ def addKeepoutRound(x, y, w, h):
             yysum = yysum + yy
         return res
 
+# returns a keepout which exactly follows the outline of a circular (w==h) or oval pad around (x,y)
+def addKeepoutOval(x, y, w, h):
+    return [OvalKeepout(x, y, w, h)]
+
+
+# keepout area with the shape of a circular or oval pad, lines are trimmed at the exact outline
+#
+# an oval is a straight segment along its longer axis, widened by the radius min(w,h)/2.
+# Indexing gives the bounding box like for the rectangle keepouts [x0,x1,y0,y1]
+class OvalKeepout(object):
+    def __init__(self, x, y, w, h):
+        self.x = x
+        self.y = y
+        self.radius = min(w, h) / 2.0
+        self.dx = w / 2.0 - self.radius
+        self.dy = h / 2.0 - self.radius
+        self.bounds = [x - w / 2.0, x + w / 2.0, y - h / 2.0, y + h / 2.0]
+
+    def __getitem__(self, i):
+        return self.bounds[i]
+
+    def __len__(self):
+        return 4
+
+    def __repr__(self):
+        return "OvalKeepout(x={}, y={}, w={}, h={})".format(self.x, self.y, self.bounds[1] - self.bounds[0],
+                                                              self.bounds[3] - self.bounds[2])
+
+    # part [x0,x1] of the horizontal line at y (yi=2), or [y0,y1] of the vertical line at x=y (yi=0),
+    # which lies inside of the keepout. None if the line does not touch the keepout
+    def span(self, y, yi):
+        if yi == 2:
+            center, along, d_line, d_along = self.y, self.x, self.dy, self.dx
+        else:
+            center, along, d_line, d_along = self.x, self.y, self.dx, self.dy
+        d = max(math.fabs(y - center) - d_line, 0)
+        if d > self.radius:
+            return None
+        half = d_along + math.sqrt(self.radius * self.radius - d * d)
+        return [along - half, along + half]
+
+    def contains(self, x, y):
+        ddx = max(math.fabs(x - self.x) - self.dx, 0)
+        ddy = max(math.fabs(y - self.y) - self.dy, 0)
+        return ddx * ddx + ddy * ddy <= self.radius * self.radius
+
 # internal method for keepout-processing
 def applyKeepouts(lines_in, y, xi, yi, keepouts):
     # print("  applyKeepouts(\n  lines_in=", lines_in, "  \n  y=", y, "   \n  xi=", xi, "   yi=", yi, "   \n  keepouts=", keepouts, ")")
     lines = lines_in
-    changes = True
-    while (changes):
-        changes = False
-        for ko in keepouts:
+    if len(lines) == 0:
+        return lines
+
+    # a KeepoutIndex only returns the keepouts touching the line (in their original order), all others can't split it
+    if isinstance(keepouts, KeepoutIndex):
+        x0 = min(l[0] for l in lines)
+        x1 = max(l[1] for l in lines)
+        if yi == 2:
+            keepouts = keepouts.intersectingHLine(y, x0, x1)
+        else:
+            keepouts = keepouts.intersectingVLine(y, x0, x1)
+
+    for ko in keepouts:
+        if isinstance(ko, OvalKeepout):
+            span = ko.span(y, yi)
+            if span is None:
+                continue
+            k0, k1 = span
+        else:
             ko = [min(ko[0], ko[1]), max(ko[0], ko[1]), min(ko[2], ko[3]), max(ko[2], ko[3])]
-            if (ko[yi + 0] <= y) and (y <= ko[yi + 1]):
-                # print("    INY: koy=", [ko[yi + 0], ko[yi + 1]], "  y=", y, "):             kox=", [ko[xi + 0], ko[xi + 1]])
-                for li in reversed(range(0, len(lines))):
-                    l = lines[li]
-                    if (l[0] >= ko[xi + 0]) and (l[0] <= ko[xi + 1]) and (l[1] >= ko[xi + 0]) and (
-                                l[1] <= ko[xi + 1]):  # Line completely inside -> remove
-                        lines.pop(li)
-                        # print("      H1: ko=", [ko[xi+0],ko[xi+1]], "  li=", li, "   l=", l, ")")
-                        changes = True
-                    elif (l[0] >= ko[xi + 0]) and (l[0] <= ko[xi + 1]) and (
-                                l[1] > ko[
-                                    xi + 1]):  # Line starts inside, but ends outside -> remove and add shortened
-                        lines.pop(li)
-                        lines.append([ko[xi + 1], l[1]])
-                        # print("      H2: ko=", [ko[xi+0],ko[xi+1]], "  li=", li, "   l=", l, "): ", [ko[xi+1], l[1]])
-                        changes = True
-                    elif (l[0] < ko[xi + 0]) and (l[1] <= ko[xi + 1]) and (
-                                l[1] >= ko[
-                                    xi + 0]):  # Line starts outside, but ends inside -> remove and add shortened
-                        lines.pop(li)
-                        lines.append([l[0], ko[xi + 0]])
-                        # print("      H3: ko=", [ko[xi+0],ko[xi+1]], "  li=", li, "   l=", l, "): ", [l[0], ko[xi+0]])
-                        changes = True
-                    elif (l[0] < ko[xi + 0]) and (
-                                l[1] > ko[
-                                    xi + 1]):  # Line starts outside, and ends outside -> remove and add 2 shortened
-                        lines.pop(li)
-                        lines.append([l[0], ko[xi + 0]])
-                        lines.append([ko[xi + 1], l[1]])
-                        # print("      H4: ko=", [ko[xi+0],ko[xi+1]], "  li=", li, "   l=", l, "): ", [l[0], ko[xi+0]], [ko[xi+1], l[1]])
-                        changes = True
-                        # else:
-                        # print("      USE: ko=", [ko[xi+0],ko[xi+1]], "  li=", li, "   l=", l, "): ")
-        if changes:
-            break
+            if not ((ko[yi + 0] <= y) and (y <= ko[yi + 1])):
+                continue
+            k0, k1 = ko[xi + 0], ko[xi + 1]
+
+        # print("    INY: y=", y, "):             kox=", [k0, k1])
+        for li in reversed(range(0, len(lines))):
+            l = lines[li]
+            if (l[0] >= k0) and (l[0] <= k1) and (l[1] >= k0) and (l[1] <= k1):  # Line completely inside -> remove
+                lines.pop(li)
+                # print("      H1: ko=", [k0,k1], "  li=", li, "   l=", l, ")")
+            elif (l[0] >= k0) and (l[0] <= k1) and (l[1] > k1):  # Line starts inside, but ends outside -> remove and add shortened
+                lines.pop(li)
+                lines.append([k1, l[1]])
+                # print("      H2: ko=", [k0,k1], "  li=", li, "   l=", l, "): ", [k1, l[1]])
+            elif (l[0] < k0) and (l[1] <= k1) and (l[1] >= k0):  # Line starts outside, but ends inside -> remove and add shortened
+                lines.pop(li)
+                lines.append([l[0], k0])
+                # print("      H3: ko=", [k0,k1], "  li=", li, "   l=", l, "): ", [l[0], k0])
+            elif (l[0] < k0) and (l[1] > k1):  # Line starts outside, and ends outside -> remove and add 2 shortened
+                lines.pop(li)
+                lines.append([l[0], k0])
+                lines.append([k1, l[1]])
+                # print("      H4: ko=", [k0,k1], "  li=", li, "   l=", l, "): ", [l[0], k0], [k1, l[1]])
 
     return lines
 
 # gives True if the given point (x,y) is contained in any keepout
 def containedInAnyKeepout(x,y, keepouts):
+    if isinstance(keepouts, KeepoutIndex):
+        keepouts = keepouts.containingPoint(x, y)
+
     for ko in keepouts:
+        if isinstance(ko, OvalKeepout):
+            if ko.contains(x, y):
+                return True
+            continue
         ko = [min(ko[0], ko[1]), max(ko[0], ko[1]), min(ko[2], ko[3]), max(ko[2], ko[3])]
         if x>=ko[0] and x<=ko[1] and y>=ko[2] and y<=ko[3]:
             #print("HIT!")
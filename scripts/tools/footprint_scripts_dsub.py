@@ -153,7 +153,7 @@ def makeDSubStraight(pins, isMale, HighDensity, rmx, rmy, pindrill, pad, mountin
     pad_shape1 = Pad.SHAPE_RECT 
     pad_shapeother = Pad.SHAPE_CIRCLE
     pad_layers = Pad.LAYERS_THT
-    keepouts=[];
+    keepouts=KeepoutIndex();
 
     
     
@@ -347,7 +347,7 @@ def makeDSubEdge(pins, isMale, rmx, pad, mountingdrill, mountingdistance, shield
     pad_layers_bot = ['B.Cu', 'B.Mask', 'B.Paste']
     slk_layers_top = 'F.SilkS'
     slk_layers_bot = 'B.SilkS'
-    keepouts=[];
+    keepouts=KeepoutIndex();
 
     
     
@@ -575,7 +575,7 @@ def makeDSubAngled(pins, isMale, HighDensity, rmx, rmy, pindrill, pad, pin_pcb_d
     pad_shape1 = Pad.SHAPE_RECT 
     pad_shapeother = Pad.SHAPE_CIRCLE
     pad_layers = Pad.LAYERS_THT
-    keepouts=[];
+    keepouts=KeepoutIndex();
 
     
     
@@ -128,7 +128,7 @@ def makeTerminalBlockStd(footprint_name, pins, rm, package_height, leftbottom_of
         pad_shape_extra = Pad.SHAPE_OVAL
 
     pad_layers = Pad.LAYERS_THT
-    keepouts=[];
+    keepouts=KeepoutIndex();
     for p in range(1, pins + 1):
         pextra=0
         if secondDrillPad[0]>0:
@@ -349,7 +349,7 @@ def makeTerminalBlockVertical(footprint_name, pins, rm, package_height, leftbott
         pad_shape_extra = Pad.SHAPE_OVAL
 
     pad_layers = Pad.LAYERS_THT
-    keepouts=[];
+    keepouts=KeepoutIndex();
 
     for p in range(1, pins + 1):
 
@@ -572,7 +572,7 @@ def makeTerminalBlock45Degree(footprint_name, pins, rm, package_height, leftbott
         pad_shape_extra = Pad.SHAPE_OVAL
 
     pad_layers = Pad.LAYERS_THT
-    keepouts=[];
+    keepouts=KeepoutIndex();
 
     for p in range(1, pins + 1):
         pextra=0
@@ -784,7 +784,7 @@ def makeScrewTerminalSingleStd(footprint_name, block_size, block_offset, pins, d
     pad_type = Pad.TYPE_THT
     pad_shapeother = Pad.SHAPE_CIRCLE
     pad_layers = Pad.LAYERS_THT
-    keepouts=[];
+    keepouts=KeepoutIndex();
     for p in pins:
         kicad_modg.append(Pad(number=1, type=pad_type, shape=pad_shapeother, at=p, size=pad, drill=ddrill, layers=pad_layers))
         keepouts=keepouts+addKeepoutRound(p[0], p[1], pad[0]+8*slk_offset, pad[0]+8*slk_offset)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+# Spatial index for keepout areas
+#
+# Silkscreen lines are trimmed against the keepout areas around pads. Every keepout used to be checked for every
+# line, which gets slow for footprints with many pins (a round pad alone is approximated by up to 32 rectangles).
+#
+# The keepouts are put into a uniform grid. A query only looks at the grid cells touched by the line or point and
+# returns the keepouts in the order they were added, so trimming gives exactly the same result as checking all of
+# them in sequence.
+#
+# Usage:
+#
+#   keepouts = KeepoutIndex()
+#   keepouts = keepouts + addKeepoutRect(x, y, w, h)  # works like a list of [x0, x1, y0, y1] rectangles
+#   for ko in keepouts.intersectingHLine(y, x0, x1):
+#       ...
+
+import math
+
+# smallest grid cell size, avoids huge grids for tiny keepouts
+MIN_CELL_SIZE = 0.01
+
+# up to this number of keepouts, checking all of them is faster than looking up the grid cells
+LINEAR_SCAN_LIMIT = 16
+
+# keepouts which would cover more cells than this are not put into the grid but checked on every query
+MAX_CELLS_PER_KEEPOUT = 64
+
+
+def normalizedBounds(keepout):
+    """Bounds of a keepout rectangle given as [x0, x1, y0, y1] (in any order)
+
+    Returns
+    -------
+    tuple (x_min, x_max, y_min, y_max)
+    """
+    return (min(keepout[0], keepout[1]), max(keepout[0], keepout[1]),
+            min(keepout[2], keepout[3]), max(keepout[2], keepout[3]))
+
+
+class KeepoutIndex(object):
+    """Collection of keepout areas which supports fast line and point queries
+
+    The index behaves like a list of keepouts (iteration, len, indexing, append and concatenation with lists)
+    and can be passed to all functions which accept a list of keepouts. The grid is built on the first query.
+
+    Parameters
+    ----------
+    keepouts : iterable
+        initial keepouts
+    bounds : function
+        returns the bounds (x_min, x_max, y_min, y_max) of a keepout,
+        default: keepouts are rectangles [x0, x1, y0, y1] like created by drawing_tools.addKeepoutRect
+    """
+
+    def __init__(self, keepouts=(), bounds=normalizedBounds):
+        self._keepouts = list(keepouts)
+        self._bounds_of = bounds
+        self._bounds = None
+        self._grid = None
+        self._large = None
+        self._cell_size = None
+
+    def __iter__(self):
+        return iter(self._keepouts)
+
+    def __len__(self):
+        return len(self._keepouts)
+
+    def __getitem__(self, item):
+        return self._keepouts[item]
+
+    def __add__(self, other):
+        return KeepoutIndex(self._keepouts + list(other), self._bounds_of)
+
+    def __radd__(self, other):
+        return KeepoutIndex(list(other) + self._keepouts, self._bounds_of)
+
+    def __repr__(self):
+        return "KeepoutIndex({})".format(self._keepouts)
+
+    def append(self, keepout):
+        self._keepouts.append(keepout)
+        if self._grid is not None:
+            self._insert(len(self._keepouts) - 1)
+
+    def extend(self, keepouts):
+        for keepout in keepouts:
+            self.append(keepout)
+
+    def _build(self):
+        self._bounds = []
+        self._grid = {}
+        self._large = []
+
+        sizes = sorted(max(b[1] - b[0], b[3] - b[2]) for b in map(self._bounds_of, self._keepouts))
+        self._cell_size = max(sizes[len(sizes) // 2], MIN_CELL_SIZE) if sizes else 1.0
+
+        for i in range(len(self._keepouts)):
+            self._insert(i)
+
+    def _cellRange(self, x0, x1, y0, y1):
+        size = self._cell_size
+        return (int(math.floor(x0 / size)), int(math.floor(x1 / size)),
+                int(math.floor(y0 / size)), int(math.floor(y1 / size)))
+
+    def _insert(self, i):
+        bounds = self._bounds_of(self._keepouts[i])
+        self._bounds.append(bounds)
+
+        cx0, cx1, cy0, cy1 = self._cellRange(*bounds)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > MAX_CELLS_PER_KEEPOUT:
+            self._large.append(i)
+            return
+
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self._grid.setdefault((cx, cy), []).append(i)
+
+    def intersecting(self, x0, x1, y0, y1, tolerance=0.0):
+        """All keepouts whose bounds intersect (or touch) a rectangle
+
+        Parameters
+        ----------
+        x0, x1, y0, y1 : float
+            rectangle to check (x0 <= x1, y0 <= y1), lines and points are rectangles with zero width or height
+        tolerance : float
+            the rectangle is enlarged by this value on each side
+
+        Returns
+        -------
+        list of keepouts in the order they were added
+        """
+        if self._grid is None:
+            self._build()
+
+        x0 -= tolerance
+        x1 += tolerance
+        y0 -= tolerance
+        y1 += tolerance
+
+        if len(self._keepouts) <= LINEAR_SCAN_LIMIT:
+            candidates = range(len(self._keepouts))
+        else:
+            candidates = set(self._large)
+            cx0, cx1, cy0, cy1 = self._cellRange(x0, x1, y0, y1)
+            if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._grid):
+                for (cx, cy), indices in self._grid.items():
+                    if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                        candidates.update(indices)
+            else:
+                for cx in range(cx0, cx1 + 1):
+                    for cy in range(cy0, cy1 + 1):
+                        candidates.update(self._grid.get((cx, cy), ()))
+            candidates = sorted(candidates)
+
+        result = []
+        for i in candidates:
+            bounds = self._bounds[i]
+            if bounds[0] <= x1 and bounds[1] >= x0 and bounds[2] <= y1 and bounds[3] >= y0:
+                result.append(self._keepouts[i])
+        return result
+
+    def intersectingHLine(self, y, x0, x1, tolerance=0.0):
+        """All keepouts whose bounds intersect (or touch) the horizontal line from (x0, y) to (x1, y)"""
+        return self.intersecting(min(x0, x1), max(x0, x1), y, y, tolerance)
+
+    def intersectingVLine(self, x, y0, y1, tolerance=0.0):
+        """All keepouts whose bounds intersect (or touch) the vertical line from (x, y0) to (x, y1)"""
+        return self.intersecting(x, x, min(y0, y1), max(y0, y1), tolerance)
+
+    def containingPoint(self, x, y, tolerance=0.0):
+        """All keepouts whose bounds contain the point (x, y)"""
+        return self.intersecting(x, x, y, y, tolerance)